@@ -0,0 +1,54 @@
+"""Default primary keys to UUIDv7
+
+Revision ID: 7c1f9e2a4b6d
+Revises: 4e9bb3ad94c2
+Create Date: 2026-10-17 10:12:41.508213
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c1f9e2a4b6d"
+down_revision: Union[str, None] = "4e9bb3ad94c2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The application generates UUIDv7 keys itself; existing uuid4 keys are kept
+# (see backend/lib/uuid7.py for where new keys land in their indexes).
+# The server default covers rows inserted outside the application.
+TABLES = ["user", "two_factor_auth", "forgot_password", "book_demo"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # UUIDv7 from a random UUID: overwrite the first 48 bits with the Unix
+    # time in ms and set the version nibble (variant bits are already 10)
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+        DECLARE
+            unix_ms bigint := floor(extract(epoch FROM clock_timestamp()) * 1000);
+            buf bytea := uuid_send(gen_random_uuid());
+        BEGIN
+            buf := overlay(buf PLACING substring(int8send(unix_ms) FROM 3)
+                           FROM 1 FOR 6);
+            buf := set_byte(buf, 6, (get_byte(buf, 6) & 15) | 112);
+            RETURN encode(buf, 'hex')::uuid;
+        END
+        $$ LANGUAGE plpgsql VOLATILE
+        """
+    )
+    for table in TABLES:
+        op.execute(
+            f'ALTER TABLE "{table}" ALTER COLUMN id SET DEFAULT uuid_generate_v7()'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.execute(f'ALTER TABLE "{table}" ALTER COLUMN id DROP DEFAULT')
+    op.execute("DROP FUNCTION IF EXISTS uuid_generate_v7()")
@@ -0,0 +1,55 @@
+"""Add indexes for maintenance cleanup
+
+Revision ID: 9d4e2b7f1a3c
+Revises: 7c1f9e2a4b6d
+Create Date: 2026-10-17 14:03:27.114902
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9d4e2b7f1a3c"
+down_revision: Union[str, None] = "7c1f9e2a4b6d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so large tables stay writable during the migration
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_forgot_password_expires_at"),
+            "forgot_password",
+            ["expires_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        # Ends with id so the admin listing of unverified users needs no sort
+        op.create_index(
+            "ix_user_unverified_created_at",
+            "user",
+            ["created_at", "id"],
+            unique=False,
+            postgresql_where=sa.text("signup_verified IS NULL"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_user_unverified_created_at",
+            table_name="user",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f("ix_forgot_password_expires_at"),
+            table_name="forgot_password",
+            postgresql_concurrently=True,
+        )
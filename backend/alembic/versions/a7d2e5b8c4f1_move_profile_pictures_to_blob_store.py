@@ -0,0 +1,146 @@
+"""Move profile pictures from the user row to the blob store
+
+Revision ID: a7d2e5b8c4f1
+Revises: f3a9c1d7b5e8
+Create Date: 2026-10-17 18:52:40.217305
+
+"""
+
+import base64
+import binascii
+import hashlib
+import logging
+from typing import Sequence, Union
+from uuid import UUID
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7d2e5b8c4f1"
+down_revision: Union[str, None] = "f3a9c1d7b5e8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+# Users handled per batch; pictures are then moved one at a time, so at most
+# one (up to ~7 MB) is in memory
+BATCH_SIZE = 500
+
+# Walk users in primary key order, starting below every id
+FIRST_ID = UUID(int=0)
+
+PUT_BLOB = sa.text(
+    "INSERT INTO blob (key, content_type, size, data, last_used_at) "
+    "VALUES (:key, :content_type, :size, :data, now()) "
+    "ON CONFLICT (key) DO UPDATE SET last_used_at = now()"
+)
+
+
+def _parse(data_uri: str):
+    """Content type and bytes of a data URI, or None if it's malformed."""
+    try:
+        header, encoded = data_uri.split(",", 1)
+        content_type = header.split(";")[0].replace("data:", "")
+        return content_type, base64.b64decode(encoded, validate=True)
+    except (ValueError, binascii.Error):
+        return None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    connection = op.get_bind()
+    # Each statement commits on its own, so the move can be interrupted and
+    # resumed, and never holds locks on many users
+    with op.get_context().autocommit_block():
+        after = FIRST_ID
+        while True:
+            user_ids = list(
+                connection.execute(
+                    sa.text(
+                        'SELECT id FROM "user" WHERE profile_picture IS NOT NULL '
+                        "AND id > :after ORDER BY id LIMIT :limit"
+                    ),
+                    {"after": after, "limit": BATCH_SIZE},
+                ).scalars()
+            )
+            if not user_ids:
+                break
+            after = user_ids[-1]
+
+            for user_id in user_ids:
+                data_uri = connection.execute(
+                    sa.text('SELECT profile_picture FROM "user" WHERE id = :id'),
+                    {"id": user_id},
+                ).scalar()
+                parsed = _parse(data_uri) if data_uri else None
+                key = None
+                if parsed:
+                    content_type, data = parsed
+                    key = hashlib.sha256(data).hexdigest()
+                    connection.execute(
+                        PUT_BLOB,
+                        {
+                            "key": key,
+                            "content_type": content_type,
+                            "size": len(data),
+                            "data": data,
+                        },
+                    )
+                elif data_uri:
+                    logger.warning(f"Dropping malformed profile picture of {user_id}")
+
+                connection.execute(
+                    sa.text(
+                        'UPDATE "user" SET profile_picture_hash = :key, '
+                        "profile_picture = NULL WHERE id = :id"
+                    ),
+                    {"key": key, "id": user_id},
+                )
+
+    op.drop_column("user", "profile_picture")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column("user", sa.Column("profile_picture", sa.Text(), nullable=True))
+
+    connection = op.get_bind()
+    with op.get_context().autocommit_block():
+        after = FIRST_ID
+        while True:
+            user_ids = list(
+                connection.execute(
+                    sa.text(
+                        'SELECT id FROM "user" '
+                        "WHERE profile_picture_hash IS NOT NULL "
+                        "AND id > :after ORDER BY id LIMIT :limit"
+                    ),
+                    {"after": after, "limit": BATCH_SIZE},
+                ).scalars()
+            )
+            if not user_ids:
+                break
+            after = user_ids[-1]
+
+            for user_id in user_ids:
+                picture = connection.execute(
+                    sa.text(
+                        'SELECT b.content_type, b.data FROM "user" u '
+                        "JOIN blob b ON b.key = u.profile_picture_hash "
+                        "WHERE u.id = :id"
+                    ),
+                    {"id": user_id},
+                ).first()
+                data_uri = None
+                if picture:
+                    encoded = base64.b64encode(picture.data).decode()
+                    data_uri = f"data:{picture.content_type};base64,{encoded}"
+                connection.execute(
+                    sa.text(
+                        'UPDATE "user" SET profile_picture = :data_uri, '
+                        "profile_picture_hash = NULL WHERE id = :id"
+                    ),
+                    {"data_uri": data_uri, "id": user_id},
+                )
@@ -0,0 +1,42 @@
+"""Add blob variants for profile picture thumbnails
+
+Revision ID: b4e8f2a6d9c3
+Revises: a7d2e5b8c4f1
+Create Date: 2026-10-17 19:26:03.871150
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b4e8f2a6d9c3"
+down_revision: Union[str, None] = "a7d2e5b8c4f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("blob", sa.Column("source_key", sa.String(length=64), nullable=True))
+    op.add_column("blob", sa.Column("variant", sa.String(length=50), nullable=True))
+    op.create_index(op.f("ix_blob_source_key"), "blob", ["source_key"], unique=False)
+    op.create_foreign_key(
+        "blob_source_key_fkey",
+        "blob",
+        "blob",
+        ["source_key"],
+        ["key"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM blob WHERE source_key IS NOT NULL")
+    op.drop_constraint("blob_source_key_fkey", "blob", type_="foreignkey")
+    op.drop_index(op.f("ix_blob_source_key"), table_name="blob")
+    op.drop_column("blob", "variant")
+    op.drop_column("blob", "source_key")
@@ -0,0 +1,61 @@
+"""Add keyset pagination indexes for admin listings
+
+Revision ID: c5a8d3e6f0b2
+Revises: 9d4e2b7f1a3c
+Create Date: 2026-10-17 16:41:09.302874
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5a8d3e6f0b2"
+down_revision: Union[str, None] = "9d4e2b7f1a3c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so large tables stay writable during the migration
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_created_at_id",
+            "user",
+            ["created_at", "id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_book_demo_created_at_id",
+            "book_demo",
+            ["created_at", "id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_book_demo_status_created_at_id",
+            "book_demo",
+            ["status", "created_at", "id"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_book_demo_status_created_at_id",
+            table_name="book_demo",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_book_demo_created_at_id",
+            table_name="book_demo",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_user_created_at_id",
+            table_name="user",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,51 @@
+"""Add trigram indexes for admin search
+
+Revision ID: e2b7c4f9a1d6
+Revises: c5a8d3e6f0b2
+Create Date: 2026-10-17 17:52:36.118402
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b7c4f9a1d6"
+down_revision: Union[str, None] = "c5a8d3e6f0b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ("ix_user_email_trgm", "user", "email"),
+    ("ix_user_full_name_trgm", "user", "full_name"),
+    ("ix_book_demo_company_name_trgm", "book_demo", "company_name"),
+    ("ix_book_demo_email_trgm", "book_demo", "email"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Needs a role allowed to create extensions (pg_trgm is a trusted extension
+    # from Postgres 13, so the database owner is enough)
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Built concurrently so large tables stay writable during the migration
+    with op.get_context().autocommit_block():
+        for name, table, column in INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The extension is left installed; other objects may depend on it
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
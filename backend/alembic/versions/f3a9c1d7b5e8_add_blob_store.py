@@ -0,0 +1,50 @@
+"""Add blob store and user profile picture reference
+
+Revision ID: f3a9c1d7b5e8
+Revises: e2b7c4f9a1d6
+Create Date: 2026-10-17 18:37:12.540918
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3a9c1d7b5e8"
+down_revision: Union[str, None] = "e2b7c4f9a1d6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "blob",
+        sa.Column("key", sa.String(length=64), nullable=False),
+        sa.Column("content_type", sa.String(length=100), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("last_used_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    # Images are already compressed: store them out of line without trying
+    op.execute("ALTER TABLE blob ALTER COLUMN data SET STORAGE EXTERNAL")
+    op.add_column(
+        "user",
+        sa.Column("profile_picture_hash", sa.String(length=64), nullable=True),
+    )
+    op.create_index(
+        op.f("ix_user_profile_picture_hash"),
+        "user",
+        ["profile_picture_hash"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_user_profile_picture_hash"), table_name="user")
+    op.drop_column("user", "profile_picture_hash")
+    op.drop_table("blob")
@@ -6,20 +6,24 @@ Provides reusable dependencies like database sessions and authentication.
 from typing import Annotated
 
 from fastapi import Depends
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.core.auth import (
+    CurrentUser,
+    TokenClaims,
     get_current_admin,
+    get_current_claims,
     get_current_user,
     get_current_user_allow_unverified,
 )
 from backend.core.database import get_db
-from backend.models import User
 
-SessionDep = Annotated[Session, Depends(get_db)]
+SessionDep = Annotated[AsyncSession, Depends(get_db)]
 
-CurrentUserDep = Annotated[User, Depends(get_current_user)]
+CurrentClaimsDep = Annotated[TokenClaims, Depends(get_current_claims)]
+
+CurrentUserDep = Annotated[CurrentUser, Depends(get_current_user)]
 CurrentUserAllowUnverifiedDep = Annotated[
-    User, Depends(get_current_user_allow_unverified)
+    CurrentUser, Depends(get_current_user_allow_unverified)
 ]
-CurrentAdminDep = Annotated[User, Depends(get_current_admin)]
+CurrentAdminDep = Annotated[CurrentUser, Depends(get_current_admin)]
@@ -0,0 +1,176 @@
+"""
+Benchmark the admin search on a large synthetic user table.
+Loads a scratch table shaped like ``user`` (synthetic emails and names) with
+the same trigram GIN indexes, then times the admin search query
+(``backend.core.search.contains``) for rare, common and no-match terms, with
+the indexes and with a forced sequential scan. The target is p95 under 50ms
+with the indexes. The table is dropped afterwards unless ``--keep`` is given.
+
+Usage:
+    python -m backend.benchmarks.admin_search --rows 1000000
+    python -m backend.benchmarks.admin_search --rows 5000000 --iterations 50
+"""
+
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, Uuid, select, text
+
+from backend.core.database import engine
+from backend.core.search import contains
+from backend.lib.uuid7 import uuid7
+
+TABLE = "benchmark_search_user"
+
+TARGET_MS = 50
+
+FIRST_NAMES = (
+    "james mary john patricia robert jennifer michael linda david elizabeth "
+    "william barbara richard susan joseph jessica thomas sarah ahmad fatima "
+    "wei mei hiroshi yuki carlos lucia olga ivan amara kwame"
+).split()
+LAST_NAMES = (
+    "smith johnson williams brown jones garcia miller davis rodriguez martinez "
+    "hernandez lopez wilson anderson thomas taylor moore jackson martin lee "
+    "khan chen tanaka silva novak petrov okafor mensah"
+).split()
+DOMAINS = ("gmail.com", "outlook.com", "yahoo.com", "proton.me", "acme.io")
+
+# (label, term): one matching a handful of rows, then more and more common
+TERMS = (
+    ("exact email", None),
+    ("full name", "kwame okafor"),
+    ("fragment", "ernand"),
+    ("common domain", "gmail"),
+    ("no match", "zzqxv"),
+)
+
+user = Table(
+    TABLE,
+    MetaData(),
+    Column("id", Uuid, primary_key=True),
+    Column("email", String),
+    Column("full_name", String),
+    Column("created_at", DateTime),
+)
+
+
+def _load(connection, rows: int) -> str:
+    """Create and fill the table; return one of its emails."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {TABLE}")
+        cursor.execute(
+            f"CREATE TABLE {TABLE} (id uuid PRIMARY KEY, email varchar(255), "
+            "full_name varchar(300), created_at timestamp)"
+        )
+        start = datetime.now() - timedelta(days=1000)
+        with cursor.copy(
+            f"COPY {TABLE} (id, email, full_name, created_at) FROM STDIN"
+        ) as copy:
+            for n in range(rows):
+                first = random.choice(FIRST_NAMES)
+                last = random.choice(LAST_NAMES)
+                copy.write_row(
+                    (
+                        uuid7(),
+                        f"{first}.{last}{n}@{random.choice(DOMAINS)}",
+                        f"{first.title()} {last.title()}",
+                        start + timedelta(seconds=n * 86400000 / rows),
+                    )
+                )
+                if n and n % 1_000_000 == 0:
+                    print(f"  {n:,} rows")
+
+        print("  building indexes")
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for column in ("email", "full_name"):
+            cursor.execute(
+                f"CREATE INDEX {TABLE}_{column}_trgm ON {TABLE} "
+                f"USING gin ({column} gin_trgm_ops)"
+            )
+        cursor.execute(f"ANALYZE {TABLE}")
+        cursor.execute(f"SELECT email FROM {TABLE} WHERE full_name = 'Kwame Okafor'")
+        row = cursor.fetchone()
+    connection.commit()
+    return row[0] if row else "kwame.okafor1@acme.io"
+
+
+def _time(connection, term: str, iterations: int, seq_scan: bool) -> List[float]:
+    """Latency of ``iterations`` searches for ``term``, in ms."""
+    where, rank = contains(term, user.c.email, user.c.full_name)
+    query = (
+        select(user.c.id, user.c.email, user.c.full_name)
+        .where(where)
+        .order_by(rank.desc(), user.c.created_at.desc(), user.c.id.desc())
+        .limit(20)
+    )
+    if seq_scan:
+        connection.execute(text("SET enable_bitmapscan = off"))
+        connection.execute(text("SET enable_indexscan = off"))
+
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        connection.execute(query).all()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    if seq_scan:
+        connection.execute(text("RESET enable_bitmapscan"))
+        connection.execute(text("RESET enable_indexscan"))
+    return timings
+
+
+def _report(label: str, term: str, timings: List[float]) -> None:
+    """Print median and p95 latency of one term."""
+    timings.sort()
+    print(
+        f"{label:>14} {term!r:>24}: p50 {statistics.median(timings):8.2f}ms  "
+        f"p95 {timings[int(len(timings) * 0.95) - 1]:8.2f}ms"
+    )
+
+
+def main(rows: int, iterations: int, keep: bool) -> None:
+    """Load the table and time the search with and without the indexes."""
+    raw = engine.raw_connection()
+    try:
+        email = _load(raw.driver_connection, rows)
+    finally:
+        raw.close()
+
+    terms = [(label, term or email) for label, term in TERMS]
+    worst = 0.0
+    try:
+        with engine.connect() as connection:
+            for seq_scan in (False, True):
+                # The sequential scan is slow; a few runs are enough
+                runs = max(3, iterations // 10) if seq_scan else iterations
+                print(
+                    f"\n{'Sequential scan' if seq_scan else 'Trigram indexes'} "
+                    f"({rows:,} rows, {runs} runs per term)"
+                )
+                for label, term in terms:
+                    timings = _time(connection, term, runs, seq_scan)
+                    _report(label, term, timings)
+                    if not seq_scan:
+                        worst = max(worst, timings[int(len(timings) * 0.95) - 1])
+    finally:
+        if not keep:
+            with engine.begin() as connection:
+                connection.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+
+    verdict = "OK" if worst < TARGET_MS else "over target"
+    print(f"\nWorst p95 with indexes: {worst:.2f}ms ({verdict}, {TARGET_MS}ms)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--keep", action="store_true", help="Keep the table")
+    args = parser.parse_args()
+
+    main(args.rows, args.iterations, args.keep)
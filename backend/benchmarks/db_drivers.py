@@ -0,0 +1,128 @@
+"""
+Benchmark psycopg2 vs psycopg 3 for the repository queries.
+Times the fixed lookups (user by email, 2FA by user, reset token by token and
+user) on one connection with psycopg2, psycopg 3 without prepared statements
+and psycopg 3 with them, then the signup inserts with and without pipeline
+mode. Inserts are rolled back.
+
+Usage:
+    python -m backend.benchmarks.db_drivers --iterations 2000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Callable, List
+from uuid import uuid4
+
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.config import settings
+from backend.core.database import pipeline
+from backend.models import ForgotPassword, TwoFactorAuth, User
+
+
+def _lookups(user: User) -> List:
+    """The fixed repository queries, for an existing user."""
+    return [
+        select(User).where(User.email == user.email),
+        select(TwoFactorAuth).where(TwoFactorAuth.user_id == user.id),
+        select(ForgotPassword).where(
+            ForgotPassword.token == "benchmark", ForgotPassword.user_id == user.id
+        ),
+    ]
+
+
+def _report(name: str, timings: List[float]) -> None:
+    """Print median and p95 latency of one variant."""
+    timings.sort()
+    print(
+        f"{name:>22}: p50 {statistics.median(timings):7.3f}ms  "
+        f"p95 {timings[int(len(timings) * 0.95) - 1]:7.3f}ms"
+    )
+
+
+def _time(fn: Callable[[], None], iterations: int) -> List[float]:
+    """Time ``iterations`` calls of ``fn``, in ms."""
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def bench_lookups(iterations: int) -> None:
+    """Lookup latency per driver and prepared statement setting."""
+    url = make_url(settings.database_uri)
+    variants = [
+        ("psycopg2", url.set(drivername="postgresql+psycopg2"), {}),
+        ("psycopg 3", url, {"prepare_threshold": None}),
+        ("psycopg 3 (prepared)", url, {"prepare_threshold": 0}),
+    ]
+
+    for name, variant_url, connect_args in variants:
+        engine = create_engine(variant_url, connect_args=connect_args)
+        with Session(engine) as session:
+            user = session.exec(select(User).limit(1)).first()
+            if user is None:
+                print("No users in the database; sign up a user first")
+                return
+            queries = _lookups(user)
+
+            def run() -> None:
+                for query in queries:
+                    session.exec(query).first()
+
+            _time(run, 50)  # warm up
+            _report(name, _time(run, iterations))
+        engine.dispose()
+
+
+async def bench_signup_inserts(iterations: int) -> None:
+    """Latency of the signup user + 2FA inserts with and without a pipeline."""
+    engine = create_async_engine(settings.database_uri)
+
+    for name, pipelined in (("inserts", False), ("inserts (pipeline)", True)):
+        timings = []
+        for _ in range(iterations):
+            async with AsyncSession(engine) as session:
+                await session.connection()
+                start = time.perf_counter()
+                user = User(
+                    email=f"benchmark-{uuid4()}@example.com",
+                    full_name="Benchmark",
+                    hashed_password="x",
+                )
+                two_fa = TwoFactorAuth(user_id=user.id, totp_secret="x")
+                if pipelined:
+                    async with pipeline(session):
+                        session.add(user)
+                        await session.flush()
+                        session.add(two_fa)
+                        await session.flush()
+                else:
+                    session.add(user)
+                    await session.flush()
+                    session.add(two_fa)
+                    await session.flush()
+                timings.append((time.perf_counter() - start) * 1000)
+                await session.rollback()
+        _report(name, timings[min(50, iterations // 10) :])
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--iterations", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"Repository lookups ({args.iterations} iterations, one connection)")
+    bench_lookups(args.iterations)
+    print("Signup inserts (rolled back)")
+    asyncio.run(bench_signup_inserts(args.iterations))
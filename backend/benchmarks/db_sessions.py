@@ -0,0 +1,127 @@
+"""
+Benchmark synchronous vs async database sessions under concurrency.
+Runs the auth user lookup the way each request path would: a sync Session in
+the anyio threadpool (40 tokens by default) versus an AsyncSession on the
+event loop.
+
+Usage:
+    python -m backend.benchmarks.db_sessions --requests 5000 --concurrency 200
+    python -m backend.benchmarks.db_sessions --mode async --query-ms 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List
+from uuid import UUID, uuid4
+
+from sqlalchemy import text
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from backend.core.database import async_engine, engine
+from backend.models import User
+
+
+def _user_query(user_id: UUID):
+    """The query behind the authenticated user lookup (2FA joined)."""
+    return select(User).where(User.id == user_id)
+
+
+def _sync_request(user_id: UUID, query_ms: float) -> None:
+    """One request on the synchronous path."""
+    with Session(engine) as session:
+        if query_ms:
+            session.exec(text("SELECT pg_sleep(:s)").bindparams(s=query_ms / 1000))
+        session.exec(_user_query(user_id)).first()
+
+
+async def _async_request(user_id: UUID, query_ms: float) -> None:
+    """One request on the async path."""
+    async with AsyncSession(async_engine) as session:
+        if query_ms:
+            await session.exec(
+                text("SELECT pg_sleep(:s)").bindparams(s=query_ms / 1000)
+            )
+        (await session.exec(_user_query(user_id))).first()
+
+
+async def _run(
+    request: Callable[[], Awaitable[None]], requests: int, concurrency: int
+) -> dict:
+    """Run ``requests`` calls with at most ``concurrency`` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def timed() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await request()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "throughput": requests / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "p99": latencies[int(len(latencies) * 0.99) - 1],
+    }
+
+
+async def _first_user_id() -> UUID:
+    """Any existing user ID (lookups of a missing ID still hit the DB)."""
+    async with AsyncSession(async_engine) as session:
+        user_id = (await session.exec(select(User.id).limit(1))).first()
+    return user_id or uuid4()
+
+
+async def main(args: argparse.Namespace) -> None:
+    user_id = await _first_user_id()
+    modes = ["sync", "async"] if args.mode == "both" else [args.mode]
+
+    print(
+        f"{args.requests} requests, concurrency {args.concurrency}, "
+        f"extra query time {args.query_ms}ms"
+    )
+    for mode in modes:
+        if mode == "sync":
+
+            async def request() -> None:
+                await run_in_threadpool(_sync_request, user_id, args.query_ms)
+
+        else:
+
+            async def request() -> None:
+                await _async_request(user_id, args.query_ms)
+
+        # Warm up the connection pool
+        await _run(request, args.concurrency, args.concurrency)
+        result = await _run(request, args.requests, args.concurrency)
+        print(
+            f"{mode:>5}: {result['throughput']:8.1f} req/s  "
+            f"p50 {result['p50']:7.2f}ms  p95 {result['p95']:7.2f}ms  "
+            f"p99 {result['p99']:7.2f}ms"
+        )
+
+    await async_engine.dispose()
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--mode", choices=["sync", "async", "both"], default="both")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument(
+        "--query-ms",
+        type=float,
+        default=0,
+        help="Extra server-side query time per request (pg_sleep)",
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,54 @@
+"""
+Benchmark password hashing cost on this machine.
+Prints bcrypt timings per cost (and argon2id timings when argon2-cffi is
+installed) and the bcrypt cost that fits the target latency, for
+PASSWORD_BCRYPT_ROUNDS.
+
+Usage:
+    python -m backend.benchmarks.password_hashing
+    python -m backend.benchmarks.password_hashing --target-ms 100 --max-rounds 14
+"""
+
+import argparse
+import time
+
+from backend.core.config import settings
+from backend.core.password import PasswordHasher, calibrate_bcrypt_rounds, time_bcrypt
+
+
+def main(args: argparse.Namespace) -> None:
+    print(f"bcrypt (current PASSWORD_BCRYPT_ROUNDS={settings.PASSWORD_BCRYPT_ROUNDS})")
+    for rounds in range(args.min_rounds, args.max_rounds + 1):
+        elapsed = time_bcrypt(rounds, samples=args.samples)
+        print(f"  cost {rounds:>2}: {elapsed:9.1f}ms")
+        if elapsed > args.target_ms * 4:
+            break
+
+    if PasswordHasher is not None:
+        hasher = PasswordHasher(
+            time_cost=settings.PASSWORD_ARGON2_TIME_COST,
+            memory_cost=settings.PASSWORD_ARGON2_MEMORY_KIB,
+            parallelism=settings.PASSWORD_ARGON2_PARALLELISM,
+        )
+        start = time.perf_counter()
+        for _ in range(args.samples):
+            hasher.hash("calibration-password")
+        elapsed = (time.perf_counter() - start) * 1000 / args.samples
+        print(
+            f"argon2id (t={hasher.time_cost}, m={hasher.memory_cost}KiB, "
+            f"p={hasher.parallelism}): {elapsed:.1f}ms"
+        )
+
+    rounds = calibrate_bcrypt_rounds(
+        args.target_ms, min_rounds=args.min_rounds, max_rounds=args.max_rounds
+    )
+    print(f"Recommended PASSWORD_BCRYPT_ROUNDS for {args.target_ms:g}ms: {rounds}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--target-ms", type=float, default=250)
+    parser.add_argument("--min-rounds", type=int, default=10)
+    parser.add_argument("--max-rounds", type=int, default=16)
+    parser.add_argument("--samples", type=int, default=3)
+    main(parser.parse_args())
@@ -0,0 +1,110 @@
+"""
+Benchmark uuid4 vs UUIDv7 primary keys on a large table.
+Loads the same number of rows into two scratch tables keyed by uuid4 and by
+UUIDv7 (``backend.lib.uuid7``), committing every batch, and reports insert
+throughput (overall and for the last tenth, once the index no longer fits in
+cache) plus table and primary key index size. The tables are dropped
+afterwards unless ``--keep`` is given.
+
+Both tables start empty, so UUIDv7 inserts append at the right edge. Tables
+that still hold uuid4 rows insert near the left edge (see ``backend.lib.uuid7``).
+
+Usage:
+    python -m backend.benchmarks.uuid_keys --rows 5000000
+    python -m backend.benchmarks.uuid_keys --rows 2000000 --batch 5000 --keep
+"""
+
+import argparse
+import time
+from typing import Callable, List
+from uuid import UUID, uuid4
+
+from backend.core.database import engine
+from backend.lib.uuid7 import uuid7
+
+# Roughly the size of a forgot_password / book_demo row
+PAYLOAD = "x" * 120
+
+
+def _load(
+    connection, table: str, new_key: Callable[[], UUID], rows: int, batch: int
+) -> List[float]:
+    """Insert ``rows`` rows in committed batches; return rows/s per batch."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {table}")
+        cursor.execute(
+            f"CREATE TABLE {table} (id uuid PRIMARY KEY, "
+            "created_at timestamptz NOT NULL DEFAULT now(), payload text)"
+        )
+    connection.commit()
+
+    throughput = []
+    for done in range(0, rows, batch):
+        keys = [new_key() for _ in range(min(batch, rows - done))]
+        start = time.perf_counter()
+        with connection.cursor() as cursor:
+            with cursor.copy(f"COPY {table} (id, payload) FROM STDIN") as copy:
+                for key in keys:
+                    copy.write_row((key, PAYLOAD))
+        connection.commit()
+        throughput.append(len(keys) / (time.perf_counter() - start))
+        if len(throughput) % 50 == 0:
+            print(f"  {table}: {done + len(keys):,} rows")
+    return throughput
+
+
+def _sizes(connection, table: str) -> dict:
+    """Table and primary key index size in MB."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_table_size(%s), pg_relation_size(%s)",
+            (table, f"{table}_pkey"),
+        )
+        table_bytes, index_bytes = cursor.fetchone()
+    return {
+        "table_mb": table_bytes / 1024 / 1024,
+        "index_mb": index_bytes / 1024 / 1024,
+    }
+
+
+def _report(name: str, throughput: List[float], sizes: dict) -> None:
+    """Print throughput and sizes of one key type."""
+    tail = throughput[-max(1, len(throughput) // 10) :]
+    print(
+        f"{name:>6}: {sum(throughput) / len(throughput):9,.0f} rows/s overall  "
+        f"{sum(tail) / len(tail):9,.0f} rows/s last 10%  "
+        f"table {sizes['table_mb']:8.1f}MB  pkey {sizes['index_mb']:7.1f}MB"
+    )
+
+
+def main(rows: int, batch: int, keep: bool) -> None:
+    """Load both tables and compare."""
+    raw = engine.raw_connection()
+    connection = raw.driver_connection
+    results = []
+    try:
+        for name, new_key in (("uuid4", uuid4), ("uuid7", uuid7)):
+            table = f"benchmark_{name}_keys"
+            throughput = _load(connection, table, new_key, rows, batch)
+            results.append((name, throughput, _sizes(connection, table)))
+    finally:
+        if not keep:
+            with connection.cursor() as cursor:
+                for name in ("uuid4", "uuid7"):
+                    cursor.execute(f"DROP TABLE IF EXISTS benchmark_{name}_keys")
+            connection.commit()
+        raw.close()
+
+    print(f"Inserts ({rows:,} rows, {batch:,} per commit)")
+    for result in results:
+        _report(*result)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument("--keep", action="store_true", help="Keep the tables")
+    args = parser.parse_args()
+
+    main(args.rows, args.batch, args.keep)
@@ -3,52 +3,242 @@ Authentication utilities for JWT token validation and user retrieval.
 Provides dependencies for FastAPI endpoints to authenticate requests.
 """
 
+import logging
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Optional
-from uuid import UUID
+from typing import Any, Optional, Tuple
+from uuid import UUID, uuid4
 
 import jwt
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlmodel import Session, select
+from fastapi.security.utils import get_authorization_scheme_param
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from backend.core.cache import user_cache
 from backend.core.config import settings
 from backend.core.database import get_db
-from backend.models import User
+from backend.core.jwt_keys import key_ring
+from backend.core.recent_writes import recent_writes
+from backend.core.redis_client import get_redis
+from backend.core.revocation import token_revocation
+from backend.core.statements import uncounted
+from backend.models import AuthUser, TwoFactorAuth, User
+
+logger = logging.getLogger(__name__)
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
+REFRESH_TOKEN_TYPE = "refresh"
+REFRESH_FAMILY_KEY_PREFIX = "refresh_family:"
 
-def create_access_token(user_id: UUID, pending_2fa: bool = False) -> str:
-    """Create JWT access token for user."""
-    expires_delta = timedelta(minutes=settings.JWT_EXPIRE_MINUTES_DELTA)
-    expire = datetime.now() + expires_delta
+# Atomically rotate a refresh token family: 1 = rotated, 0 = unknown/expired
+# family, -1 = a superseded token was replayed (the family is revoked)
+_ROTATE_REFRESH_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if not current then
+    return 0
+end
+if current ~= ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    return -1
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return 1
+"""
 
-    payload = {
-        "sub": str(user_id),
-        "exp": expire,
-        "pending_2fa": pending_2fa,
-    }
 
-    token = jwt.encode(
+@dataclass(frozen=True)
+class TokenClaims:
+    """Validated JWT claims, decoded once per request."""
+
+    user_id: UUID
+    pending_2fa: bool = False
+    signup_verified: Optional[bool] = None
+    is_admin: Optional[bool] = None
+    session_id: Optional[str] = None
+    payload: dict = field(default_factory=dict, repr=False)
+
+    @property
+    def authorizes(self) -> bool:
+        """Whether authorization can be decided from claims alone (no DB)."""
+        return settings.AUTH_CLAIMS_ONLY and self.signup_verified is not None
+
+
+def _encode(payload: dict) -> str:
+    """Sign a JWT payload with the active key (or the shared secret)."""
+    if key_ring.enabled:
+        key = key_ring.active
+        return jwt.encode(
+            payload,
+            key.private_key,
+            algorithm=key.algorithm,
+            headers={"kid": key.kid},
+        )
+
+    return jwt.encode(
         payload,
         settings.JWT_SECRET_KEY,
         algorithm=settings.JWT_ALGORITHM,
     )
 
-    return token
+
+def _decode(token: str) -> dict:
+    """Verify a JWT against the key named by its ``kid`` (or the shared secret)."""
+    if key_ring.enabled:
+        kid = jwt.get_unverified_header(token).get("kid")
+        key = key_ring.get(kid) if kid else None
+        if not key:
+            raise jwt.InvalidTokenError("Unknown signing key")
+        return jwt.decode(token, key.public_key, algorithms=[key.algorithm])
+
+    return jwt.decode(
+        token,
+        settings.JWT_SECRET_KEY,
+        algorithms=[settings.JWT_ALGORITHM],
+    )
+
+
+def create_access_token(
+    user: User | AuthUser,
+    pending_2fa: bool = False,
+    session_id: Optional[str] = None,
+) -> str:
+    """
+    Create JWT access token for user.
+
+    In claims-only mode the token is short-lived and carries the authorization
+    claims (``verified``, ``admin``) so requests can be authorized without a
+    database lookup.
+
+    Args:
+        user: Authenticated user
+        pending_2fa: Whether 2FA verification is still required
+        session_id: Login session (``sid`` claim); a new one if not given
+    """
+    payload = {
+        "sub": str(user.id),
+        "sid": session_id or uuid4().hex,
+        "iat": time.time(),
+        "pending_2fa": pending_2fa,
+    }
+
+    if settings.AUTH_CLAIMS_ONLY:
+        expires_delta = timedelta(minutes=settings.JWT_ACCESS_EXPIRE_MINUTES)
+        payload["verified"] = user.signup_verified is not None
+        payload["admin"] = user.is_admin
+    else:
+        expires_delta = timedelta(minutes=settings.JWT_EXPIRE_MINUTES_DELTA)
+
+    payload["exp"] = datetime.now() + expires_delta
+
+    return _encode(payload)
+
+
+async def create_auth_tokens(
+    user: User | AuthUser,
+    pending_2fa: bool = False,
+    session_id: Optional[str] = None,
+) -> Tuple[str, Optional[str]]:
+    """
+    Create the tokens returned by signup/login/2FA verification.
+
+    Returns:
+        Tuple of (access token, refresh token). The refresh token is only
+        issued in claims-only mode, once the user is fully authenticated.
+    """
+    session_id = session_id or uuid4().hex
+    access_token = create_access_token(user, pending_2fa, session_id)
+    refresh_token = None
+    if settings.AUTH_CLAIMS_ONLY and not pending_2fa:
+        refresh_token = await create_refresh_token(user.id, session_id)
+
+    return access_token, refresh_token
+
+
+def _encode_refresh_token(user_id: UUID, session_id: str, jti: str) -> str:
+    """Sign a refresh token for the given session (rotation family) and token ID."""
+    expire = datetime.now() + timedelta(days=settings.JWT_REFRESH_EXPIRE_DAYS)
+
+    return _encode(
+        {
+            "sub": str(user_id),
+            "sid": session_id,
+            "iat": time.time(),
+            "exp": expire,
+            "type": REFRESH_TOKEN_TYPE,
+            "jti": jti,
+        }
+    )
+
+
+async def create_refresh_token(user_id: UUID, session_id: str) -> str:
+    """Create a refresh token starting the rotation family of a login session."""
+    jti = uuid4().hex
+    await get_redis().set(
+        f"{REFRESH_FAMILY_KEY_PREFIX}{session_id}",
+        jti,
+        ex=timedelta(days=settings.JWT_REFRESH_EXPIRE_DAYS),
+    )
+
+    return _encode_refresh_token(user_id, session_id, jti)
+
+
+async def rotate_refresh_token(token: str) -> Tuple[UUID, str, str]:
+    """
+    Exchange a refresh token for its successor in the same family.
+
+    Each refresh token can be used once. Presenting a token that was already
+    rotated is treated as theft and revokes the whole family.
+
+    Returns:
+        Tuple of (user ID, session ID, new refresh token)
+
+    Raises:
+        HTTPException: If the token is invalid, expired, revoked or reused
+    """
+    payload = decode_token(token)
+    session_id = payload.get("sid")
+    jti = payload.get("jti")
+    if payload.get("type") != REFRESH_TOKEN_TYPE or not session_id or not jti:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+        )
+
+    user_id = UUID(payload["sub"])
+    new_jti = uuid4().hex
+    result = await get_redis().eval(
+        _ROTATE_REFRESH_SCRIPT,
+        1,
+        f"{REFRESH_FAMILY_KEY_PREFIX}{session_id}",
+        jti,
+        new_jti,
+        settings.JWT_REFRESH_EXPIRE_DAYS * 86400,
+    )
+
+    if result == -1:
+        logger.warning(f"Refresh token reuse detected for user {user_id}")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token reuse detected",
+        )
+    if result != 1:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token has been revoked",
+        )
+
+    return user_id, session_id, _encode_refresh_token(user_id, session_id, new_jti)
 
 
 def decode_token(token: str) -> dict:
-    """Decode and validate JWT token."""
+    """Decode and validate JWT token, rejecting revoked tokens."""
     try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM],
-        )
-        return payload
+        payload = _decode(token)
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -62,9 +252,18 @@ def decode_token(token: str) -> dict:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    if token_revocation.is_revoked(payload):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return payload
+
 
-def get_user_id_from_token(token: str) -> UUID:
-    """Extract user ID from JWT token."""
+def get_token_claims(token: str) -> TokenClaims:
+    """Decode JWT token and extract the claims used for authorization."""
     payload = decode_token(token)
     user_id_str: Optional[str] = payload.get("sub")
     if not user_id_str:
@@ -73,9 +272,15 @@ def get_user_id_from_token(token: str) -> UUID:
             detail="Invalid token payload",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    if payload.get("type") == REFRESH_TOKEN_TYPE:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token cannot be used for authentication",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
     try:
-        return UUID(user_id_str)
+        user_id = UUID(user_id_str)
     except ValueError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -83,63 +288,210 @@ def get_user_id_from_token(token: str) -> UUID:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    return TokenClaims(
+        user_id=user_id,
+        pending_2fa=payload.get("pending_2fa", False),
+        signup_verified=payload.get("verified"),
+        is_admin=payload.get("admin"),
+        session_id=payload.get("sid"),
+        payload=payload,
+    )
 
-def get_pending_2fa_from_token(token: str) -> bool:
-    """Extract pending_2fa status from JWT token."""
-    payload = decode_token(token)
-    return payload.get("pending_2fa", False)
 
+def get_request_claims(request: Request) -> Optional[TokenClaims]:
+    """
+    Get decoded token claims for the current request.
+
+    The bearer token is verified at most once per request. The result (or the
+    validation error) is stored on ``request.state`` so the rate limiter, auth
+    dependencies and endpoints all share it.
 
-def get_current_user_allow_unverified(
+    Returns:
+        TokenClaims, or None if the request has no bearer token
+
+    Raises:
+        HTTPException: If the token is invalid or expired
+    """
+    if hasattr(request.state, "token_claims"):
+        return request.state.token_claims
+    if hasattr(request.state, "token_error"):
+        raise request.state.token_error
+
+    scheme, token = get_authorization_scheme_param(request.headers.get("Authorization"))
+    if not token or scheme.lower() != "bearer":
+        return None
+
+    try:
+        claims = get_token_claims(token)
+    except HTTPException as e:
+        request.state.token_error = e
+        raise
+
+    request.state.token_claims = claims
+    return claims
+
+
+async def get_current_claims(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    session: Session = Depends(get_db),
-) -> User:
-    """Get current authenticated user (verified or unverified) from JWT token."""
-    token = credentials.credentials
-    user_id = get_user_id_from_token(token)
+    session: AsyncSession = Depends(get_db),
+) -> TokenClaims:
+    """
+    Get decoded JWT claims for the current authenticated request.
 
-    # Fetch user from database
-    statement = select(User).where(User.id == user_id)
-    user = session.exec(statement).first()
-    if not user:
+    Users who wrote within the read-your-writes window read from the primary.
+    """
+    claims = get_request_claims(request)
+    if not claims:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    recent_writes.pin(session, claims.user_id)
+    return claims
+
+
+def auth_user_statement(user_id: UUID):
+    """Select only the columns authorization needs (no profile fields)."""
+    return (
+        select(
+            User.id,
+            User.signup_verified,
+            User.is_admin,
+            TwoFactorAuth.is_enabled,
+        )
+        .outerjoin(TwoFactorAuth, TwoFactorAuth.user_id == User.id)
+        .where(User.id == user_id)
+    )
+
+
+async def load_auth_user(session: AsyncSession, user_id: UUID) -> AuthUser:
+    """Load the auth projection of a user from cache, falling back to the DB."""
+    # Serve from cache when possible
+    user = await user_cache.get(user_id)
+    if user:
+        return user
+
+    generation = user_cache.generation
+    with uncounted(session):
+        row = (await session.exec(auth_user_statement(user_id))).first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
 
+    user = AuthUser(
+        id=row.id,
+        signup_verified=row.signup_verified,
+        is_admin=row.is_admin,
+        two_fa_enabled=bool(row.is_enabled),
+    )
+    await user_cache.set(user, generation)
+
     return user
 
 
-def get_current_user(
-    user: User = Depends(get_current_user_allow_unverified),
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-) -> User:
+class CurrentUser:
+    """
+    Authenticated user for the current request.
+
+    ``id`` and ``claims`` come from the token. ``signup_verified``,
+    ``is_admin`` and ``two_fa_enabled`` are read from the AuthUser projection,
+    which is loaded up front unless the token claims authorize the request on
+    their own (call ``await current_user.load()`` first in that case). The
+    full ``User`` entity is only loaded by ``await current_user.get_user()``.
+    """
+
+    def __init__(self, claims: TokenClaims, session: AsyncSession):
+        self.claims = claims
+        self._session = session
+        self._user: Optional[AuthUser] = None
+        self._db_user: Optional[User] = None
+
+    @property
+    def id(self) -> UUID:
+        """User ID from the token subject."""
+        return self.claims.user_id
+
+    async def load(self) -> AuthUser:
+        """Load the auth projection from cache or DB (once per request)."""
+        if self._user is None:
+            self._user = await load_auth_user(self._session, self.claims.user_id)
+        return self._user
+
+    async def get_user(self) -> User:
+        """Load the full User entity (with 2FA settings) on first use."""
+        if self._db_user is None:
+            self._db_user = await self._session.get(User, self.id)
+            if self._db_user is None:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="User not found",
+                )
+        return self._db_user
+
+    @property
+    def user(self) -> AuthUser:
+        """Auth projection; must have been loaded with ``load()``."""
+        if self._user is None:
+            raise RuntimeError("Auth user not loaded; await CurrentUser.load()")
+        return self._user
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.user, name)
+
+
+async def get_current_user_allow_unverified(
+    claims: TokenClaims = Depends(get_current_claims),
+    session: AsyncSession = Depends(get_db),
+) -> CurrentUser:
+    """Get current authenticated user (verified or unverified) from JWT token."""
+    current_user = CurrentUser(claims, session)
+
+    # Without authorization claims, confirm the user still exists up front
+    if not claims.authorizes:
+        await current_user.load()
+
+    return current_user
+
+
+async def get_current_user(
+    current_user: CurrentUser = Depends(get_current_user_allow_unverified),
+) -> CurrentUser:
     """Get current authenticated and verified user from JWT token."""
-    if not user.signup_verified:
+    claims = current_user.claims
+    signup_verified = (
+        claims.signup_verified if claims.authorizes else current_user.signup_verified
+    )
+    if not signup_verified:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Email not verified",
         )
 
     # Check if 2FA verification is pending
-    token = credentials.credentials
-    pending_2fa = get_pending_2fa_from_token(token)
-
-    if pending_2fa:
+    if claims.pending_2fa:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="2FA verification required",
         )
 
-    return user
+    return current_user
 
 
-def get_current_admin(user: User = Depends(get_current_user)) -> User:
+async def get_current_admin(
+    current_user: CurrentUser = Depends(get_current_user),
+) -> CurrentUser:
     """Get current authenticated, verified, and admin user from JWT token."""
-    if not user.is_admin:
+    claims = current_user.claims
+    is_admin = claims.is_admin if claims.authorizes else current_user.is_admin
+    if not is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required",
         )
 
-    return user
+    return current_user
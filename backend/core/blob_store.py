@@ -0,0 +1,149 @@
+"""
+Content-addressed blob storage.
+Binary data (e.g. profile pictures) is stored once per distinct content,
+keyed by its SHA-256, so rows that use it only keep the 64-character key.
+``BlobStore`` is the interface; ``DatabaseBlobStore`` keeps blobs in the
+``blob`` table (``bytea``), so a blob is written in the same transaction as
+the row that references it. Variants derived from a blob (e.g. thumbnails)
+have keys computed from their source's, so they can be fetched directly.
+"""
+
+import hashlib
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import exists
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import delete, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.models import Blob
+
+
+def blob_key(data: bytes) -> str:
+    """Key of some data: its SHA-256, in hex."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def variant_key(source_key: str, variant: str) -> str:
+    """Key of a variant of a blob."""
+    return blob_key(f"{source_key}/{variant}".encode())
+
+
+def _row(
+    key: str,
+    data: bytes,
+    content_type: str,
+    source_key: Optional[str] = None,
+    variant: Optional[str] = None,
+) -> dict:
+    """Column values of a blob stored now."""
+    return {
+        "key": key,
+        "content_type": content_type,
+        "size": len(data),
+        "data": data,
+        "source_key": source_key,
+        "variant": variant,
+        "last_used_at": datetime.now(),
+    }
+
+
+class BlobStore(ABC):
+    """Interface of a blob store; every method takes the caller's session."""
+
+    @abstractmethod
+    async def put(self, session: AsyncSession, data: bytes, content_type: str) -> str:
+        """
+        Store data (once per content) and return its key.
+
+        Storing existing data only marks it as used.
+        """
+
+    @abstractmethod
+    async def put_variants(
+        self,
+        session: AsyncSession,
+        source_key: str,
+        variants: Dict[str, Tuple[bytes, str]],
+    ) -> None:
+        """Store variants of a blob: ``{variant: (data, content_type)}``."""
+
+    @abstractmethod
+    async def get(self, session: AsyncSession, key: str) -> Optional[Blob]:
+        """Get a blob (or variant) by key."""
+
+    @abstractmethod
+    async def delete_unreferenced(
+        self, session: AsyncSession, reference, unused_since: datetime, limit: int
+    ) -> int:
+        """
+        Delete up to ``limit`` blobs that no ``reference`` column points at and
+        that haven't been stored since ``unused_since``, with their variants;
+        return the count.
+        """
+
+
+class DatabaseBlobStore(BlobStore):
+    """Blob store backed by the ``blob`` table."""
+
+    async def put(self, session: AsyncSession, data: bytes, content_type: str) -> str:
+        key = blob_key(data)
+        await self._upsert(session, [_row(key, data, content_type)])
+        return key
+
+    async def put_variants(
+        self,
+        session: AsyncSession,
+        source_key: str,
+        variants: Dict[str, Tuple[bytes, str]],
+    ) -> None:
+        rows = [
+            _row(
+                variant_key(source_key, variant),
+                data,
+                content_type,
+                source_key,
+                variant,
+            )
+            for variant, (data, content_type) in variants.items()
+        ]
+        if rows:
+            await self._upsert(session, rows)
+
+    async def _upsert(self, session: AsyncSession, rows: List[dict]) -> None:
+        """Insert blobs in one statement, marking existing ones as used."""
+        stmt = insert(Blob).values(rows)
+        # Locks existing rows, so a purge running now skips them
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Blob.key],
+            set_={"last_used_at": stmt.excluded.last_used_at},
+        )
+        await session.execute(stmt)
+
+    async def get(self, session: AsyncSession, key: str) -> Optional[Blob]:
+        return await session.get(Blob, key)
+
+    async def delete_unreferenced(
+        self, session: AsyncSession, reference, unused_since: datetime, limit: int
+    ) -> int:
+        keys = (
+            select(Blob.key)
+            .where(
+                Blob.source_key.is_(None),
+                Blob.last_used_at < unused_since,
+                ~exists().where(reference == Blob.key),
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = delete(Blob).where(Blob.key.in_(keys))
+        result = await session.execute(
+            stmt, execution_options={"synchronize_session": False}
+        )
+        return result.rowcount
+
+
+# Global instance
+blob_store = DatabaseBlobStore()
@@ -0,0 +1,236 @@
+"""
+Two-tier cache for authenticated user snapshots.
+Keeps an in-process LRU/TTL cache in front of a shared Redis cache, with
+invalidation broadcast to every worker through Redis pub/sub.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, Optional
+from uuid import UUID
+
+import redis
+from redis import asyncio as aioredis
+from sqlalchemy import event
+from sqlmodel import Session
+
+from backend.core.config import settings
+from backend.core.database import run_after_commit
+from backend.core.metrics import metrics
+from backend.core.redis_client import get_redis, subscribe
+from backend.models import AuthUser
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "user_cache:"
+INVALIDATION_CHANNEL = "user_cache:invalidate"
+
+# Session.info key holding user IDs to invalidate once the transaction commits
+_PENDING_KEY = "user_cache_invalidations"
+
+
+class LRUCache:
+    """Thread-safe in-process LRU cache with per-entry TTL."""
+
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a value, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove a value if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all values."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class UserCache:
+    """
+    Auth snapshot cache: in-process LRU/TTL (tier 1) in front of Redis (tier 2).
+
+    Writers call ``invalidate(session, user_id)``; the snapshot is evicted from
+    Redis and every worker's local tier after the session commits.
+    """
+
+    def __init__(self):
+        self.local = LRUCache(
+            max_size=settings.USER_CACHE_MAX_SIZE,
+            ttl_seconds=settings.USER_CACHE_LOCAL_TTL_SECONDS,
+        )
+        self._listener: Optional[asyncio.Task] = None
+        # Bumped on every invalidation; loads that straddle one are not cached
+        self._generation = 0
+
+        self._local_hits = metrics.counter("user_cache.local.hits")
+        self._local_misses = metrics.counter("user_cache.local.misses")
+        self._redis_hits = metrics.counter("user_cache.redis.hits")
+        self._redis_misses = metrics.counter("user_cache.redis.misses")
+        self._invalidations = metrics.counter("user_cache.invalidations")
+
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is enabled in settings."""
+        return settings.USER_CACHE_ENABLED
+
+    @property
+    def generation(self) -> int:
+        """Current invalidation generation (read before loading from the DB)."""
+        return self._generation
+
+    async def get(self, user_id: UUID) -> Optional[AuthUser]:
+        """Get a user snapshot from the local tier, then Redis."""
+        if not self.enabled:
+            return None
+
+        user = self.local.get(user_id)
+        if user is not None:
+            self._local_hits.inc()
+            return user
+        self._local_misses.inc()
+
+        try:
+            data = await get_redis().get(f"{KEY_PREFIX}{user_id}")
+        except redis.RedisError as e:
+            logger.warning(f"User cache Redis read failed: {str(e)}")
+            return None
+
+        if data is None:
+            self._redis_misses.inc()
+            return None
+
+        self._redis_hits.inc()
+        user = AuthUser.model_validate_json(data)
+        self.local.set(user_id, user)
+        return user
+
+    async def set(self, user: AuthUser, generation: int) -> None:
+        """Store a snapshot loaded from the DB at the given generation."""
+        if not self.enabled or generation != self._generation:
+            return
+
+        self.local.set(user.id, user)
+        try:
+            await get_redis().set(
+                f"{KEY_PREFIX}{user.id}",
+                user.model_dump_json(),
+                ex=settings.USER_CACHE_REDIS_TTL_SECONDS,
+            )
+        except redis.RedisError as e:
+            logger.warning(f"User cache Redis write failed: {str(e)}")
+
+    def invalidate(self, session: Session, user_id: UUID) -> None:
+        """Schedule a user snapshot for invalidation when the session commits."""
+        session.info.setdefault(_PENDING_KEY, set()).add(user_id)
+
+    def evict(self, user_ids: Iterable[UUID]) -> None:
+        """Evict snapshots from this worker's local tier."""
+        user_ids = list(user_ids)
+        self._generation += 1
+        for user_id in user_ids:
+            self.local.pop(user_id)
+        self._invalidations.inc(len(user_ids))
+
+    async def publish_evictions(self, user_ids: Iterable[UUID]) -> None:
+        """Evict snapshots from Redis and on all other workers."""
+        if not self.enabled:
+            return
+
+        try:
+            async with get_redis().pipeline() as pipe:
+                for user_id in user_ids:
+                    pipe.delete(f"{KEY_PREFIX}{user_id}")
+                    pipe.publish(INVALIDATION_CHANNEL, str(user_id))
+                await pipe.execute()
+        except redis.RedisError as e:
+            logger.error(f"User cache invalidation failed: {str(e)}")
+
+    async def start(self) -> None:
+        """Start listening for invalidations from other workers."""
+        if self.enabled and self._listener is None:
+            self._listener = asyncio.create_task(
+                subscribe(INVALIDATION_CHANNEL, self._on_message, self._on_connect)
+            )
+
+    async def stop(self) -> None:
+        """Stop the invalidation listener."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    def _on_message(self, data: str) -> None:
+        """Evict a user invalidated by any worker."""
+        self._generation += 1
+        self.local.pop(UUID(data))
+
+    async def _on_connect(self, client: aioredis.Redis) -> None:
+        """Drop local entries; invalidations may have been missed while disconnected."""
+        self._generation += 1
+        self.local.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size, for sizing the cache."""
+        return {
+            "enabled": self.enabled,
+            "local_size": len(self.local),
+            "local_max_size": self.local.max_size,
+            "local_hits": self._local_hits.value,
+            "local_misses": self._local_misses.value,
+            "redis_hits": self._redis_hits.value,
+            "redis_misses": self._redis_misses.value,
+            "invalidations": self._invalidations.value,
+        }
+
+
+# Global instance
+user_cache = UserCache()
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_after_commit(session: Session) -> None:
+    """Evict users changed in the committed transaction."""
+    user_ids = session.info.pop(_PENDING_KEY, None)
+    if user_ids:
+        user_cache.evict(user_ids)
+        run_after_commit(session, user_cache.publish_evictions(user_ids))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    """Drop pending invalidations for a rolled back transaction."""
+    session.info.pop(_PENDING_KEY, None)
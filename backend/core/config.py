@@ -3,9 +3,9 @@ Application configuration management using Pydantic settings.
 Handles environment variables and configuration validation.
 """
 
-from typing import List
+from typing import List, Literal
 
-from pydantic import BaseModel, computed_field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 from pydantic_core import Url
 
 from .env import get_env, get_env_bool, get_env_int
@@ -14,6 +14,9 @@ from .env import get_env, get_env_bool, get_env_int
 class Settings(BaseModel):
     """Application settings loaded from environment variables."""
 
+    # Defaults come from the environment, so validate them like input
+    model_config = ConfigDict(validate_default=True)
+
     # Application
     APP_NAME: str = get_env("APP_NAME")
     APP_VERSION: str = get_env("APP_VERSION")
@@ -50,6 +53,17 @@ class Settings(BaseModel):
     JWT_SECRET_KEY: str = get_env("JWT_SECRET_KEY")
     JWT_EXPIRE_MINUTES_DELTA: int = get_env_int("JWT_EXPIRE_MINUTES_DELTA")
 
+    # Asymmetric JWT signing (JWT_ALGORITHM=EdDSA or ES256)
+    JWT_KEYS_DIR: str = get_env("JWT_KEYS_DIR", "")
+    JWT_ACTIVE_KID: str = get_env("JWT_ACTIVE_KID", "")
+    JWT_KEYS_RELOAD_SECONDS: int = get_env_int("JWT_KEYS_RELOAD_SECONDS", 60)
+
+    # Claims-only auth: short-lived access tokens carrying authorization claims,
+    # renewed through rotating refresh tokens
+    AUTH_CLAIMS_ONLY: bool = get_env_bool("AUTH_CLAIMS_ONLY", False)
+    JWT_ACCESS_EXPIRE_MINUTES: int = get_env_int("JWT_ACCESS_EXPIRE_MINUTES", 5)
+    JWT_REFRESH_EXPIRE_DAYS: int = get_env_int("JWT_REFRESH_EXPIRE_DAYS", 30)
+
     # SendGrid
     SENDGRID_API_KEY: str = get_env("SENDGRID_API_KEY")
     SENDGRID_FROM_EMAIL: str = get_env("SENDGRID_FROM_EMAIL")
@@ -62,28 +76,114 @@ class Settings(BaseModel):
     POSTGRES_SERVER: str = get_env("POSTGRES_SERVER")
     POSTGRES_PASSWORD: str = get_env("POSTGRES_PASSWORD")
 
+    # Database Connection Pool
+    DB_POOL_SIZE: int = get_env_int("DB_POOL_SIZE", 10)
+    DB_MAX_OVERFLOW: int = get_env_int("DB_MAX_OVERFLOW", 20)
+    DB_POOL_TIMEOUT_SECONDS: int = get_env_int("DB_POOL_TIMEOUT_SECONDS", 30)
+    DB_POOL_RECYCLE_SECONDS: int = get_env_int("DB_POOL_RECYCLE_SECONDS", 1800)
+    DB_POOL_PRE_PING: bool = get_env_bool("DB_POOL_PRE_PING", True)
+    DB_PREPARE_THRESHOLD: int = get_env_int("DB_PREPARE_THRESHOLD", 2)
+
+    # Read Replicas (comma-separated host[:port], same database and credentials)
+    DB_REPLICA_SERVERS: str = get_env("DB_REPLICA_SERVERS", "")
+    DB_READ_YOUR_WRITES_SECONDS: int = get_env_int("DB_READ_YOUR_WRITES_SECONDS", 10)
+
+    # Request Deadlines
+    REQUEST_LATENCY_BUDGET_MS: int = get_env_int("REQUEST_LATENCY_BUDGET_MS", 10000)
+
+    # SQL Instrumentation
+    SQL_SLOW_QUERY_MS: int = get_env_int("SQL_SLOW_QUERY_MS", 200)
+    SQL_DETECT_N_PLUS_ONE: bool = get_env_bool("SQL_DETECT_N_PLUS_ONE", False)
+    SQL_N_PLUS_ONE_THRESHOLD: int = get_env_int("SQL_N_PLUS_ONE_THRESHOLD", 5)
+
     # Redis
     REDIS_URL: str = get_env("REDIS_URL")
 
+    # User Cache
+    USER_CACHE_ENABLED: bool = get_env_bool("USER_CACHE_ENABLED", True)
+    USER_CACHE_MAX_SIZE: int = get_env_int("USER_CACHE_MAX_SIZE", 10000)
+    USER_CACHE_LOCAL_TTL_SECONDS: int = get_env_int("USER_CACHE_LOCAL_TTL_SECONDS", 30)
+    USER_CACHE_REDIS_TTL_SECONDS: int = get_env_int("USER_CACHE_REDIS_TTL_SECONDS", 300)
+
+    # Password Hashing
+    PASSWORD_HASH_WORKERS: int = get_env_int("PASSWORD_HASH_WORKERS", 2)
+    PASSWORD_HASH_MAX_QUEUE: int = get_env_int("PASSWORD_HASH_MAX_QUEUE", 32)
+    PASSWORD_HASH_ALGORITHM: Literal["bcrypt", "argon2id"] = get_env(
+        "PASSWORD_HASH_ALGORITHM", "bcrypt"
+    )
+    # Picked offline with: python -m backend.benchmarks.password_hashing
+    PASSWORD_BCRYPT_ROUNDS: int = Field(
+        get_env_int("PASSWORD_BCRYPT_ROUNDS", 12), ge=4, le=31
+    )
+    PASSWORD_ARGON2_TIME_COST: int = get_env_int("PASSWORD_ARGON2_TIME_COST", 3)
+    PASSWORD_ARGON2_MEMORY_KIB: int = get_env_int("PASSWORD_ARGON2_MEMORY_KIB", 65536)
+    PASSWORD_ARGON2_PARALLELISM: int = get_env_int("PASSWORD_ARGON2_PARALLELISM", 1)
+
+    # Image Processing
+    IMAGE_WORKERS: int = get_env_int("IMAGE_WORKERS", 1)
+    IMAGE_MAX_QUEUE: int = get_env_int("IMAGE_MAX_QUEUE", 8)
+
+    # Startup Warm-up
+    WARMUP_ENABLED: bool = get_env_bool("WARMUP_ENABLED", True)
+    WARMUP_TIMEOUT_SECONDS: int = get_env_int("WARMUP_TIMEOUT_SECONDS", 30)
+
+    # Maintenance
+    MAINTENANCE_ENABLED: bool = get_env_bool("MAINTENANCE_ENABLED", True)
+    MAINTENANCE_INTERVAL_SECONDS: int = get_env_int(
+        "MAINTENANCE_INTERVAL_SECONDS", 3600
+    )
+    MAINTENANCE_BATCH_SIZE: int = get_env_int("MAINTENANCE_BATCH_SIZE", 500)
+    MAINTENANCE_BATCH_PAUSE_MS: int = get_env_int("MAINTENANCE_BATCH_PAUSE_MS", 200)
+    MAINTENANCE_UNVERIFIED_USER_DAYS: int = get_env_int(
+        "MAINTENANCE_UNVERIFIED_USER_DAYS", 7
+    )
+    SCHEDULER_LEADER_TTL_SECONDS: int = get_env_int("SCHEDULER_LEADER_TTL_SECONDS", 30)
+
+    # Exports
+    EXPORT_BATCH_SIZE: int = get_env_int("EXPORT_BATCH_SIZE", 1000)
+
     # Tokens Expiration
     PASSWORD_RESET_TOKEN_EXPIRY_HOURS: int = get_env_int(
         "PASSWORD_RESET_TOKEN_EXPIRY_HOURS"
     )
 
-    @computed_field
-    @property
-    def database_uri(self) -> str:
-        """Build the database URL with UTC timezone setting."""
+    def _database_url(self, scheme: str, host: str, port: int) -> str:
+        """Build a database URL with UTC timezone setting."""
         return Url.build(
-            scheme="postgresql",
+            scheme=scheme,
             username=self.POSTGRES_USER,
             password=self.POSTGRES_PASSWORD,
-            host=self.POSTGRES_SERVER,
-            port=self.POSTGRES_PORT,
+            host=host,
+            port=port,
             path=self.POSTGRES_DB,
             query="options=-c timezone=UTC",
         ).unicode_string()
 
+    @computed_field
+    @property
+    def database_uri(self) -> str:
+        """Build the database URL (psycopg 3) for the sync and async engines."""
+        return self._database_url(
+            "postgresql+psycopg", self.POSTGRES_SERVER, self.POSTGRES_PORT
+        )
+
+    @computed_field
+    @property
+    def async_replica_database_uris(self) -> List[str]:
+        """Build async engine URLs for the configured read replicas."""
+        uris = []
+        for server in self.DB_REPLICA_SERVERS.split(","):
+            server = server.strip()
+            if not server:
+                continue
+            host, _, port = server.partition(":")
+            uris.append(
+                self._database_url(
+                    "postgresql+psycopg", host, int(port or self.POSTGRES_PORT)
+                )
+            )
+        return uris
+
 
 # Global settings instance
 settings = Settings()
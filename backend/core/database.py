@@ -1,24 +1,255 @@
 """
 Database connection and session management.
-Provides SQLModel engine configuration and session factory.
+Provides the async engine and session factory used by request handlers, plus
+the synchronous engine kept for scripts and benchmarks. Read-only requests
+are routed to read replicas when any are configured.
 """
 
-from typing import Generator
+import asyncio
+import random
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator, Coroutine, Generator
 
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from .config import settings
+from .deadline import DEADLINE_KEY, request_deadline
+from .pool_metrics import PoolMonitor
 
-# Create database engine
+# Pool and driver settings shared by all engines (each worker process has its own pools)
+ENGINE_OPTIONS = {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+    "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+    "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    "connect_args": {
+        # psycopg 3 prepares queries server-side once they have run this
+        # many times on a connection, e.g. the fixed repository lookups
+        "prepare_threshold": (
+            settings.DB_PREPARE_THRESHOLD
+            if settings.DB_PREPARE_THRESHOLD >= 0
+            else None
+        ),
+    },
+}
+
+async_pool_monitor = PoolMonitor("async")
+sync_pool_monitor = PoolMonitor("sync")
+
+# Create async database engine (psycopg 3)
+async_engine = create_async_engine(
+    settings.database_uri,
+    poolclass=async_pool_monitor.pool_class(AsyncAdaptedQueuePool),
+    **ENGINE_OPTIONS,
+)
+async_pool_monitor.attach(async_engine.sync_engine)
+
+# Create synchronous database engine
 engine = create_engine(
     settings.database_uri,
     future=True,
-    pool_size=10,
-    max_overflow=20,
+    poolclass=sync_pool_monitor.pool_class(QueuePool),
+    **ENGINE_OPTIONS,
 )
+sync_pool_monitor.attach(engine)
+
+# Create async read replica engines (optional)
+replica_pool_monitors = []
+async_replica_engines = []
+for index, uri in enumerate(settings.async_replica_database_uris):
+    monitor = PoolMonitor(f"replica_{index}")
+    replica_engine = create_async_engine(
+        uri,
+        poolclass=monitor.pool_class(AsyncAdaptedQueuePool),
+        **ENGINE_OPTIONS,
+    )
+    monitor.attach(replica_engine.sync_engine)
+    replica_pool_monitors.append(monitor)
+    async_replica_engines.append(replica_engine)
+
+# HTTP methods whose requests only read: they run in READ ONLY transactions
+# and may be served by a replica
+READ_ONLY_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# Primary engine variant whose connections begin READ ONLY transactions
+read_only_engine = async_engine.sync_engine.execution_options(postgresql_readonly=True)
+
+# Session.info key holding post-commit tasks awaited before the session closes
+_AFTER_COMMIT_KEY = "after_commit_tasks"
+
+# Session.info keys for routing
+_READ_ONLY_KEY = "read_only"
+_PRIMARY_KEY = "use_primary"
+_REPLICA_KEY = "replica"
+
+# Session.info key set once the current transaction has flushed changes
+_FLUSHED_KEY = "flushed"
+
+
+class RoutingSession(Session):
+    """
+    Session that runs reads of read-only sessions on a replica, or in a
+    READ ONLY transaction on the primary.
+
+    Writes and flushes make the session writable: they and every later
+    statement use the primary. Sessions marked with ``use_primary`` read from
+    the primary. A session keeps using the same replica, so its reads never
+    go back in time.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs) -> Engine:
+        if (
+            not self.info.get(_READ_ONLY_KEY)
+            or self._flushing
+            or getattr(clause, "is_dml", False)
+        ):
+            self.info[_READ_ONLY_KEY] = False
+            return async_engine.sync_engine
+
+        if async_replica_engines and not self.info.get(_PRIMARY_KEY):
+            if _REPLICA_KEY not in self.info:
+                self.info[_REPLICA_KEY] = random.choice(async_replica_engines)
+            return self.info[_REPLICA_KEY].sync_engine
+
+        return read_only_engine
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flushed(session: Session, flush_context) -> None:
+    """Remember that the transaction has written."""
+    session.info[_FLUSHED_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _clear_flushed(session: Session) -> None:
+    """Start the next transaction without writes."""
+    session.info.pop(_FLUSHED_KEY, None)
+
 
+def use_primary(session: Session) -> None:
+    """Send all further reads of the session to the primary."""
+    session.info[_PRIMARY_KEY] = True
 
-def get_db() -> Generator[Session, None, None]:
-    """Create a new database session."""
+
+async def release_connection(session: AsyncSession) -> None:
+    """
+    Return the session's connection to the pool before slow non-DB work.
+
+    Ends the transaction only if it hasn't written anything; loaded objects
+    stay usable and the next statement checks out a connection again.
+    """
+    if (
+        not session.in_transaction()
+        or session.info.get(_FLUSHED_KEY)
+        or session.new
+        or session.dirty
+        or session.deleted
+    ):
+        return
+    await session.commit()
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Create a new async database session.
+
+    The session checks out a connection on its first statement and returns
+    it when the endpoint is done, before post-commit work runs. Objects are
+    not expired on commit, so responses can be built from them without
+    reloading. Work scheduled with ``run_after_commit`` finishes before the
+    request does. Read-only requests use read-only transactions (see
+    ``RoutingSession``). Transactions run with ``statement_timeout`` set
+    to the request's remaining latency budget (see ``backend.core.deadline``).
+    """
+    async with AsyncSession(
+        async_engine, sync_session_class=RoutingSession, expire_on_commit=False
+    ) as session:
+        session.info[_READ_ONLY_KEY] = request.method in READ_ONLY_METHODS
+        session.info[DEADLINE_KEY] = request_deadline(request)
+        try:
+            yield session
+        finally:
+            await session.close()
+            await _wait_after_commit(session)
+
+
+def get_sync_db() -> Generator[Session, None, None]:
+    """Create a new synchronous database session."""
     with Session(engine) as session:
         yield session
+
+
+@asynccontextmanager
+async def background_session(read_only: bool = False) -> AsyncIterator[AsyncSession]:
+    """
+    Create an async session for work outside requests (scheduled jobs,
+    streamed responses).
+
+    Has no latency budget. Uses the primary, unless ``read_only``: then reads
+    run like those of read-only requests (see ``RoutingSession``). Work
+    scheduled with ``run_after_commit`` finishes before the block exits.
+    """
+    async with AsyncSession(
+        async_engine, sync_session_class=RoutingSession, expire_on_commit=False
+    ) as session:
+        session.info[_READ_ONLY_KEY] = read_only
+        try:
+            yield session
+        finally:
+            await session.close()
+            await _wait_after_commit(session)
+
+
+@asynccontextmanager
+async def pipeline(session: AsyncSession) -> AsyncIterator[None]:
+    """
+    Send the statements flushed inside the block in one round trip.
+
+    Uses psycopg 3 pipeline mode on the primary. Statements are only sent
+    (and errors raised) when the block exits, so it must contain writes
+    whose results aren't read, such as inserts with client-side keys; do the
+    reads they depend on before entering it. Without psycopg 3 it does nothing.
+    """
+    session.info[_READ_ONLY_KEY] = False
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    if not hasattr(driver_connection, "pipeline"):
+        yield
+        return
+
+    async with driver_connection.pipeline():
+        yield
+
+
+async def dispose_engines() -> None:
+    """Close the connection pools of the primary and replica engines."""
+    await async_engine.dispose()
+    for replica_engine in async_replica_engines:
+        await replica_engine.dispose()
+
+
+async def _wait_after_commit(session: AsyncSession) -> None:
+    """Wait for the work the session scheduled with ``run_after_commit``."""
+    tasks = session.info.pop(_AFTER_COMMIT_KEY, None)
+    if tasks:
+        await asyncio.gather(*tasks)
+
+
+def run_after_commit(session: Session, coro: Coroutine) -> None:
+    """
+    Run async work from a session event hook (e.g. ``after_commit``).
+
+    The coroutine starts right away on the running event loop and is awaited
+    when the request's session closes.
+    """
+    task = asyncio.ensure_future(coro)
+    session.info.setdefault(_AFTER_COMMIT_KEY, []).append(task)
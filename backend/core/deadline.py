@@ -0,0 +1,99 @@
+"""
+Request latency budgets.
+Each request gets a deadline (``REQUEST_LATENCY_BUDGET_MS`` unless the route
+declares its own). Every database transaction of the request runs with
+``statement_timeout`` set to the time left, so a slow query gives up its
+connection when the request would have timed out anyway.
+"""
+
+import math
+import time
+from dataclasses import dataclass, field
+
+from fastapi import Request
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from backend.core.config import settings
+from backend.core.exceptions import AppException
+
+# Session.info key holding the request's Deadline
+DEADLINE_KEY = "deadline"
+
+# SQLSTATE of a statement cancelled by statement_timeout (query_canceled)
+QUERY_CANCELED = "57014"
+
+_SET_STATEMENT_TIMEOUT = text("SELECT set_config('statement_timeout', :timeout, true)")
+
+
+class DeadlineExceeded(AppException):
+    """Raised when a request runs out of its latency budget."""
+
+    MESSAGE = "The request took too long. Please try again."
+
+    def __init__(self):
+        super().__init__(self.MESSAGE, status_code=503)
+
+
+@dataclass
+class Deadline:
+    """Latency budget of one request, counted from its first dependency."""
+
+    budget_ms: int
+    started_at: float = field(default_factory=time.monotonic)
+
+    def remaining_ms(self) -> float:
+        """Milliseconds left before the deadline (negative once past it)."""
+        return self.budget_ms - (time.monotonic() - self.started_at) * 1000
+
+
+def request_deadline(request: Request) -> Deadline:
+    """The request's deadline, created with the default budget on first use."""
+    deadline = getattr(request.state, DEADLINE_KEY, None)
+    if deadline is None:
+        deadline = Deadline(budget_ms=settings.REQUEST_LATENCY_BUDGET_MS)
+        setattr(request.state, DEADLINE_KEY, deadline)
+    return deadline
+
+
+def latency_budget(budget_ms: int):
+    """
+    Create a dependency that sets a route's latency budget.
+
+    Args:
+        budget_ms: Time the whole request may take, in milliseconds
+
+    Returns:
+        Dependency for ``dependencies=[Depends(...)]``
+    """
+
+    async def set_latency_budget(request: Request) -> None:
+        request_deadline(request).budget_ms = budget_ms
+
+    return set_latency_budget
+
+
+# Inserted first so it runs before statements._attach_session and the SET
+# isn't counted against the endpoint's statement budget
+@event.listens_for(Session, "after_begin", insert=True)
+def _apply_statement_timeout(session: Session, transaction, connection) -> None:
+    """Limit the transaction's statements to the request's remaining budget."""
+    deadline = session.info.get(DEADLINE_KEY)
+    if deadline is None or connection.dialect.name != "postgresql":
+        return
+
+    remaining_ms = deadline.remaining_ms()
+    if remaining_ms <= 0:
+        raise DeadlineExceeded()
+    connection.execute(
+        _SET_STATEMENT_TIMEOUT, {"timeout": str(math.ceil(remaining_ms))}
+    )
+
+
+@event.listens_for(Engine, "handle_error")
+def _raise_deadline_exceeded(exception_context) -> None:
+    """Turn a statement cancelled by statement_timeout into a 503."""
+    original = exception_context.original_exception
+    if getattr(original, "sqlstate", None) == QUERY_CANCELED:
+        raise DeadlineExceeded() from exception_context.sqlalchemy_exception
@@ -28,6 +28,29 @@ class EmailService:
             ssl._create_default_https_context = ssl._create_unverified_context
 
         self.client = SendGridAPIClient(self.api_key)
+        # Template directory -> Jinja environment (caches compiled templates)
+        self._environments: Dict[Path, Environment] = {}
+
+    def _environment(self, template_dir: Path) -> Environment:
+        """Jinja environment for a template directory, created once."""
+        env = self._environments.get(template_dir)
+        if env is None:
+            env = Environment(loader=FileSystemLoader(str(template_dir)))
+            self._environments[template_dir] = env
+        return env
+
+    def preload_templates(self, template_dir: Path) -> int:
+        """
+        Compile every HTML template in a directory ahead of the first email.
+
+        Returns:
+            Number of templates loaded
+        """
+        env = self._environment(template_dir)
+        names = env.list_templates(extensions=["html"])
+        for name in names:
+            env.get_template(name)
+        return len(names)
 
     def render_template(self, *, path: Path, context: Dict) -> str:
         """
@@ -40,11 +63,7 @@ class EmailService:
         Returns:
             Rendered HTML string
         """
-        template_dir = path.parent
-        template_name = path.name
-
-        env = Environment(loader=FileSystemLoader(str(template_dir)))
-        template = env.get_template(template_name)
+        template = self._environment(path.parent).get_template(path.name)
 
         return template.render(**context)
 
@@ -4,28 +4,29 @@ Provides robust environment variable retrieval with type conversion and validati
 """
 
 import os
+from typing import Optional
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
-def _get_raw_env(key: str) -> str:
+def _get_raw_env(key: str, default: Optional[str] = None) -> str:
     """Get raw environment variable value. Single point for all env retrieval."""
-    value = os.getenv(key)
+    value = os.getenv(key, default)
     if value is None:
         raise ValueError(f"Required environment variable '{key}' is not set")
     return value
 
 
-def get_env(key: str) -> str:
-    """Get required environment variable as string."""
-    return _get_raw_env(key)
+def get_env(key: str, default: Optional[str] = None) -> str:
+    """Get environment variable as string (required unless a default is given)."""
+    return _get_raw_env(key, default)
 
 
-def get_env_bool(key: str) -> bool:
-    """Get required environment variable as boolean-like (true/false/yes/no/1/0)."""
-    val = _get_raw_env(key).lower()
+def get_env_bool(key: str, default: Optional[bool] = None) -> bool:
+    """Get environment variable as boolean-like (true/false/yes/no/1/0)."""
+    val = _get_raw_env(key, None if default is None else str(default)).lower()
     if val in {"true", "yes", "1"}:
         return True
     if val in {"false", "no", "0"}:
@@ -33,9 +34,9 @@ def get_env_bool(key: str) -> bool:
     raise ValueError(f"Environment variable '{key}' must be boolean-like, got: {val}")
 
 
-def get_env_int(key: str) -> int:
-    """Get required environment variable as integer with type conversion."""
-    val = _get_raw_env(key)
+def get_env_int(key: str, default: Optional[int] = None) -> int:
+    """Get environment variable as integer with type conversion."""
+    val = _get_raw_env(key, None if default is None else str(default))
     try:
         return int(val)
     except ValueError:
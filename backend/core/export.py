@@ -0,0 +1,91 @@
+"""
+Streamed CSV and NDJSON exports.
+Rows are read through a server-side cursor and encoded batch by batch as the
+client downloads them, so a worker holds one batch in memory however large
+the table is. The response body is sent after the request's session has
+closed, so exports read in their own read-only session.
+"""
+
+import csv
+import io
+from datetime import date
+from typing import AsyncIterator, Callable, List, Literal, Type
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.database import background_session
+
+ExportFormat = Literal["csv", "ndjson"]
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+# Spreadsheets run cells starting with these as formulas
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+# Reads batches of items through the given session
+Batches = Callable[[AsyncSession], AsyncIterator[List[BaseModel]]]
+
+
+def _csv_cell(value) -> object:
+    """CSV cell for a JSON value, neutralizing text that looks like a formula."""
+    if value is None:
+        return ""
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _csv_rows(rows: List[List]) -> str:
+    """Encode rows as CSV lines."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+def _encode_batch(items: List[BaseModel], format: ExportFormat) -> str:
+    """Encode a batch of items as CSV or NDJSON lines."""
+    if format == "ndjson":
+        return "".join(item.model_dump_json() + "\n" for item in items)
+    return _csv_rows(
+        [
+            [_csv_cell(value) for value in item.model_dump(mode="json").values()]
+            for item in items
+        ]
+    )
+
+
+async def _encode(
+    batches: Batches, fields: List[str], format: ExportFormat
+) -> AsyncIterator[str]:
+    """Read the batches in a new session and encode each one."""
+    if format == "csv":
+        yield _csv_rows([fields])
+
+    async with background_session(read_only=True) as session:
+        async for items in batches(session):
+            yield _encode_batch(items, format)
+
+
+def export_response(
+    batches: Batches, model: Type[BaseModel], format: ExportFormat, name: str
+) -> StreamingResponse:
+    """
+    Stream ``model`` items as a CSV or NDJSON file download.
+
+    Args:
+        batches: Reads the items, one batch at a time, through a session
+        model: Model of the items (its fields are the CSV columns)
+        format: "csv" or "ndjson"
+        name: File name prefix, e.g. "users"
+    """
+    filename = f"{name}-{date.today().isoformat()}.{format}"
+    return StreamingResponse(
+        _encode(batches, list(model.model_fields), format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
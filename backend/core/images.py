@@ -0,0 +1,159 @@
+"""
+Profile picture thumbnails.
+Uploaded pictures are decoded and get square WebP thumbnails
+(``THUMBNAIL_SIZES``) at upload time, in a dedicated process pool with a
+bounded queue, so decoding and resizing never stall the event loop.
+"""
+
+import asyncio
+import io
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
+from PIL import Image, ImageOps
+
+from backend.core.config import settings
+from backend.core.exceptions import AppException
+from backend.core.metrics import metrics
+
+# Edge lengths of the square thumbnails, in pixels
+THUMBNAIL_SIZES = (64, 128, 256)
+
+THUMBNAIL_CONTENT_TYPE = "image/webp"
+
+WEBP_QUALITY = 80
+
+# Pillow formats of the accepted upload types
+FORMATS = {
+    "image/jpeg": "JPEG",
+    "image/png": "PNG",
+    "image/gif": "GIF",
+    "image/webp": "WEBP",
+}
+
+# Refuse to decode larger images (a small file can expand to a huge bitmap)
+MAX_IMAGE_PIXELS = 40_000_000
+
+
+class ImageProcessingBusy(AppException):
+    """Raised when the image processing queue is full."""
+
+    MESSAGE = "Server is busy. Please try again shortly."
+
+    def __init__(self):
+        super().__init__(self.MESSAGE, status_code=503)
+
+
+def thumbnail_variant(size: int) -> str:
+    """Blob variant name of a thumbnail size."""
+    return f"webp_{size}"
+
+
+def _make_thumbnails(data: bytes, content_type: str) -> Optional[Dict[int, bytes]]:
+    """
+    Encode the thumbnails of an image (runs in a pool process).
+
+    Animated images use their first frame. Returns None if the data can't be
+    decoded as an image of ``content_type``.
+    """
+    Image.MAX_IMAGE_PIXELS = MAX_IMAGE_PIXELS
+    try:
+        with Image.open(io.BytesIO(data), formats=[FORMATS[content_type]]) as image:
+            image = ImageOps.exif_transpose(image)
+            has_alpha = image.mode in ("RGBA", "LA", "PA") or (
+                image.mode == "P" and "transparency" in image.info
+            )
+            image = image.convert("RGBA" if has_alpha else "RGB")
+    except (KeyError, OSError, ValueError, Image.DecompressionBombError):
+        return None
+
+    thumbnails = {}
+    for size in THUMBNAIL_SIZES:
+        # Crop to the center square, as avatars are shown in circles
+        thumbnail = ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        thumbnail.save(buffer, "WEBP", quality=WEBP_QUALITY)
+        thumbnails[size] = buffer.getvalue()
+    return thumbnails
+
+
+def _warm_up_worker() -> None:
+    """Load Pillow's format plugins and WebP encoder in a pool process."""
+    Image.init()
+    Image.new("RGB", (1, 1)).save(io.BytesIO(), "WEBP", quality=WEBP_QUALITY)
+
+
+class ImageProcessor:
+    """Makes thumbnails in a process pool."""
+
+    def __init__(self):
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Jobs running or queued in the pool (only touched on the event loop)
+        self._pending = 0
+
+        self._queue_depth = metrics.gauge("images.queue_depth")
+        self._latency = metrics.histogram("images.latency_ms")
+        self._rejected = metrics.counter("images.rejected")
+
+    def start(self) -> None:
+        """Start the image process pool (processes spawn on first use)."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=settings.IMAGE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    async def warm_up(self) -> None:
+        """Spawn every pool process now rather than on the first uploads."""
+        self.start()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(self._executor, _warm_up_worker)
+                for _ in range(settings.IMAGE_WORKERS)
+            )
+        )
+
+    def stop(self) -> None:
+        """Shut down the image process pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def thumbnails(
+        self, data: bytes, content_type: str
+    ) -> Optional[Dict[int, bytes]]:
+        """
+        Make the WebP thumbnails of an image, by size.
+
+        Returns:
+            Thumbnails, or None if the data isn't a decodable image of
+            ``content_type``
+
+        Raises:
+            ImageProcessingBusy: If all workers are busy and the queue is full
+        """
+        capacity = settings.IMAGE_WORKERS + settings.IMAGE_MAX_QUEUE
+        if self._pending >= capacity:
+            self._rejected.inc()
+            raise ImageProcessingBusy()
+
+        self.start()
+        self._pending += 1
+        self._queue_depth.set(self._pending)
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, _make_thumbnails, data, content_type
+            )
+        finally:
+            self._pending -= 1
+            self._queue_depth.set(self._pending)
+            self._latency.observe((time.perf_counter() - start) * 1000)
+
+
+# Global instance
+image_processor = ImageProcessor()
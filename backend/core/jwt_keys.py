@@ -0,0 +1,167 @@
+"""
+Asymmetric JWT signing keys with rotation support.
+Loads Ed25519/ES256 keys from a directory, caches the parsed key objects
+in-process and publishes the public halves as a JWKS document.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from cryptography.hazmat.primitives.serialization import (
+    load_pem_private_key,
+    load_pem_public_key,
+)
+from jwt.algorithms import ECAlgorithm, OKPAlgorithm
+
+from backend.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Algorithms signed with a key pair instead of JWT_SECRET_KEY
+ASYMMETRIC_ALGORITHMS = {"EdDSA", "ES256"}
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    """Parsed key pair (or public key only, for retired keys)."""
+
+    kid: str
+    algorithm: str
+    public_key: object
+    private_key: Optional[object] = None
+
+    def to_jwk(self) -> dict:
+        """Public key in JWK format."""
+        if self.algorithm == "EdDSA":
+            jwk = OKPAlgorithm.to_jwk(self.public_key, as_dict=True)
+        else:
+            jwk = ECAlgorithm.to_jwk(self.public_key, as_dict=True)
+
+        return {**jwk, "kid": self.kid, "alg": self.algorithm, "use": "sig"}
+
+
+def _algorithm_for(key: object) -> str:
+    """Map a key object to its JWT algorithm."""
+    if isinstance(key, (ed25519.Ed25519PrivateKey, ed25519.Ed25519PublicKey)):
+        return "EdDSA"
+    if isinstance(key, (ec.EllipticCurvePrivateKey, ec.EllipticCurvePublicKey)):
+        if key.curve.name == "secp256r1":
+            return "ES256"
+    raise ValueError(f"Unsupported JWT key type: {type(key).__name__}")
+
+
+def _load_key(path: Path) -> SigningKey:
+    """Load a PEM private key, or a public key for verify-only (retired) keys."""
+    data = path.read_bytes()
+    kid = path.name.removesuffix(".pem").removesuffix(".pub")
+
+    if b"PRIVATE KEY" in data:
+        private_key = load_pem_private_key(data, password=None)
+        public_key = private_key.public_key()
+    else:
+        private_key = None
+        public_key = load_pem_public_key(data)
+
+    return SigningKey(
+        kid=kid,
+        algorithm=_algorithm_for(public_key),
+        public_key=public_key,
+        private_key=private_key,
+    )
+
+
+class KeyRing:
+    """
+    Signing and verification keys loaded from ``JWT_KEYS_DIR``.
+
+    Every ``<kid>.pem`` (private) or ``<kid>.pub.pem`` (public, verify-only)
+    file is a verification key; ``JWT_ACTIVE_KID`` selects the signing key.
+    The directory is re-scanned at most every ``JWT_KEYS_RELOAD_SECONDS`` so
+    rotations are picked up without a restart; if a reload fails, the keys
+    already loaded stay in use.
+    """
+
+    def __init__(self):
+        self._keys: Dict[str, SigningKey] = {}
+        # (name, mtime, size) of each key file at the last load
+        self._fingerprint: Optional[Tuple] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether tokens are signed with asymmetric keys."""
+        return settings.JWT_ALGORITHM in ASYMMETRIC_ALGORITHMS
+
+    def _refresh(self) -> None:
+        """Reload keys if any key file changed since the last check."""
+        now = time.monotonic()
+        if self._keys and now - self._checked_at < settings.JWT_KEYS_RELOAD_SECONDS:
+            return
+
+        with self._lock:
+            self._checked_at = now
+            try:
+                self._reload()
+            except (OSError, ValueError) as e:
+                if not self._keys:
+                    raise
+                logger.error(f"JWT key reload failed, keeping loaded keys: {str(e)}")
+
+    def _reload(self) -> None:
+        """Load every key file, unless none changed since the last load."""
+        keys_dir = Path(settings.JWT_KEYS_DIR)
+        # Files replaced in place don't change the directory's mtime
+        files = [(path, path.stat()) for path in sorted(keys_dir.glob("*.pem"))]
+        fingerprint = tuple(
+            (path.name, stat.st_mtime_ns, stat.st_size) for path, stat in files
+        )
+        if fingerprint == self._fingerprint:
+            return
+
+        keys = {}
+        for path, _ in files:
+            key = _load_key(path)
+            keys[key.kid] = key
+
+        if settings.JWT_ACTIVE_KID not in keys:
+            raise ValueError(
+                f"Active JWT key '{settings.JWT_ACTIVE_KID}' not found in {keys_dir}"
+            )
+        if keys[settings.JWT_ACTIVE_KID].private_key is None:
+            raise ValueError(
+                f"Active JWT key '{settings.JWT_ACTIVE_KID}' has no private key"
+            )
+
+        self._keys = keys
+        self._fingerprint = fingerprint
+        logger.info(f"Loaded JWT keys: {', '.join(keys)}")
+
+    @property
+    def active(self) -> SigningKey:
+        """Key used to sign new tokens."""
+        self._refresh()
+        return self._keys[settings.JWT_ACTIVE_KID]
+
+    def get(self, kid: str) -> Optional[SigningKey]:
+        """Verification key by ``kid``, or None if unknown."""
+        self._refresh()
+        return self._keys.get(kid)
+
+    def jwks(self) -> dict:
+        """Public JWKS document for all verification keys."""
+        if not self.enabled:
+            return {"keys": []}
+
+        self._refresh()
+        keys: List[SigningKey] = list(self._keys.values())
+        return {"keys": [key.to_jwk() for key in keys]}
+
+
+# Global instance
+key_ring = KeyRing()
@@ -0,0 +1,90 @@
+"""
+Periodic database maintenance.
+Deletes expired or used password reset tokens, accounts that were never
+verified and profile pictures no user uses any more, in small batches (one
+short transaction each, with a pause in between) so cleanup never holds many
+locks or saturates IO.
+"""
+
+import asyncio
+from datetime import timedelta
+from typing import Awaitable, Callable
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.config import settings
+from backend.core.database import background_session
+from backend.core.scheduler import Scheduler
+from backend.modules.forgot_password.forgot_password import forgot_password_service
+from backend.modules.user.user import user_service
+
+# How long an unreferenced profile picture is kept (an upload in progress
+# may be about to reference it again)
+UNUSED_PICTURE_GRACE = timedelta(days=1)
+
+
+async def in_batches(purge: Callable[[AsyncSession], Awaitable[int]]) -> int:
+    """
+    Run ``purge`` in its own transaction until a batch comes back short.
+
+    Returns:
+        Total number of rows deleted
+    """
+    total = 0
+    while True:
+        async with background_session() as session:
+            deleted = await purge(session)
+            await session.commit()
+        total += deleted
+        if deleted < settings.MAINTENANCE_BATCH_SIZE:
+            return total
+        await asyncio.sleep(settings.MAINTENANCE_BATCH_PAUSE_MS / 1000)
+
+
+async def purge_password_resets() -> int:
+    """Delete expired or used password reset tokens."""
+    return await in_batches(
+        lambda session: forgot_password_service.purge(
+            session, settings.MAINTENANCE_BATCH_SIZE
+        )
+    )
+
+
+async def purge_unverified_users() -> int:
+    """Delete accounts still unverified after the configured number of days."""
+    older_than = timedelta(days=settings.MAINTENANCE_UNVERIFIED_USER_DAYS)
+    return await in_batches(
+        lambda session: user_service.purge_unverified(
+            session, older_than, settings.MAINTENANCE_BATCH_SIZE
+        )
+    )
+
+
+async def purge_profile_pictures() -> int:
+    """Delete stored profile pictures no user has used for a day."""
+    return await in_batches(
+        lambda session: user_service.purge_profile_pictures(
+            session, UNUSED_PICTURE_GRACE, settings.MAINTENANCE_BATCH_SIZE
+        )
+    )
+
+
+# Global instance
+maintenance_scheduler = Scheduler("maintenance")
+
+if settings.MAINTENANCE_ENABLED:
+    maintenance_scheduler.add(
+        "purge_password_resets",
+        settings.MAINTENANCE_INTERVAL_SECONDS,
+        purge_password_resets,
+    )
+    maintenance_scheduler.add(
+        "purge_unverified_users",
+        settings.MAINTENANCE_INTERVAL_SECONDS,
+        purge_unverified_users,
+    )
+    maintenance_scheduler.add(
+        "purge_profile_pictures",
+        settings.MAINTENANCE_INTERVAL_SECONDS,
+        purge_profile_pictures,
+    )
@@ -0,0 +1,142 @@
+"""
+In-process application metrics.
+Provides thread-safe counters, gauges and histograms collected in a global
+registry for admin endpoints.
+"""
+
+import bisect
+import threading
+from typing import Dict, Optional, Sequence
+
+# Default histogram bucket upper bounds, in milliseconds
+DEFAULT_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class Counter:
+    """Monotonically increasing counter."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        """Increment the counter."""
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        """Current counter value."""
+        return self._value
+
+
+class Gauge:
+    """Value that can go up and down (queue depth, pool size)."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._value: float = 0
+
+    def set(self, value: float) -> None:
+        """Set the current value."""
+        self._value = value
+
+    @property
+    def value(self) -> float:
+        """Current gauge value."""
+        return self._value
+
+
+class Histogram:
+    """Distribution of observed values in fixed buckets."""
+
+    def __init__(self, name: str, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        with self._lock:
+            self._counts[bisect.bisect_left(self.buckets, value)] += 1
+            self._count += 1
+            self._sum += value
+            self._max = max(self._max, value)
+
+    def snapshot(self) -> dict:
+        """Count, sum, mean, max and cumulative bucket counts."""
+        with self._lock:
+            counts = list(self._counts)
+            count, total, maximum = self._count, self._sum, self._max
+
+        buckets = {}
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            buckets[f"le_{bound:g}"] = cumulative
+        buckets["le_inf"] = count
+
+        return {
+            "count": count,
+            "sum": round(total, 3),
+            "mean": round(total / count, 3) if count else 0,
+            "max": round(maximum, 3),
+            "buckets": buckets,
+        }
+
+
+class MetricsRegistry:
+    """Registry of named metrics for this worker process."""
+
+    def __init__(self):
+        self._counters: Dict[str, Counter] = {}
+        self._gauges: Dict[str, Gauge] = {}
+        self._histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str) -> Counter:
+        """Get or create a counter by name."""
+        with self._lock:
+            if name not in self._counters:
+                self._counters[name] = Counter(name)
+            return self._counters[name]
+
+    def gauge(self, name: str) -> Gauge:
+        """Get or create a gauge by name."""
+        with self._lock:
+            if name not in self._gauges:
+                self._gauges[name] = Gauge(name)
+            return self._gauges[name]
+
+    def histogram(
+        self, name: str, buckets: Optional[Sequence[float]] = None
+    ) -> Histogram:
+        """Get or create a histogram by name."""
+        with self._lock:
+            if name not in self._histograms:
+                self._histograms[name] = Histogram(name, buckets or DEFAULT_BUCKETS)
+            return self._histograms[name]
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Return current values of all metrics."""
+        with self._lock:
+            counters = list(self._counters.values())
+            gauges = list(self._gauges.values())
+            histograms = list(self._histograms.values())
+
+        return {
+            "counters": {counter.name: counter.value for counter in counters},
+            "gauges": {gauge.name: gauge.value for gauge in gauges},
+            "histograms": {
+                histogram.name: histogram.snapshot() for histogram in histograms
+            },
+        }
+
+
+# Global instance
+metrics = MetricsRegistry()
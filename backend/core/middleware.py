@@ -3,37 +3,68 @@ HTTP middleware components for request/response processing.
 Includes logging, CORS, and other cross-cutting concerns.
 """
 
+import asyncio
 import logging
 
 from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
 
+from backend.core.config import settings
+from backend.core.statements import report_n_plus_one, request_sql_stats
+from backend.core.warmup import warmup
+
 logger = logging.getLogger(__name__)
 
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for request/response logging and timing."""
+    """Middleware for request/response logging and timing (including SQL)."""
 
     async def dispatch(self, request: Request, call_next) -> Response:
         import time
 
         start_time = time.time()
-        response = await call_next(request)
+        with request_sql_stats() as sql:
+            response = await call_next(request)
         process_time = time.time() - start_time
 
         response.headers["X-Process-Time"] = f"{process_time:.4f}"
+        response.headers["X-DB-Statements"] = str(sql.statements)
+        response.headers["X-DB-Time"] = f"{sql.db_time_ms / 1000:.4f}"
 
         # Log request
         status_emoji = "❌ " if response.status_code >= 400 else ""
         logger.info(
             f"{status_emoji}{request.method} {request.url.path} - "
-            f"{response.status_code} - {process_time:.4f}s"
+            f"{response.status_code} - {process_time:.4f}s - "
+            f"{sql.statements} queries in {sql.db_time_ms / 1000:.4f}s"
         )
+        report_n_plus_one(sql, f"{request.method} {request.url.path}")
 
         return response
 
 
+class ReadinessGateMiddleware(BaseHTTPMiddleware):
+    """Hold requests until startup warm-up has finished (except readiness)."""
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        if not warmup.ready and request.url.path != f"{settings.API_PREFIX}/ready":
+            try:
+                await asyncio.wait_for(
+                    warmup.wait(), timeout=settings.WARMUP_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                return JSONResponse(
+                    status_code=503,
+                    content={"detail": "Server is starting. Please try again."},
+                    headers={"Retry-After": "1"},
+                )
+
+        return await call_next(request)
+
+
 def setup_middleware(app: FastAPI) -> None:
     """Setup all middleware for the FastAPI application."""
+    app.add_middleware(ReadinessGateMiddleware)
     app.add_middleware(RequestLoggingMiddleware)
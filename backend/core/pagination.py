@@ -0,0 +1,75 @@
+"""
+Keyset (cursor) pagination.
+Listings are ordered newest first by ``(created_at, id)`` and each page
+continues strictly after the last row of the previous one, so a page costs
+the same index range scan however deep it is (unlike OFFSET). Tables need a
+composite index on ``(created_at, id)``, led by any equality filters.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+from typing import Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy import tuple_
+
+from backend.core.exceptions import InvalidValue
+
+T = TypeVar("T")
+
+# Position of a row in a listing: (created_at, id)
+Cursor = Tuple[datetime, UUID]
+
+
+class Page(BaseModel, Generic[T]):
+    """One page of a listing; pass ``next_cursor`` back to get the next one."""
+
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """Opaque cursor for the position after a row."""
+    raw = f"{created_at.isoformat()}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Cursor]:
+    """
+    Parse a cursor from a request.
+
+    Raises:
+        InvalidValue: If the cursor is malformed
+    """
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidValue("Invalid cursor")
+
+
+def keyset(query, created_at_column, id_column, after: Optional[Cursor], limit: int):
+    """
+    Order a query newest first and fetch one page after ``after``.
+
+    Fetches one extra row, which only tells ``to_page`` whether another page
+    exists.
+    """
+    if after is not None:
+        query = query.where(tuple_(created_at_column, id_column) < tuple_(*after))
+    return query.order_by(created_at_column.desc(), id_column.desc()).limit(limit + 1)
+
+
+def to_page(rows: Sequence, limit: int, to_item: Callable[[object], T]) -> Page[T]:
+    """Build a page from rows fetched with ``keyset``."""
+    items = list(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    return Page(items=[to_item(row) for row in items], next_cursor=next_cursor)
@@ -1,23 +1,197 @@
 """
-Password hashing and verification using bcrypt.
-Provides secure password management for user authentication.
+Password hashing and verification using bcrypt (or argon2id).
+Provides secure password management for user authentication. Request
+handlers hash in a dedicated process pool with a bounded queue, so login
+bursts can't stall the event loop or the shared threadpool.
 """
 
+import asyncio
+import multiprocessing
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional, TypeVar
+
 import bcrypt
 
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+except ImportError:  # argon2-cffi is optional
+    PasswordHasher = None
+
+from backend.core.config import settings
+from backend.core.exceptions import AppException
+from backend.core.metrics import metrics
+
+T = TypeVar("T")
+
+ARGON2_PREFIX = "$argon2"
+
+
+class PasswordHashingBusy(AppException):
+    """Raised when the password hashing queue is full."""
+
+    MESSAGE = "Server is busy. Please try again shortly."
+
+    def __init__(self):
+        super().__init__(self.MESSAGE, status_code=503)
+
+
+def _argon2_hasher() -> "PasswordHasher":
+    """argon2id hasher configured from settings."""
+    if PasswordHasher is None:
+        raise RuntimeError("argon2id password hashing requires argon2-cffi")
+    return PasswordHasher(
+        time_cost=settings.PASSWORD_ARGON2_TIME_COST,
+        memory_cost=settings.PASSWORD_ARGON2_MEMORY_KIB,
+        parallelism=settings.PASSWORD_ARGON2_PARALLELISM,
+    )
+
+
+def _hash_bcrypt(password: str, rounds: int) -> str:
+    """Hash a password with bcrypt at the given cost."""
+    salt = bcrypt.gensalt(rounds=rounds)
+    hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
+    return hashed.decode("utf-8")
+
+
+def _hash_password(password: str) -> str:
+    """Hash a password with the configured policy (runs in a pool process)."""
+    if settings.PASSWORD_HASH_ALGORITHM == "argon2id":
+        return _argon2_hasher().hash(password)
+    return _hash_bcrypt(password, settings.PASSWORD_BCRYPT_ROUNDS)
+
+
+def _check_password(password: str, hashed_password: str) -> bool:
+    """
+    Check a password against a bcrypt or argon2id hash (runs in a pool process).
+
+    The algorithm and its parameters are read from the hash itself.
+    """
+    if hashed_password.startswith(ARGON2_PREFIX):
+        try:
+            return _argon2_hasher().verify(hashed_password, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+
+def _warm_up_worker() -> None:
+    """Load bcrypt in a pool process with a cheap hash."""
+    _hash_bcrypt("warm-up", 4)
+
+
+def time_bcrypt(rounds: int, samples: int = 3) -> float:
+    """Median time in ms to hash a password with bcrypt at the given cost."""
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        _hash_bcrypt("calibration-password", rounds)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate_bcrypt_rounds(
+    target_ms: float, min_rounds: int = 10, max_rounds: int = 16
+) -> int:
+    """
+    Pick the bcrypt cost for a target hash latency on this machine.
+
+    Returns the highest cost (at least ``min_rounds``) whose hash time stays
+    within ``target_ms``.
+    """
+    rounds = min_rounds
+    for candidate in range(min_rounds, max_rounds + 1):
+        if time_bcrypt(candidate) > target_ms:
+            break
+        rounds = candidate
+    return rounds
+
 
 class PasswordManager:
     """Password hashing and verification manager."""
 
-    def get_hash(self, password: str) -> str:
-        """Hash a password with bcrypt."""
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
-        return hashed.decode("utf-8")
+    def __init__(self):
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Jobs running or queued in the pool (only touched on the event loop)
+        self._pending = 0
+
+        self._queue_depth = metrics.gauge("password.queue_depth")
+        self._latency = metrics.histogram("password.latency_ms")
+        self._rejected = metrics.counter("password.rejected")
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Whether a stored hash was made with a different algorithm or cost."""
+        if settings.PASSWORD_HASH_ALGORITHM == "argon2id":
+            if not hashed_password.startswith(ARGON2_PREFIX):
+                return True
+            return _argon2_hasher().check_needs_rehash(hashed_password)
+
+        if not hashed_password.startswith("$2"):
+            return True
+        # bcrypt hashes look like $2b$<cost>$<salt+hash>
+        return int(hashed_password.split("$")[2]) != settings.PASSWORD_BCRYPT_ROUNDS
+
+    async def get_hash_async(self, password: str) -> str:
+        """Hash a password in the process pool."""
+        return await self._run(_hash_password, password)
+
+    async def verify_async(self, password: str, hashed_password: str) -> bool:
+        """Verify a password in the process pool."""
+        return await self._run(_check_password, password, hashed_password)
+
+    def start(self) -> None:
+        """Start the hashing process pool."""
+        # Fail at startup if argon2id is configured without argon2-cffi
+        if settings.PASSWORD_HASH_ALGORITHM == "argon2id":
+            _argon2_hasher()
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    async def warm_up(self) -> None:
+        """Spawn every pool process now rather than on the first logins."""
+        self.start()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(self._executor, _warm_up_worker)
+                for _ in range(settings.PASSWORD_HASH_WORKERS)
+            )
+        )
+
+    def stop(self) -> None:
+        """Shut down the hashing process pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def _run(self, fn: Callable[..., T], *args) -> T:
+        """
+        Run a hashing job in the pool, measuring queue depth and latency.
+
+        Raises:
+            PasswordHashingBusy: If all workers are busy and the queue is full
+        """
+        capacity = settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_MAX_QUEUE
+        if self._pending >= capacity:
+            self._rejected.inc()
+            raise PasswordHashingBusy()
 
-    def verify(self, password: str, hashed_password: str) -> bool:
-        """Verify a password against its hash."""
-        return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+        self.start()
+        self._pending += 1
+        self._queue_depth.set(self._pending)
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+            self._queue_depth.set(self._pending)
+            self._latency.observe((time.perf_counter() - start) * 1000)
 
 
 # Global instance
@@ -0,0 +1,130 @@
+"""
+Database connection pool instrumentation.
+Measures how long requests wait to check out a connection, how many
+connections are in use, idle or in overflow, and how long connections live.
+"""
+
+import time
+from typing import Optional, Type
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from backend.core.metrics import metrics
+
+# Connection lifetime histogram bucket upper bounds, in seconds
+LIFETIME_BUCKETS = (1, 10, 60, 300, 900, 1800, 3600, 7200, 21600)
+
+# ConnectionRecord.info key holding when the DBAPI connection was opened
+_CONNECTED_AT_KEY = "connected_at"
+
+
+class PoolMonitor:
+    """
+    Metrics for one engine's connection pool.
+
+    Metrics are registered as ``db.pool.<name>.*``. Checkout wait includes
+    opening a new connection and the pre-ping, i.e. everything a request
+    waits for before its first statement.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._engine: Optional[Engine] = None
+
+        prefix = f"db.pool.{name}"
+        self._checkout_wait = metrics.histogram(f"{prefix}.checkout_wait_ms")
+        self._lifetime = metrics.histogram(
+            f"{prefix}.connection_lifetime_s", LIFETIME_BUCKETS
+        )
+        self._in_use = metrics.gauge(f"{prefix}.in_use")
+        self._idle = metrics.gauge(f"{prefix}.idle")
+        self._overflow = metrics.gauge(f"{prefix}.overflow")
+        self._opened = metrics.counter(f"{prefix}.connections_opened")
+        self._closed = metrics.counter(f"{prefix}.connections_closed")
+        self._invalidated = metrics.counter(f"{prefix}.connections_invalidated")
+        self._timeouts = metrics.counter(f"{prefix}.checkout_timeouts")
+
+    def pool_class(self, base: Type[QueuePool]) -> Type[QueuePool]:
+        """Subclass of ``base`` that times checkouts (pass as ``poolclass``)."""
+        monitor = self
+
+        class InstrumentedPool(base):
+            def connect(self):
+                start = time.perf_counter()
+                try:
+                    return super().connect()
+                except PoolTimeoutError:
+                    monitor._timeouts.inc()
+                    raise
+                finally:
+                    monitor._checkout_wait.observe((time.perf_counter() - start) * 1000)
+
+        InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+        return InstrumentedPool
+
+    def attach(self, engine: Engine) -> None:
+        """Listen to pool events of a (sync) engine."""
+        self._engine = engine
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "close", self._on_close)
+        event.listen(engine, "close_detached", self._on_close_detached)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def _update_gauges(self) -> None:
+        """Copy the pool's current counts into the gauges."""
+        pool = self._engine.pool
+        self._in_use.set(pool.checkedout())
+        self._idle.set(pool.checkedin())
+        self._overflow.set(max(pool.overflow(), 0))
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        connection_record.info[_CONNECTED_AT_KEY] = time.monotonic()
+        self._opened.inc()
+
+    def _on_checkout(self, dbapi_connection, connection_record, proxy) -> None:
+        self._update_gauges()
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        self._update_gauges()
+
+    def _on_close(self, dbapi_connection, connection_record) -> None:
+        connected_at = connection_record.info.pop(_CONNECTED_AT_KEY, None)
+        self._record_close(connected_at)
+
+    def _on_close_detached(self, dbapi_connection) -> None:
+        self._record_close(None)
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        self._invalidated.inc()
+
+    def _record_close(self, connected_at: Optional[float]) -> None:
+        """Count a closed connection and record how long it lived."""
+        self._closed.inc()
+        if connected_at is not None:
+            self._lifetime.observe(time.monotonic() - connected_at)
+        self._update_gauges()
+
+    def stats(self) -> dict:
+        """Pool configuration, current usage and wait/lifetime distributions."""
+        pool = self._engine.pool
+        return {
+            "size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "timeout_seconds": pool.timeout(),
+            "recycle_seconds": pool._recycle,
+            "pre_ping": pool._pre_ping,
+            "in_use": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "connections_opened": self._opened.value,
+            "connections_closed": self._closed.value,
+            "connections_invalidated": self._invalidated.value,
+            "checkout_timeouts": self._timeouts.value,
+            "checkout_wait_ms": self._checkout_wait.snapshot(),
+            "connection_lifetime_s": self._lifetime.snapshot(),
+        }
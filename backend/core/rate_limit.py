@@ -5,12 +5,12 @@ Provides rate limiting for endpoints using fastapi-limiter with Redis.
 
 from typing import Optional
 
-from fastapi import Request
+from fastapi import HTTPException, Request
 from fastapi_limiter import FastAPILimiter
 from fastapi_limiter.depends import RateLimiter
 from redis import asyncio as aioredis
 
-from backend.core.auth import get_user_id_from_token
+from backend.core.auth import get_request_claims
 from backend.core.config import settings
 from backend.core.exceptions import AppException
 
@@ -33,17 +33,15 @@ async def get_identifier(request: Request) -> str:
 
     Uses user ID if authenticated (from JWT token), otherwise falls back to IP address.
     This ensures authenticated users have per-user limits while unauthenticated
-    requests are limited by IP.
+    requests are limited by IP. Claims are shared with the auth dependencies
+    through request state, so the token is only verified once.
     """
-    auth_header = request.headers.get("Authorization")
-    if auth_header and auth_header.startswith("Bearer "):
-        token = auth_header.split(" ")[1]
-        try:
-            user_id = get_user_id_from_token(token)
-            if user_id:
-                return f"user:{user_id}"
-        except Exception:
-            pass
+    try:
+        claims = get_request_claims(request)
+        if claims:
+            return f"user:{claims.user_id}"
+    except HTTPException:
+        pass
 
     # Fallback to IP address
     forwarded = request.headers.get("X-Forwarded-For")
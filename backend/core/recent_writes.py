@@ -0,0 +1,152 @@
+"""
+Read-your-writes tracking for replica routing.
+Remembers which users had data written in the last few seconds, on every
+worker (kept current through Redis pub/sub), so their reads go to the primary
+until replicas have caught up.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Iterable, Optional
+from uuid import UUID
+
+import redis
+from sqlalchemy import event
+from sqlmodel import Session
+
+from backend.core.config import settings
+from backend.core.database import async_replica_engines, run_after_commit, use_primary
+from backend.core.metrics import metrics
+from backend.core.redis_client import get_redis, subscribe
+from backend.models import User
+
+logger = logging.getLogger(__name__)
+
+WRITES_CHANNEL = "recent_writes"
+
+# Session.info key holding users written in the current transaction
+_PENDING_KEY = "recent_writes"
+
+
+class RecentWrites:
+    """
+    Users whose own writes replicas may not have yet.
+
+    Writes are detected on flush: any changed ``User`` row, or row with a
+    ``user_id`` column, marks that user once the session commits.
+    """
+
+    def __init__(self):
+        # User ID -> monotonic time until which reads go to the primary
+        self._until: Dict[str, float] = {}
+        self._listener: Optional[asyncio.Task] = None
+        self._pinned = metrics.counter("db.read_your_writes.pinned")
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any read replicas are configured."""
+        return bool(async_replica_engines)
+
+    @property
+    def window(self) -> float:
+        """Seconds after a write during which the user reads from the primary."""
+        return settings.DB_READ_YOUR_WRITES_SECONDS
+
+    def is_recent(self, user_id: UUID) -> bool:
+        """Whether the user had data written within the window."""
+        until = self._until.get(str(user_id))
+        if until is None:
+            return False
+        if until < time.monotonic():
+            del self._until[str(user_id)]
+            return False
+        return True
+
+    def pin(self, session: Session, user_id: UUID) -> None:
+        """Route the session to the primary if the user wrote recently."""
+        if self.enabled and self.is_recent(user_id):
+            use_primary(session)
+            self._pinned.inc()
+
+    def apply(self, user_ids: Iterable[str]) -> None:
+        """Record writes on this worker, dropping ones past their window."""
+        now = time.monotonic()
+        for user_id, until in list(self._until.items()):
+            if until < now:
+                del self._until[user_id]
+        for user_id in user_ids:
+            self._until[user_id] = now + self.window
+
+    async def publish(self, user_ids: Iterable[str]) -> None:
+        """Notify other workers of writes."""
+        try:
+            async with get_redis().pipeline() as pipe:
+                for user_id in user_ids:
+                    pipe.publish(WRITES_CHANNEL, user_id)
+                await pipe.execute()
+        except redis.RedisError as e:
+            logger.error(f"Recent writes publish failed: {str(e)}")
+
+    async def start(self) -> None:
+        """Follow writes made on other workers."""
+        if self.enabled and self._listener is None:
+            self._listener = asyncio.create_task(
+                subscribe(WRITES_CHANNEL, self._on_message)
+            )
+
+    async def stop(self) -> None:
+        """Stop following writes."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    def _on_message(self, data: str) -> None:
+        """Record a write made on any worker."""
+        self.apply([data])
+
+    def stats(self) -> dict:
+        """Tracked users and how many sessions were routed to the primary."""
+        return {
+            "enabled": self.enabled,
+            "window_seconds": self.window,
+            "tracked_users": len(self._until),
+            "pinned": self._pinned.value,
+        }
+
+
+# Global instance
+recent_writes = RecentWrites()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_written_users(session: Session, flush_context) -> None:
+    """Collect users whose rows were changed by the flush."""
+    if not recent_writes.enabled:
+        return
+
+    user_ids = session.info.setdefault(_PENDING_KEY, set())
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        user_id = instance.id if isinstance(instance, User) else None
+        user_id = getattr(instance, "user_id", user_id)
+        if user_id is not None:
+            user_ids.add(str(user_id))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_after_commit(session: Session) -> None:
+    """Start the read-your-writes window for users written in the transaction."""
+    user_ids = session.info.pop(_PENDING_KEY, None)
+    if user_ids:
+        recent_writes.apply(user_ids)
+        run_after_commit(session, recent_writes.publish(user_ids))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    """Drop writes of a rolled back transaction."""
+    session.info.pop(_PENDING_KEY, None)
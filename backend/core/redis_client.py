@@ -0,0 +1,67 @@
+"""
+Shared Redis helpers.
+Provides the async client used by request-path helpers (caches, token
+stores) and a resilient pub/sub consumer.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+from redis import asyncio as aioredis
+
+from backend.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[aioredis.Redis] = None
+
+
+def get_redis() -> aioredis.Redis:
+    """Get the lazily created Redis client for this process."""
+    global _client
+    if _client is None:
+        _client = aioredis.from_url(
+            settings.REDIS_URL,
+            encoding="utf-8",
+            decode_responses=True,
+        )
+    return _client
+
+
+async def close_redis() -> None:
+    """Close the Redis client and its connection pool."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def subscribe(
+    channel: str,
+    on_message: Callable[[str], None],
+    on_connect: Optional[Callable[[aioredis.Redis], Awaitable[None]]] = None,
+) -> None:
+    """
+    Consume messages from a pub/sub channel until cancelled.
+
+    Reconnects on failure. ``on_connect`` runs after every (re)subscription so
+    consumers can resynchronize state for messages missed while disconnected.
+    """
+    while True:
+        client = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+        try:
+            async with client.pubsub() as pubsub:
+                await pubsub.subscribe(channel)
+                if on_connect:
+                    await on_connect(client)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        on_message(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Redis subscription to '{channel}' lost: {str(e)}")
+            await asyncio.sleep(1)
+        finally:
+            await client.aclose()
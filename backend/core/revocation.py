@@ -0,0 +1,209 @@
+"""
+Token revocation for issued JWTs.
+Keeps per-user "tokens issued before" cutoffs in Redis and mirrors them in
+memory on every worker (kept current through pub/sub) so checks are O(1).
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Iterable, NamedTuple, Optional
+from uuid import UUID
+
+import redis
+from redis import asyncio as aioredis
+from sqlalchemy import event
+from sqlmodel import Session
+
+from backend.core.config import settings
+from backend.core.database import run_after_commit
+from backend.core.metrics import metrics
+from backend.core.redis_client import get_redis, subscribe
+
+logger = logging.getLogger(__name__)
+
+CUTOFFS_KEY = "token_revocation:users"
+REVOCATION_CHANNEL = "token_revocation"
+
+# Session.info key holding revocations to publish once the transaction commits
+_PENDING_KEY = "token_revocations"
+
+# Minimum seconds between sweeps of expired cutoffs from memory
+PRUNE_INTERVAL_SECONDS = 60
+
+
+class Revocation(NamedTuple):
+    """Tokens for ``user_id`` issued at or before ``cutoff`` are revoked."""
+
+    user_id: str
+    cutoff: float
+    keep_session_id: Optional[str] = None
+
+    def encode(self) -> str:
+        """Serialize for Redis."""
+        return f"{self.user_id}|{self.cutoff}|{self.keep_session_id or ''}"
+
+    @classmethod
+    def decode(cls, data: str) -> "Revocation":
+        """Deserialize from Redis."""
+        user_id, cutoff, keep_session_id = data.split("|")
+        return cls(user_id, float(cutoff), keep_session_id or None)
+
+
+class TokenRevocation:
+    """
+    In-memory mirror of the revocation list.
+
+    ``revoke_user`` signs out every session of a user (optionally keeping the
+    caller's own). Revocations are published after the session commits.
+    """
+
+    def __init__(self):
+        self._cutoffs: Dict[str, Revocation] = {}
+        self._listener: Optional[asyncio.Task] = None
+        self._pruned_at = time.monotonic()
+        self._rejected = metrics.counter("token_revocation.rejected")
+
+    @property
+    def max_token_lifetime(self) -> float:
+        """Longest lifetime of any issued token, in seconds."""
+        return max(
+            settings.JWT_EXPIRE_MINUTES_DELTA * 60,
+            settings.JWT_REFRESH_EXPIRE_DAYS * 86400,
+        )
+
+    def is_revoked(self, payload: dict) -> bool:
+        """Check a decoded token against the in-memory revocation list."""
+        revocation = self._cutoffs.get(payload.get("sub"))
+        if revocation is None:
+            return False
+        if payload.get("iat", 0) > revocation.cutoff:
+            return False
+        if (
+            revocation.keep_session_id
+            and payload.get("sid") == revocation.keep_session_id
+        ):
+            return False
+
+        self._rejected.inc()
+        return True
+
+    def revoke_user(
+        self,
+        session: Session,
+        user_id: UUID,
+        keep_session_id: Optional[str] = None,
+    ) -> None:
+        """
+        Schedule revocation of a user's tokens when the session commits.
+
+        Args:
+            session: Database session of the change that triggers revocation
+            user_id: User whose tokens are revoked
+            keep_session_id: Session (``sid`` claim) that stays signed in
+        """
+        session.info.setdefault(_PENDING_KEY, {})[str(user_id)] = keep_session_id
+
+    def _apply(self, revocation: Revocation) -> None:
+        """Record a revocation locally, keeping the latest cutoff per user."""
+        current = self._cutoffs.get(revocation.user_id)
+        if current is None or current.cutoff < revocation.cutoff:
+            self._cutoffs[revocation.user_id] = revocation
+
+        if time.monotonic() - self._pruned_at >= PRUNE_INTERVAL_SECONDS:
+            self._prune()
+
+    def _prune(self) -> None:
+        """Drop cutoffs older than any token can live; they revoke nothing."""
+        oldest = time.time() - self.max_token_lifetime
+        expired = [
+            user_id
+            for user_id, revocation in self._cutoffs.items()
+            if revocation.cutoff < oldest
+        ]
+        for user_id in expired:
+            del self._cutoffs[user_id]
+        self._pruned_at = time.monotonic()
+
+    def apply(self, revocations: Iterable[Revocation]) -> None:
+        """Apply revocations on this worker."""
+        for revocation in revocations:
+            self._apply(revocation)
+
+    async def publish(self, revocations: Iterable[Revocation]) -> None:
+        """Persist revocations and notify other workers."""
+        try:
+            async with get_redis().pipeline() as pipe:
+                for revocation in revocations:
+                    pipe.hset(CUTOFFS_KEY, revocation.user_id, revocation.encode())
+                    pipe.publish(REVOCATION_CHANNEL, revocation.encode())
+                await pipe.execute()
+        except redis.RedisError as e:
+            logger.error(f"Token revocation publish failed: {str(e)}")
+
+    async def start(self) -> None:
+        """Load the revocation list and follow updates from other workers."""
+        if self._listener is None:
+            self._listener = asyncio.create_task(
+                subscribe(REVOCATION_CHANNEL, self._on_message, self._load)
+            )
+
+    async def stop(self) -> None:
+        """Stop following revocation updates."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    def _on_message(self, data: str) -> None:
+        """Apply a revocation published by any worker."""
+        self._apply(Revocation.decode(data))
+
+    async def _load(self, client: aioredis.Redis) -> None:
+        """Load all revocations from Redis, pruning ones no token can outlive."""
+        oldest = time.time() - self.max_token_lifetime
+        expired = []
+        for user_id, data in (await client.hgetall(CUTOFFS_KEY)).items():
+            revocation = Revocation.decode(data)
+            if revocation.cutoff < oldest:
+                expired.append(user_id)
+            else:
+                self._apply(revocation)
+
+        if expired:
+            await client.hdel(CUTOFFS_KEY, *expired)
+        logger.info(f"Loaded {len(self._cutoffs)} token revocations")
+
+    def stats(self) -> dict:
+        """Revocation list size and rejection count."""
+        return {
+            "users": len(self._cutoffs),
+            "rejected": self._rejected.value,
+        }
+
+
+# Global instance
+token_revocation = TokenRevocation()
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_after_commit(session: Session) -> None:
+    """Publish revocations scheduled in the committed transaction."""
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        now = time.time()
+        revocations = [
+            Revocation(user_id, now, keep_session_id)
+            for user_id, keep_session_id in pending.items()
+        ]
+        token_revocation.apply(revocations)
+        run_after_commit(session, token_revocation.publish(revocations))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    """Drop revocations scheduled in a rolled back transaction."""
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,194 @@
+"""
+In-app periodic job scheduler.
+Every worker runs a scheduler, but only the one holding a Redis lease (the
+leader) runs jobs, so each job runs on exactly one worker at a time. The
+leader renews its lease while it is alive; if it dies, another worker takes
+over once the lease expires.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Optional
+
+import redis
+from redis.exceptions import LockError
+
+from backend.core.config import settings
+from backend.core.metrics import Counter, Histogram, metrics
+from backend.core.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Delay before the first run after becoming leader (lets startup settle)
+FIRST_RUN_DELAY_SECONDS = 60
+
+# How often the run loop checks for due jobs
+TICK_SECONDS = 1.0
+
+# Job duration histogram bucket upper bounds, in milliseconds
+DURATION_BUCKETS = (10, 100, 1000, 5000, 15000, 60000, 300000, 900000)
+
+
+@dataclass
+class Job:
+    """A periodic job and the outcome of its last run."""
+
+    name: str
+    interval_seconds: float
+    # Returns the number of items processed (e.g. rows deleted)
+    run: Callable[[], Awaitable[int]]
+    next_run: float = 0.0
+    runs: Counter = field(init=False)
+    failures: Counter = field(init=False)
+    processed: Counter = field(init=False)
+    duration_ms: Histogram = field(init=False)
+    last_started_at: Optional[str] = None
+    last_duration_ms: Optional[float] = None
+    last_processed: Optional[int] = None
+    last_error: Optional[str] = None
+
+    def __post_init__(self):
+        prefix = f"scheduler.{self.name}"
+        self.runs = metrics.counter(f"{prefix}.runs")
+        self.failures = metrics.counter(f"{prefix}.failures")
+        self.processed = metrics.counter(f"{prefix}.processed")
+        self.duration_ms = metrics.histogram(f"{prefix}.duration_ms", DURATION_BUCKETS)
+
+    def stats(self) -> dict:
+        """Totals and last run of the job."""
+        return {
+            "interval_seconds": self.interval_seconds,
+            "runs": self.runs.value,
+            "failures": self.failures.value,
+            "processed": self.processed.value,
+            "last_started_at": self.last_started_at,
+            "last_duration_ms": self.last_duration_ms,
+            "last_processed": self.last_processed,
+            "last_error": self.last_error,
+        }
+
+
+class Scheduler:
+    """
+    Runs registered jobs on the leader worker.
+
+    Jobs run one at a time, each ``interval_seconds`` after its previous run
+    started. A failing job is logged and retried at its next interval. A job
+    that outlives a lost lease may briefly overlap with the new leader's, so
+    jobs should be safe to run concurrently (e.g. batched deletes).
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._jobs: Dict[str, Job] = {}
+        self._lock = None
+        self._is_leader = False
+        self._tasks: list = []
+        self._leader_changes = metrics.counter(f"scheduler.{name}.leader_acquired")
+
+    @property
+    def is_leader(self) -> bool:
+        """Whether this worker currently runs the jobs."""
+        return self._is_leader
+
+    def add(
+        self, name: str, interval_seconds: float, run: Callable[[], Awaitable[int]]
+    ) -> None:
+        """Register a job."""
+        self._jobs[name] = Job(name=name, interval_seconds=interval_seconds, run=run)
+
+    async def start(self) -> None:
+        """Start leader election and the run loop (if any jobs are registered)."""
+        if not self._jobs or self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._lead()),
+            asyncio.create_task(self._run_jobs()),
+        ]
+
+    async def stop(self) -> None:
+        """Stop running jobs and give up leadership."""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+        if self._is_leader:
+            self._is_leader = False
+            try:
+                await self._lock.release()
+            except (LockError, redis.RedisError):
+                pass
+
+    async def _lead(self) -> None:
+        """Acquire the leader lease and keep renewing it."""
+        ttl = settings.SCHEDULER_LEADER_TTL_SECONDS
+        self._lock = get_redis().lock(f"scheduler:{self.name}:leader", timeout=ttl)
+        while True:
+            try:
+                if self._is_leader:
+                    await self._lock.reacquire()
+                elif await self._lock.acquire(blocking=False):
+                    self._become_leader()
+            except (LockError, redis.RedisError) as e:
+                if self._is_leader:
+                    logger.warning(f"Scheduler '{self.name}' lost leadership: {e}")
+                self._is_leader = False
+            await asyncio.sleep(ttl / 3)
+
+    def _become_leader(self) -> None:
+        """Schedule the first run of every job."""
+        self._is_leader = True
+        self._leader_changes.inc()
+        first_run = time.monotonic() + FIRST_RUN_DELAY_SECONDS
+        for job in self._jobs.values():
+            job.next_run = first_run
+        logger.info(f"Scheduler '{self.name}' is leader on this worker")
+
+    async def _run_jobs(self) -> None:
+        """Run due jobs while this worker is the leader."""
+        while True:
+            for job in self._jobs.values():
+                if self._is_leader and job.next_run <= time.monotonic():
+                    await self._run(job)
+            await asyncio.sleep(TICK_SECONDS)
+
+    async def _run(self, job: Job) -> None:
+        """Run one job, recording its outcome."""
+        start = time.perf_counter()
+        job.next_run = time.monotonic() + job.interval_seconds
+        job.last_started_at = datetime.now().isoformat()
+        job.runs.inc()
+        try:
+            processed = await job.run()
+        except Exception as e:
+            job.failures.inc()
+            job.last_error = str(e)
+            logger.error(f"Scheduled job '{job.name}' failed: {str(e)}")
+            return
+        finally:
+            job.last_duration_ms = round((time.perf_counter() - start) * 1000, 1)
+            job.duration_ms.observe(job.last_duration_ms)
+
+        job.processed.inc(processed)
+        job.last_processed = processed
+        job.last_error = None
+        logger.info(
+            f"Scheduled job '{job.name}' processed {processed} in "
+            f"{job.last_duration_ms}ms"
+        )
+
+    def stats(self) -> dict:
+        """Leadership and per-job run statistics for this worker."""
+        return {
+            "running": bool(self._tasks),
+            "leader": self._is_leader,
+            "jobs": {name: job.stats() for name, job in self._jobs.items()},
+        }
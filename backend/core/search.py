@@ -0,0 +1,55 @@
+"""
+Substring search backed by trigram indexes.
+``contains`` matches rows whose columns contain the term (case-insensitive)
+and ranks them by how closely a word in the column matches it. On Postgres
+the match uses the ``pg_trgm`` GIN indexes (``gin_trgm_ops``) on those
+columns instead of scanning the table. Terms shorter than three characters
+have no trigrams, so they can't use the indexes.
+"""
+
+from typing import Tuple
+
+from sqlalchemy import func, literal, or_
+
+from backend.core.exceptions import InvalidValue
+
+# Shortest term the trigram indexes can serve
+MIN_TERM_LENGTH = 3
+
+
+def search_term(term: str) -> str:
+    """
+    Normalize a search term from a request.
+
+    Raises:
+        InvalidValue: If the term is shorter than ``MIN_TERM_LENGTH``
+    """
+    term = term.strip()
+    if len(term) < MIN_TERM_LENGTH:
+        raise InvalidValue(f"Search term must be at least {MIN_TERM_LENGTH} characters")
+    return term
+
+
+def escape_like(term: str) -> str:
+    """Escape LIKE wildcards so the term matches literally."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def contains(term: str, *columns) -> Tuple:
+    """
+    Filter and rank expressions for a substring search over ``columns``.
+
+    Every matching row is ranked, so results are the best matches but a very
+    common term (e.g. a mail domain) costs more than a rare one. Order by
+    ``rank`` and a unique column so ties come back in a stable order.
+
+    Returns:
+        ``(where, rank)``: rows matching in any column, and their best
+        ``word_similarity`` to the term (higher is closer)
+    """
+    pattern = f"%{escape_like(term)}%"
+    matches = or_(*(column.ilike(pattern, escape="\\") for column in columns))
+    rank = func.greatest(
+        *(func.word_similarity(literal(term), column) for column in columns)
+    )
+    return matches, rank
@@ -0,0 +1,213 @@
+"""
+SQL statement instrumentation.
+Attributes every statement sent to the database to the session that issued
+it, so endpoints can declare and check a statement budget, and to the
+current request, for statement counts, DB time, slow-query logging and N+1
+detection.
+"""
+
+import logging
+import time
+from collections import Counter as ShapeCounter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
+
+from fastapi import Depends
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.config import settings
+from backend.core.database import get_db
+from backend.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Session.info keys
+_COUNT_KEY = "statement_count"
+_PAUSED_KEY = "statement_count_paused"
+
+# Connection.info key pointing at the info dict of the session using it
+_SESSION_INFO_KEY = "session_info"
+
+# Connection.info key holding start times of statements in flight
+_STARTED_KEY = "statement_started"
+
+_budget_exceeded = metrics.counter("sql.statement_budget_exceeded")
+_slow_queries = metrics.counter("sql.slow_queries")
+_n_plus_one = metrics.counter("sql.n_plus_one_detected")
+_statement_latency = metrics.histogram("sql.statement_ms")
+
+
+@dataclass
+class RequestSQLStats:
+    """Statements and database time of one request."""
+
+    statements: int = 0
+    db_time_ms: float = 0.0
+    # Statement text -> executions (only with N+1 detection enabled)
+    shapes: ShapeCounter = field(default_factory=ShapeCounter)
+
+    def repeated_statements(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statements executed at least ``threshold`` times, most repeated first."""
+        return [
+            (statement, count)
+            for statement, count in self.shapes.most_common()
+            if count >= threshold
+        ]
+
+
+_request_stats: ContextVar[Optional[RequestSQLStats]] = ContextVar(
+    "request_sql_stats", default=None
+)
+
+
+@contextmanager
+def request_sql_stats() -> Iterator[RequestSQLStats]:
+    """Collect statistics for statements issued inside the block."""
+    stats = RequestSQLStats()
+    token = _request_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _request_stats.reset(token)
+
+
+def report_n_plus_one(stats: RequestSQLStats, request_name: str) -> None:
+    """Warn about statements a request repeated (likely N+1 queries)."""
+    if not settings.SQL_DETECT_N_PLUS_ONE:
+        return
+
+    for statement, count in stats.repeated_statements(
+        settings.SQL_N_PLUS_ONE_THRESHOLD
+    ):
+        _n_plus_one.inc()
+        logger.warning(
+            f"Possible N+1 in {request_name}: {count} executions of "
+            f"{_shorten(statement)}"
+        )
+
+
+def statement_count(session: Session | AsyncSession) -> int:
+    """Number of statements the session has sent to the database."""
+    return session.info.get(_COUNT_KEY, 0)
+
+
+@contextmanager
+def uncounted(session: Session | AsyncSession) -> Iterator[None]:
+    """Leave statements issued inside the block out of the session's count."""
+    session.info[_PAUSED_KEY] = True
+    try:
+        yield
+    finally:
+        session.info.pop(_PAUSED_KEY, None)
+
+
+def statement_budget(max_statements: int):
+    """
+    Create a dependency that checks an endpoint's statement count.
+
+    Exceeding the budget is logged as an error and counted in
+    ``sql.statement_budget_exceeded``. The user lookup done by the auth
+    dependencies is not counted.
+
+    Args:
+        max_statements: Statements the endpoint is expected to need
+
+    Returns:
+        Dependency for ``dependencies=[Depends(...)]``
+    """
+
+    async def check_statement_budget(session: AsyncSession = Depends(get_db)):
+        yield
+        count = statement_count(session)
+        if count > max_statements:
+            _budget_exceeded.inc()
+            logger.error(
+                f"Statement budget exceeded: {count} statements "
+                f"(budget {max_statements})"
+            )
+
+    return check_statement_budget
+
+
+def _shorten(statement: str, length: int = 300) -> str:
+    """Statement text on one line, truncated for logs."""
+    statement = " ".join(statement.split())
+    return statement if len(statement) <= length else f"{statement[:length]}..."
+
+
+def _redact(parameters, executemany: bool) -> str:
+    """Describe statement parameters by name and type, without values."""
+    if executemany:
+        return f"<{len(parameters)} parameter sets>"
+    if isinstance(parameters, dict):
+        redacted = {key: type(value).__name__ for key, value in parameters.items()}
+        return str(redacted)
+    if isinstance(parameters, (list, tuple)):
+        return str([type(value).__name__ for value in parameters])
+    return "<none>"
+
+
+@event.listens_for(Session, "after_begin")
+def _attach_session(session: Session, transaction, connection) -> None:
+    """Attribute statements on this connection to the session."""
+    connection.info[_SESSION_INFO_KEY] = session.info
+
+
+@event.listens_for(Pool, "checkin")
+def _detach_session(dbapi_connection, connection_record) -> None:
+    """Forget the session when its connection goes back to the pool."""
+    connection_record.info.pop(_SESSION_INFO_KEY, None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    """Count a statement against its session and request, and start timing it."""
+    info = conn.info.get(_SESSION_INFO_KEY)
+    if info is not None and not info.get(_PAUSED_KEY):
+        info[_COUNT_KEY] = info.get(_COUNT_KEY, 0) + 1
+
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        if settings.SQL_DETECT_N_PLUS_ONE:
+            stats.shapes[statement] += 1
+
+    conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    """Record a statement's time and log it if slow."""
+    elapsed_ms = (time.perf_counter() - conn.info[_STARTED_KEY].pop()) * 1000
+    _statement_latency.observe(elapsed_ms)
+
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.db_time_ms += elapsed_ms
+
+    if elapsed_ms >= settings.SQL_SLOW_QUERY_MS:
+        _slow_queries.inc()
+        logger.warning(
+            f"Slow query ({elapsed_ms:.1f}ms): {_shorten(statement)} "
+            f"parameters={_redact(parameters, executemany)}"
+        )
+
+
+# Inserted first: later listeners may raise a replacement exception (e.g.
+# deadline.DeadlineExceeded), which skips the listeners after them
+@event.listens_for(Engine, "handle_error", insert=True)
+def _discard_failed_statement(exception_context) -> None:
+    """Stop timing a statement that raised."""
+    connection = exception_context.connection
+    if connection is not None and connection.info.get(_STARTED_KEY):
+        connection.info[_STARTED_KEY].pop()
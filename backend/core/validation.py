@@ -5,6 +5,7 @@ Provides reusable validators that return True/False.
 
 import base64
 import re
+from typing import Optional, Tuple
 
 # Email validation regex (RFC 5322 simplified)
 EMAIL_REGEX = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
@@ -85,34 +86,46 @@ def is_valid_totp(token: str) -> bool:
     return len(token) == TOTP_TOKEN_LENGTH and token.isdigit()
 
 
-def is_valid_profile_picture(data: str) -> bool:
-    """Validate base64 profile picture data."""
+def parse_image_data_uri(data: str) -> Optional[Tuple[str, bytes]]:
+    """
+    Decode a base64 image data URI (data:image/...;base64,...).
+
+    Returns:
+        ``(content_type, bytes)``, or None if it isn't a valid data URI of an
+        allowed image type
+    """
     if not data or not isinstance(data, str):
-        return False
+        return None
 
     # Check if it's a data URI (data:image/...;base64,...)
     if not data.startswith("data:image/"):
-        return False
+        return None
 
     # Extract mime type and base64 data
     try:
         header, base64_data = data.split(",", 1)
     except ValueError:
-        return False
+        return None
 
     # Validate mime type
     mime_type = header.split(";")[0].replace("data:", "")
     if mime_type not in ALLOWED_IMAGE_TYPES:
-        return False
+        return None
 
     # Validate base64 encoding
     try:
         decoded = base64.b64decode(base64_data, validate=True)
     except Exception:
-        return False
+        return None
 
-    # Check size (decoded)
-    if len(decoded) > MAX_PROFILE_PICTURE_SIZE:
+    return mime_type, decoded
+
+
+def is_valid_profile_picture(data: str) -> bool:
+    """Validate base64 profile picture data."""
+    parsed = parse_image_data_uri(data)
+    if parsed is None:
         return False
 
-    return True
+    # Check size (decoded)
+    return len(parsed[1]) <= MAX_PROFILE_PICTURE_SIZE
@@ -0,0 +1,202 @@
+"""
+Startup warm-up and readiness.
+Pays the first-request costs (database connections, statement compilation,
+Redis connection, email templates, key loading, password and image workers)
+before the worker takes traffic. Requests wait for warm-up to finish.
+"""
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.auth import auth_user_statement
+from backend.core.config import settings
+from backend.core.database import async_engine, async_replica_engines
+from backend.core.email import email_service
+from backend.core.images import image_processor
+from backend.core.jwt_keys import key_ring
+from backend.core.password import password_manager
+from backend.core.redis_client import get_redis
+from backend.modules.forgot_password.db import forgot_password_db
+from backend.modules.two_fa.db import two_fa_db
+from backend.modules.user.db import user_db
+
+logger = logging.getLogger(__name__)
+
+MODULES_DIR = Path(__file__).parent.parent / "modules"
+
+# Lookup values that match no rows
+_NO_USER = UUID(int=0)
+_NO_EMAIL = "warm-up@invalid"
+
+
+async def _fill_pool(engine: AsyncEngine) -> None:
+    """Open ``pool_size`` connections at once and return them to the pool."""
+    results = await asyncio.gather(
+        *(engine.connect() for _ in range(engine.pool.size())),
+        return_exceptions=True,
+    )
+    errors = [result for result in results if isinstance(result, BaseException)]
+    for result in results:
+        if not isinstance(result, BaseException):
+            await result.close()
+    if errors:
+        raise errors[0]
+
+
+async def _compile_statements(engine: AsyncEngine) -> None:
+    """Run the repository lookups once so their compiled SQL is cached."""
+    async with AsyncSession(engine) as session:
+        await user_db.get_by_id(session, _NO_USER)
+        await user_db.get_by_email(session, _NO_EMAIL)
+        await user_db.exists_by_email(session, _NO_EMAIL)
+        await two_fa_db.get_by_user_id(session, _NO_USER)
+        await forgot_password_db.get_by_token_and_user_id(session, "", _NO_USER)
+        await session.exec(auth_user_statement(_NO_USER))
+
+
+async def fill_db_pools() -> None:
+    """Pre-fill the primary and replica connection pools."""
+    await asyncio.gather(
+        *(_fill_pool(engine) for engine in (async_engine, *async_replica_engines))
+    )
+
+
+async def compile_statements() -> None:
+    """Compile the repository statements on every engine."""
+    for engine in (async_engine, *async_replica_engines):
+        await _compile_statements(engine)
+
+
+async def ping_redis() -> None:
+    """Open the shared Redis connection."""
+    await get_redis().ping()
+
+
+async def preload_email_templates() -> None:
+    """Compile the email templates of every module."""
+    for template_dir in sorted(MODULES_DIR.glob("*/email_templates")):
+        email_service.preload_templates(template_dir)
+
+
+async def load_signing_keys() -> None:
+    """Load the JWT signing keys."""
+    if key_ring.enabled:
+        key_ring.get(settings.JWT_ACTIVE_KID)
+
+
+async def start_password_workers() -> None:
+    """Spawn the password hashing processes."""
+    await password_manager.warm_up()
+
+
+async def start_image_workers() -> None:
+    """Spawn the image processes and load Pillow's codecs in them."""
+    await image_processor.warm_up()
+
+
+class Warmup:
+    """
+    Runs the warm-up steps once and tracks readiness.
+
+    Steps run in order; a failing step is logged and skipped. After
+    ``WARMUP_TIMEOUT_SECONDS`` the worker becomes ready regardless, partly
+    warm.
+    """
+
+    STEPS: List[Tuple[str, Callable[[], Awaitable[None]]]] = [
+        ("db_pool", fill_db_pools),
+        ("statements", compile_statements),
+        ("redis", ping_redis),
+        ("email_templates", preload_email_templates),
+        ("signing_keys", load_signing_keys),
+        ("password_workers", start_password_workers),
+        ("image_workers", start_image_workers),
+    ]
+
+    def __init__(self):
+        self._ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._started_at: Optional[float] = None
+        self._duration_ms: Optional[float] = None
+        # Step name -> {"ms": ..., "error": ...}
+        self._steps: Dict[str, dict] = {}
+
+    @property
+    def ready(self) -> bool:
+        """Whether the worker should take traffic."""
+        return self._ready.is_set()
+
+    async def wait(self) -> None:
+        """Wait until warm-up has finished."""
+        await self._ready.wait()
+
+    async def start(self) -> None:
+        """Start warm-up in the background (or become ready immediately)."""
+        if not settings.WARMUP_ENABLED:
+            self._ready.set()
+            return
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel warm-up if it is still running."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        """Run the steps within the timeout, then mark the worker ready."""
+        self._started_at = time.perf_counter()
+        try:
+            await asyncio.wait_for(
+                self._run_steps(), timeout=settings.WARMUP_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Warm-up timed out after {settings.WARMUP_TIMEOUT_SECONDS}s"
+            )
+        finally:
+            self._duration_ms = (time.perf_counter() - self._started_at) * 1000
+            self._ready.set()
+        logger.info(f"Warm-up finished in {self._duration_ms:.0f}ms")
+
+    async def _run_steps(self) -> None:
+        """Run each step, recording its duration and any error."""
+        for name, step in self.STEPS:
+            start = time.perf_counter()
+            error = None
+            try:
+                await step()
+            except Exception as e:
+                error = str(e)
+                logger.warning(f"Warm-up step '{name}' failed: {error}")
+            self._steps[name] = {
+                "ms": round((time.perf_counter() - start) * 1000, 1),
+                "error": error,
+            }
+
+    def stats(self) -> dict:
+        """Readiness and per-step timings."""
+        return {
+            "ready": self.ready,
+            "enabled": settings.WARMUP_ENABLED,
+            "duration_ms": (
+                round(self._duration_ms, 1) if self._duration_ms is not None else None
+            ),
+            "steps": self._steps,
+        }
+
+
+# Global instance
+warmup = Warmup()
@@ -18,7 +18,8 @@ class TOTPService:
     def verify(self, secret: str, token: str, valid_window: int = 1) -> bool:
         """Verify a TOTP token (accepts previous/current/next 30s window)."""
         totp = pyotp.TOTP(secret)
-        return totp.verify(int(token), valid_window=valid_window)
+        # Compare as a string: codes can start with 0
+        return totp.verify(token, valid_window=valid_window)
 
     def generate_uri(self, secret: str, user_email: str) -> str:
         """Generate a provisioning URI for the TOTP."""
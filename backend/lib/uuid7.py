@@ -0,0 +1,54 @@
+"""
+Time-ordered UUIDs (version 7, RFC 9562).
+The first 48 bits are the Unix time in milliseconds, so each key sorts after
+those generated before it and consecutive inserts land on the same index page
+instead of random ones. IDs generated by one process are strictly increasing.
+
+In tables that still hold uuid4 rows, new keys sort below about 99% of them
+(today's prefix is 0x01a1...), so inserts go to a hot spot near the left edge
+of the primary key index. It isn't the rightmost page, so Postgres splits
+pages there 50/50 and leaves them about half full until those uuid4 rows are
+deleted.
+"""
+
+import os
+import threading
+import time
+from uuid import UUID
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+# 12-bit rand_a field used as a counter within one millisecond
+_COUNTER_MAX = 0xFFF
+
+
+def uuid7() -> UUID:
+    """Generate a UUIDv7: 48-bit ms timestamp, 12-bit counter, 62 random bits."""
+    global _last_ms, _counter
+
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            # Start low in the counter space, leaving room to increment
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            # Same millisecond (or the clock went back): keep IDs increasing
+            _counter += 1
+            if _counter > _COUNTER_MAX:
+                _last_ms += 1
+                _counter = 0
+        timestamp_ms = _last_ms
+        counter = _counter
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (
+        (timestamp_ms << 80)
+        | (0x7 << 76)  # version
+        | (counter << 64)
+        | (0b10 << 62)  # variant
+        | rand_b
+    )
+    return UUID(int=value)
@@ -4,16 +4,27 @@ Defines core entities like User, Organization, and their relationships.
 """
 
 from datetime import datetime
-from typing import List, Optional
-from uuid import UUID, uuid4
+from typing import Dict, List, Optional
+from uuid import UUID
 
+from sqlalchemy import Index, text
 from sqlmodel import Field, Relationship, SQLModel
 
+from backend.lib.uuid7 import uuid7
+
+
+def _trigram_index(name: str, column: str) -> Index:
+    """GIN trigram index (Postgres ``pg_trgm``) for substring search on a column."""
+    return Index(
+        name, column, postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"}
+    )
+
 
 class BaseModel(SQLModel):
     """Base model with common fields for all tables."""
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    # Time-ordered, so inserts append to the primary key index
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
 
@@ -26,22 +37,60 @@ class UserBase(SQLModel):
     signup_verified: Optional[datetime] = Field(default=None)
     signup_token: Optional[str] = Field(default=None, max_length=255)
     auth_provider: str = Field(default="sample", max_length=50)
-    profile_picture: Optional[str] = Field(default=None)
+    # Key of the picture in the blob store (its SHA-256)
+    profile_picture_hash: Optional[str] = Field(default=None, max_length=64, index=True)
     is_admin: bool = Field(default=False, nullable=False)
 
 
 class User(UserBase, BaseModel, table=True):
     """User model with authentication and profile data."""
 
+    __table_args__ = (
+        # Keyset pagination of the admin listing (newest first)
+        Index("ix_user_created_at_id", "created_at", "id"),
+        # Unverified accounts: admin listing and maintenance cleanup
+        Index(
+            "ix_user_unverified_created_at",
+            "created_at",
+            "id",
+            postgresql_where=text("signup_verified IS NULL"),
+        ),
+        # Admin search by partial email or name (pg_trgm)
+        _trigram_index("ix_user_email_trgm", "email"),
+        _trigram_index("ix_user_full_name_trgm", "full_name"),
+    )
+
     hashed_password: str = Field(min_length=1, max_length=255)
 
     forgot_password_tokens: List["ForgotPassword"] = Relationship(
         back_populates="user", cascade_delete=True
     )
+    # Joined by default: the user and its 2FA state arrive in one query
+    # (override per query with selectinload(User.two_factor_auth))
     two_factor_auth: Optional["TwoFactorAuth"] = Relationship(
-        back_populates="user", cascade_delete=True
+        back_populates="user",
+        cascade_delete=True,
+        sa_relationship_kwargs={"lazy": "joined"},
     )
 
+    @property
+    def two_fa_enabled(self) -> bool:
+        """Whether the user has 2FA enabled."""
+        return self.two_factor_auth.is_enabled if self.two_factor_auth else False
+
+
+class AuthUser(SQLModel):
+    """
+    Cached auth projection of a user: only what authorization needs.
+
+    Deliberately excludes profile fields and credentials.
+    """
+
+    id: UUID
+    signup_verified: Optional[datetime] = None
+    is_admin: bool = False
+    two_fa_enabled: bool = False
+
 
 class UserPublic(SQLModel):
     """Public user model for API responses."""
@@ -51,7 +100,9 @@ class UserPublic(SQLModel):
     full_name: str
     signup_verified: Optional[datetime]
     auth_provider: str
+    # URLs of the picture and its thumbnails (by size), not their data
     profile_picture: Optional[str]
+    profile_picture_thumbnails: Dict[int, str] = {}
     is_admin: bool
     two_fa_enabled: bool
     pending_2fa: bool = False
@@ -59,6 +110,44 @@ class UserPublic(SQLModel):
     updated_at: datetime
 
 
+class UserSummary(SQLModel):
+    """Admin listing row for a user (no profile picture)."""
+
+    id: UUID
+    email: str
+    full_name: str
+    signup_verified: Optional[datetime]
+    auth_provider: str
+    is_admin: bool
+    two_fa_enabled: bool
+    created_at: datetime
+
+
+class Blob(SQLModel, table=True):
+    """
+    Content-addressed binary data, such as profile pictures.
+
+    Keyed by the SHA-256 of the data, so identical uploads are stored once.
+    Variants derived from a blob (e.g. thumbnails) are keyed by their source
+    and name instead, and are deleted with their source.
+    """
+
+    key: str = Field(primary_key=True, max_length=64)
+    content_type: str = Field(max_length=100)
+    size: int
+    data: bytes
+    source_key: Optional[str] = Field(
+        default=None,
+        max_length=64,
+        foreign_key="blob.key",
+        ondelete="CASCADE",
+        index=True,
+    )
+    variant: Optional[str] = Field(default=None, max_length=50)
+    # Set on every store; unreferenced blobs are purged some time after this
+    last_used_at: datetime = Field(default_factory=datetime.now)
+
+
 class TwoFactorAuthBase(SQLModel):
     """Base two-factor authentication model."""
 
@@ -81,7 +170,7 @@ class ForgotPasswordBase(SQLModel):
     """Base forgot password model."""
 
     token: str = Field(min_length=1, max_length=255, unique=True, index=True)
-    expires_at: datetime
+    expires_at: datetime = Field(index=True)
     used_at: Optional[datetime] = Field(default=None)
 
 
@@ -109,3 +198,19 @@ class BookDemo(BookDemoBase, BaseModel, table=True):
     """Book demo requests from potential customers."""
 
     __tablename__ = "book_demo"
+    __table_args__ = (
+        # Keyset pagination of the admin listing, with and without status
+        Index("ix_book_demo_created_at_id", "created_at", "id"),
+        Index("ix_book_demo_status_created_at_id", "status", "created_at", "id"),
+        # Admin search by partial company name or email (pg_trgm)
+        _trigram_index("ix_book_demo_company_name_trgm", "company_name"),
+        _trigram_index("ix_book_demo_email_trgm", "email"),
+    )
+
+
+class BookDemoPublic(BookDemoBase):
+    """Book demo request for admin listings."""
+
+    id: UUID
+    created_at: datetime
+    updated_at: datetime
@@ -0,0 +1,8 @@
+"""
+Admin module for operational listings.
+Provides paginated views of users and demo requests for administrators.
+"""
+
+from .api import router
+
+__all__ = ["router"]
@@ -0,0 +1,145 @@
+"""
+Admin API endpoints.
+Lists users and demo requests with filters and keyset (cursor) pagination,
+searches them by partial email, name or company, and exports them as
+streamed CSV or NDJSON files.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from backend.api.deps import SessionDep
+from backend.core.auth import get_current_admin
+from backend.core.config import settings
+from backend.core.export import ExportFormat, export_response
+from backend.core.pagination import Page
+from backend.core.search import MIN_TERM_LENGTH
+from backend.core.statements import statement_budget
+from backend.models import BookDemoPublic, UserSummary
+from backend.modules.book_demo.book_demo import book_demo_service
+from backend.modules.user.user import user_service
+
+router = APIRouter(dependencies=[Depends(get_current_admin)])
+
+
+@router.get(
+    "/users",
+    response_model=Page[UserSummary],
+    dependencies=[Depends(statement_budget(1))],
+)
+async def list_users(
+    session: SessionDep,
+    verified: Optional[bool] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=100),
+):
+    """List users newest first; pass ``next_cursor`` as ``cursor`` for more."""
+    return await user_service.list(
+        session,
+        verified=verified,
+        created_from=created_from,
+        created_to=created_to,
+        cursor=cursor,
+        limit=limit,
+    )
+
+
+@router.get(
+    "/users/search",
+    response_model=List[UserSummary],
+    dependencies=[Depends(statement_budget(1))],
+)
+async def search_users(
+    session: SessionDep,
+    q: str = Query(..., min_length=MIN_TERM_LENGTH, max_length=100),
+    limit: int = Query(20, ge=1, le=50),
+):
+    """Find users by partial email or name, best match first."""
+    return await user_service.search(session, q, limit)
+
+
+@router.get("/users/export", response_class=StreamingResponse)
+async def export_users(
+    format: ExportFormat = "csv",
+    verified: Optional[bool] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+):
+    """Download all matching users, oldest first, as CSV or NDJSON."""
+    return export_response(
+        lambda session: user_service.export(
+            session,
+            verified=verified,
+            created_from=created_from,
+            created_to=created_to,
+            batch_size=settings.EXPORT_BATCH_SIZE,
+        ),
+        UserSummary,
+        format,
+        "users",
+    )
+
+
+@router.get(
+    "/book-demos",
+    response_model=Page[BookDemoPublic],
+    dependencies=[Depends(statement_budget(1))],
+)
+async def list_book_demos(
+    session: SessionDep,
+    status: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=100),
+):
+    """List demo requests newest first; pass ``next_cursor`` as ``cursor`` for more."""
+    return await book_demo_service.list(
+        session,
+        status=status,
+        created_from=created_from,
+        created_to=created_to,
+        cursor=cursor,
+        limit=limit,
+    )
+
+
+@router.get(
+    "/book-demos/search",
+    response_model=List[BookDemoPublic],
+    dependencies=[Depends(statement_budget(1))],
+)
+async def search_book_demos(
+    session: SessionDep,
+    q: str = Query(..., min_length=MIN_TERM_LENGTH, max_length=100),
+    limit: int = Query(20, ge=1, le=50),
+):
+    """Find demo requests by partial company name or email, best match first."""
+    return await book_demo_service.search(session, q, limit)
+
+
+@router.get("/book-demos/export", response_class=StreamingResponse)
+async def export_book_demos(
+    format: ExportFormat = "csv",
+    status: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+):
+    """Download all matching demo requests, oldest first, as CSV or NDJSON."""
+    return export_response(
+        lambda session: book_demo_service.export(
+            session,
+            status=status,
+            created_from=created_from,
+            created_to=created_to,
+            batch_size=settings.EXPORT_BATCH_SIZE,
+        ),
+        BookDemoPublic,
+        format,
+        "book-demos",
+    )
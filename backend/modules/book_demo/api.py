@@ -72,13 +72,13 @@ class Message(BaseModel):
 @router.post(
     "/", response_model=Message, dependencies=[Depends(rate_limit(2, hours=1))]
 )
-def create(
+async def create(
     data: BookDemoRequest,
     session: SessionDep,
     background_tasks: BackgroundTasks,
 ):
     """Submit a new demo request."""
-    demo = book_demo_service.create(
+    demo = await book_demo_service.create(
         session,
         name=data.name,
         email=data.email,
@@ -92,6 +92,6 @@ def create(
     )
 
     # Commit
-    session.commit()
+    await session.commit()
 
     return Message(message="Demo request submitted successfully")
@@ -2,9 +2,14 @@
 Service layer for book demo operations.
 """
 
-from sqlmodel import Session
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
 
-from backend.models import BookDemo
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.pagination import Page, decode_cursor, to_page
+from backend.core.search import search_term
+from backend.models import BookDemo, BookDemoPublic
 
 from .db import book_demo_db
 
@@ -12,9 +17,9 @@ from .db import book_demo_db
 class BookDemoService:
     """Service class for book demo business logic."""
 
-    def create(
+    async def create(
         self,
-        session: Session,
+        session: AsyncSession,
         name: str,
         email: str,
         company_name: str,
@@ -33,7 +38,7 @@ class BookDemoService:
         Returns:
             Created BookDemo instance
         """
-        return book_demo_db.create(
+        return await book_demo_db.create(
             session,
             name=name,
             email=email,
@@ -41,6 +46,74 @@ class BookDemoService:
             message=message,
         )
 
+    async def list(
+        self,
+        session: AsyncSession,
+        *,
+        status: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> Page[BookDemoPublic]:
+        """
+        List demo requests newest first, one page at a time.
+
+        Args:
+            session: Database session
+            status: Only requests with this status
+            created_from: Only requests created at or after this time
+            created_to: Only requests created before this time
+            cursor: ``next_cursor`` of the previous page
+            limit: Page size
+
+        Returns:
+            Page of demo requests
+
+        Raises:
+            InvalidValue: If the cursor is malformed
+        """
+        rows = await book_demo_db.list(
+            session,
+            status=status,
+            created_from=created_from,
+            created_to=created_to,
+            after=decode_cursor(cursor),
+            limit=limit,
+        )
+        return to_page(rows, limit, BookDemoPublic.model_validate)
+
+    async def export(
+        self,
+        session: AsyncSession,
+        *,
+        status: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[BookDemoPublic]]:
+        """Yield all matching demo requests oldest first, one batch at a time."""
+        async for rows in book_demo_db.stream(
+            session,
+            status=status,
+            created_from=created_from,
+            created_to=created_to,
+            batch_size=batch_size,
+        ):
+            yield [BookDemoPublic.model_validate(row) for row in rows]
+
+    async def search(
+        self, session: AsyncSession, term: str, limit: int = 20
+    ) -> List[BookDemoPublic]:
+        """
+        Find demo requests by partial company name or email, best match first.
+
+        Raises:
+            InvalidValue: If the term is too short
+        """
+        rows = await book_demo_db.search(session, search_term(term), limit)
+        return [BookDemoPublic.model_validate(row) for row in rows]
+
 
 # Global singleton instance
 book_demo_service = BookDemoService()
@@ -2,21 +2,101 @@
 Database operations for book demo module.
 """
 
-from sqlmodel import Session
+from datetime import datetime
+from typing import AsyncIterator, Optional, Sequence
 
-from backend.models import BookDemo
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.pagination import Cursor, keyset
+from backend.core.search import contains
+from backend.models import BookDemo, BookDemoPublic
+
+# Columns of BookDemoPublic, for reads that skip building ORM objects
+PUBLIC_COLUMNS = [getattr(BookDemo, name) for name in BookDemoPublic.model_fields]
+
+
+def _filter(
+    query,
+    status: Optional[str],
+    created_from: Optional[datetime],
+    created_to: Optional[datetime],
+):
+    """Apply the admin listing filters."""
+    if status is not None:
+        query = query.where(BookDemo.status == status)
+    if created_from is not None:
+        query = query.where(BookDemo.created_at >= created_from)
+    if created_to is not None:
+        query = query.where(BookDemo.created_at < created_to)
+    return query
 
 
 class BookDemoDB:
     """Repository for book demo database operations."""
 
-    def create(self, session: Session, **kwargs) -> BookDemo:
+    async def create(self, session: AsyncSession, **kwargs) -> BookDemo:
         """Create a new book demo request."""
         demo = BookDemo(**kwargs)
         session.add(demo)
-        session.flush()
+        await session.flush()
         return demo
 
+    async def list(
+        self,
+        session: AsyncSession,
+        *,
+        status: Optional[str],
+        created_from: Optional[datetime],
+        created_to: Optional[datetime],
+        after: Optional[Cursor],
+        limit: int,
+    ) -> Sequence[BookDemo]:
+        """
+        List demo requests newest first (keyset pagination).
+
+        Fetches ``limit + 1`` rows; see ``backend.core.pagination``.
+        """
+        query = _filter(select(BookDemo), status, created_from, created_to)
+        query = keyset(query, BookDemo.created_at, BookDemo.id, after, limit)
+        return (await session.exec(query)).all()
+
+    async def stream(
+        self,
+        session: AsyncSession,
+        *,
+        status: Optional[str],
+        created_from: Optional[datetime],
+        created_to: Optional[datetime],
+        batch_size: int,
+    ) -> AsyncIterator[Sequence]:
+        """
+        Yield demo request rows (``BookDemoPublic`` columns) oldest first,
+        ``batch_size`` at a time.
+
+        Reads through a server-side cursor, so only one batch is in memory.
+        """
+        query = _filter(select(*PUBLIC_COLUMNS), status, created_from, created_to)
+        result = await session.stream(
+            query.order_by(BookDemo.created_at, BookDemo.id),
+            execution_options={"yield_per": batch_size},
+        )
+        async for rows in result.partitions():
+            yield rows
+
+    async def search(
+        self, session: AsyncSession, term: str, limit: int
+    ) -> Sequence[BookDemo]:
+        """Find demo requests whose company or email contains ``term``, best first."""
+        where, rank = contains(term, BookDemo.company_name, BookDemo.email)
+        query = (
+            select(BookDemo)
+            .where(where)
+            .order_by(rank.desc(), BookDemo.created_at.desc(), BookDemo.id.desc())
+            .limit(limit)
+        )
+        return (await session.exec(query)).all()
+
 
 # Global singleton instance
 book_demo_db = BookDemoDB()
@@ -60,18 +60,18 @@ class Message(BaseModel):
 @router.post(
     "/", response_model=Message, dependencies=[Depends(rate_limit(3, hours=1))]
 )
-def request(
+async def request(
     data: ForgotPasswordRequest,
     background_tasks: BackgroundTasks,
     session: SessionDep,
 ):
     """Request a password reset and send reset email to user."""
-    user = user_service.get_by_email(session, data.email)
+    user = await user_service.get_by_email(session, data.email)
     if not user:
         return Message(message="Password reset email sent")
 
     # Create token
-    forgot_password = forgot_password_service.create(session, user.id)
+    forgot_password = await forgot_password_service.create(session, user.id)
 
     # Send email
     background_tasks.add_task(
@@ -83,23 +83,23 @@ def request(
     )
 
     # Commit
-    session.commit()
+    await session.commit()
 
     return Message(message="Password reset email sent")
 
 
 @router.post("/verify", response_model=Message)
-def verify(
+async def verify(
     data: ForgotPasswordVerifyRequest,
     session: SessionDep,
     background_tasks: BackgroundTasks,
 ):
     """Verify password reset token and update user's password."""
     # Verify token (raises exception if invalid/expired)
-    forgot_password_service.verify(session, data.token, data.user_id)
+    await forgot_password_service.verify(session, data.token, data.user_id)
 
     # Reset password
-    user = user_service.reset_password(session, data.user_id, data.new_password)
+    user = await user_service.reset_password(session, data.user_id, data.new_password)
 
     # Send success email
     background_tasks.add_task(
@@ -109,6 +109,6 @@ def verify(
     )
 
     # Commit
-    session.commit()
+    await session.commit()
 
     return Message(message="Password reset successfully")
@@ -7,7 +7,8 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlmodel import delete, or_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.models import ForgotPassword
 
@@ -15,9 +16,9 @@ from backend.models import ForgotPassword
 class ForgotPasswordDB:
     """Repository for forgot password database operations."""
 
-    def create(
+    async def create(
         self,
-        session: Session,
+        session: AsyncSession,
         user_id: UUID,
         token: str,
         expires_at: datetime,
@@ -29,12 +30,12 @@ class ForgotPasswordDB:
             expires_at=expires_at,
         )
         session.add(forgot_password)
-        session.flush()
+        await session.flush()
         return forgot_password
 
-    def get_by_token_and_user_id(
+    async def get_by_token_and_user_id(
         self,
-        session: Session,
+        session: AsyncSession,
         token: str,
         user_id: UUID,
     ) -> Optional[ForgotPassword]:
@@ -42,8 +43,28 @@ class ForgotPasswordDB:
         stmt = select(ForgotPassword).where(
             ForgotPassword.token == token, ForgotPassword.user_id == user_id
         )
-        result = session.execute(stmt).scalar_one_or_none()
+        result = (await session.execute(stmt)).scalar_one_or_none()
         return result
 
+    async def delete_expired(
+        self, session: AsyncSession, now: datetime, limit: int
+    ) -> int:
+        """Delete up to ``limit`` expired or used entries; return the count."""
+        ids = (
+            select(ForgotPassword.id)
+            .where(
+                or_(
+                    ForgotPassword.expires_at < now, ForgotPassword.used_at.is_not(None)
+                )
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = delete(ForgotPassword).where(ForgotPassword.id.in_(ids))
+        result = await session.execute(
+            stmt, execution_options={"synchronize_session": False}
+        )
+        return result.rowcount
+
 
 forgot_password_db = ForgotPasswordDB()
@@ -7,7 +7,7 @@ from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
 
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.core.config import settings
 from backend.core.token import token_manager
@@ -20,20 +20,24 @@ from .exceptions import InvalidOrExpiredPasswordResetToken
 class ForgotPasswordService:
     """Service class for forgot password business logic."""
 
-    def create(self, session: Session, user_id: UUID) -> ForgotPassword:
+    async def create(self, session: AsyncSession, user_id: UUID) -> ForgotPassword:
         """Create a forgot password token for the given user ID."""
         token = token_manager.generate_password_reset_token()
         expires_at = datetime.now() + timedelta(
             hours=settings.PASSWORD_RESET_TOKEN_EXPIRY_HOURS
         )
 
-        forgot_password = forgot_password_db.create(session, user_id, token, expires_at)
+        forgot_password = await forgot_password_db.create(
+            session, user_id, token, expires_at
+        )
 
         return forgot_password
 
-    def verify(self, session: Session, token: str, user_id: UUID) -> ForgotPassword:
+    async def verify(
+        self, session: AsyncSession, token: str, user_id: UUID
+    ) -> ForgotPassword:
         """Verify a password reset token and mark it as used."""
-        forgot_password = forgot_password_db.get_by_token_and_user_id(
+        forgot_password = await forgot_password_db.get_by_token_and_user_id(
             session, token, user_id
         )
         if (
@@ -46,9 +50,15 @@ class ForgotPasswordService:
         # Mark token as used
         forgot_password.used_at = datetime.now()
         session.add(forgot_password)
-        session.flush()
+        await session.flush()
 
         return forgot_password
 
+    async def purge(self, session: AsyncSession, batch_size: int) -> int:
+        """Delete one batch of expired or used tokens; return the count."""
+        return await forgot_password_db.delete_expired(
+            session, datetime.now(), batch_size
+        )
+
 
 forgot_password_service = ForgotPasswordService()
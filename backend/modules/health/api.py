@@ -10,9 +10,21 @@ from datetime import datetime
 
 import psutil
 from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
 
 from backend.core.auth import get_current_admin
+from backend.core.cache import user_cache
 from backend.core.config import settings
+from backend.core.database import (
+    async_pool_monitor,
+    replica_pool_monitors,
+    sync_pool_monitor,
+)
+from backend.core.maintenance import maintenance_scheduler
+from backend.core.metrics import metrics
+from backend.core.recent_writes import recent_writes
+from backend.core.revocation import token_revocation
+from backend.core.warmup import warmup
 
 router = APIRouter()
 
@@ -96,9 +108,50 @@ async def check():
             "threads": process.num_threads(),
             "create_time": datetime.fromtimestamp(process.create_time()).isoformat(),
         },
+        "caches": {
+            "user": user_cache.stats(),
+        },
         "application": {
             "api_prefix": settings.API_PREFIX,
             "cors_origins_count": len(settings.cors_origins_list),
             "cors_origins": settings.cors_origins_list,
         },
     }
+
+
+@router.get("/ready")
+async def ready():
+    """Readiness probe: 503 until startup warm-up has finished."""
+    if warmup.ready:
+        return {"status": "ready"}
+    return JSONResponse(status_code=503, content={"status": "starting"})
+
+
+@router.get("/metrics", dependencies=[Depends(get_current_admin)])
+async def get_metrics():
+    """In-process metrics for this worker (counters, cache statistics)."""
+    return {
+        "pid": os.getpid(),
+        "timestamp": datetime.now().isoformat(),
+        **metrics.snapshot(),
+        "caches": {
+            "user": user_cache.stats(),
+        },
+        "token_revocation": token_revocation.stats(),
+        "db_pool": async_pool_monitor.stats(),
+        "read_your_writes": recent_writes.stats(),
+        "warmup": warmup.stats(),
+        "maintenance": maintenance_scheduler.stats(),
+    }
+
+
+@router.get("/db-pool", dependencies=[Depends(get_current_admin)])
+async def get_db_pool():
+    """Connection pool settings, usage and checkout wait for this worker."""
+    return {
+        "pid": os.getpid(),
+        "timestamp": datetime.now().isoformat(),
+        "async": async_pool_monitor.stats(),
+        "sync": sync_pool_monitor.stats(),
+        "replicas": [monitor.stats() for monitor in replica_pool_monitors],
+    }
@@ -0,0 +1,8 @@
+"""
+JWKS module publishing the public JWT verification keys.
+Lets other services verify access tokens locally.
+"""
+
+from .api import router
+
+__all__ = ["router"]
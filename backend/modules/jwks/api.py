@@ -0,0 +1,17 @@
+"""
+JSON Web Key Set endpoint.
+Publishes public verification keys at the standard well-known location.
+"""
+
+from fastapi import APIRouter, Response
+
+from backend.core.jwt_keys import key_ring
+
+router = APIRouter()
+
+
+@router.get("/.well-known/jwks.json", tags=["JWKS"])
+async def get_jwks(response: Response):
+    """Public keys for verifying access tokens (empty for shared-secret signing)."""
+    response.headers["Cache-Control"] = "public, max-age=300"
+    return key_ring.jwks()
@@ -59,6 +59,14 @@ MODULES = [
         prefix="/book-demo",
         tags=["Book Demo"],
     ),
+    ModuleConfig(
+        name="admin",
+        router=lambda: __import__(
+            "backend.modules.admin.api", fromlist=["router"]
+        ).router,
+        prefix="/admin",
+        tags=["Admin"],
+    ),
 ]
 
 
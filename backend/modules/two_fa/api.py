@@ -7,8 +7,10 @@ from fastapi import APIRouter, Depends
 from pydantic import BaseModel, field_validator
 
 from backend.api.deps import CurrentUserAllowUnverifiedDep, CurrentUserDep, SessionDep
-from backend.core.auth import create_access_token
+from backend.core.auth import create_auth_tokens
+from backend.core.deadline import latency_budget
 from backend.core.rate_limit import rate_limit
+from backend.core.statements import statement_budget
 from backend.core.validation import is_valid_totp
 from backend.models import UserPublic
 from backend.modules.two_fa.two_fa import two_fa_service
@@ -43,55 +45,68 @@ class Auth(BaseModel):
     """Authentication response with token and user data."""
 
     access_token: str
+    refresh_token: str | None = None
     user: UserPublic
 
 
-@router.get("/setup", response_model=URL)
-def setup(current_user: CurrentUserDep, session: SessionDep):
+@router.get(
+    "/setup",
+    response_model=URL,
+    dependencies=[Depends(latency_budget(2000)), Depends(statement_budget(1))],
+)
+async def setup(current_user: CurrentUserDep):
     """Get QR code URL for 2FA setup."""
-    url = two_fa_service.get_qr_url(session, current_user.id, current_user.email)
+    user = await current_user.get_user()
+    url = two_fa_service.get_qr_url(user)
 
     return URL(url=url)
 
 
 @router.post("/verify", dependencies=[Depends(rate_limit(5, minutes=15))])
-def verify(
+async def verify(
     request: TwoFactorAuthVerifyRequest,
     current_user: CurrentUserDep,
     session: SessionDep,
 ):
     """Verify 2FA token for a user."""
-    two_fa_service.verify(session, current_user.id, request.totp)
+    await two_fa_service.verify(session, current_user.id, request.totp)
 
-    session.commit()
+    await session.commit()
     return Message(message="2FA verified and activated")
 
 
-@router.post("/verify-code", response_model=Auth)
-def verify_code(
+@router.post(
+    "/verify-code", response_model=Auth, dependencies=[Depends(statement_budget(1))]
+)
+async def verify_code(
     current_user: CurrentUserAllowUnverifiedDep,
     request: TwoFactorAuthVerifyRequest,
-    session: SessionDep,
 ):
     """Verify 2FA code during login and return full JWT token."""
-    # Verify the TOTP code
-    two_fa_service.verify_code(session, current_user.id, request.totp)
+    # Verify the TOTP code (user and 2FA settings arrive in one query)
+    user = await current_user.get_user()
+    two_fa_service.verify_code(user, request.totp)
 
-    # Return new token with pending_2fa=False
-    access_token = create_access_token(current_user.id, pending_2fa=False)
+    # Return new tokens with pending_2fa=False
+    access_token, refresh_token = await create_auth_tokens(
+        user, session_id=current_user.claims.session_id
+    )
 
     return Auth(
         access_token=access_token,
-        user=user_to_public(current_user, pending_2fa=False),
+        refresh_token=refresh_token,
+        user=user_to_public(user, pending_2fa=False),
     )
 
 
 @router.post("/disable")
-def disable(current_user: CurrentUserDep, session: SessionDep):
+async def disable(current_user: CurrentUserDep, session: SessionDep):
     """Disable 2FA for current user."""
-    two_fa_service.disable(session, current_user.id)
+    await two_fa_service.disable(
+        session, current_user.id, keep_session_id=current_user.claims.session_id
+    )
 
     # Commit
-    session.commit()
+    await session.commit()
 
     return Message(message="2FA disabled")
@@ -4,11 +4,15 @@ Handles 2FA setup, verification, and management operations.
 """
 
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from backend.core.cache import user_cache
+from backend.core.revocation import token_revocation
 from backend.lib.totp import totp_service
+from backend.models import User
 
 from .db import two_fa_db
 from .exceptions import InvalidTotpCode, TwoFANotFound
@@ -17,18 +21,18 @@ from .exceptions import InvalidTotpCode, TwoFANotFound
 class TwoFactorAuthService:
     """Service for managing 2FA operations."""
 
-    def get_qr_url(self, session: Session, user_id: UUID, email: str) -> str:
-        """Get QR code URL for 2FA setup."""
-        two_fa = two_fa_db.get_by_user_id(session, user_id)
+    def get_qr_url(self, user: User) -> str:
+        """Get QR code URL for 2FA setup from the user's loaded 2FA settings."""
+        two_fa = user.two_factor_auth
         if not two_fa:
             raise TwoFANotFound()
 
-        url = totp_service.generate_uri(two_fa.totp_secret, email)
+        url = totp_service.generate_uri(two_fa.totp_secret, user.email)
         return url
 
-    def verify(self, session: Session, user_id: UUID, totp: str) -> None:
+    async def verify(self, session: AsyncSession, user_id: UUID, totp: str) -> None:
         """Verify a 2FA token and enable 2FA for user."""
-        two_fa = two_fa_db.get_by_user_id(session, user_id)
+        two_fa = await two_fa_db.get_by_user_id(session, user_id)
         if not two_fa:
             raise TwoFANotFound()
 
@@ -37,15 +41,16 @@ class TwoFactorAuthService:
             raise InvalidTotpCode()
 
         # Enable 2FA
-        two_fa_db.update(
+        await two_fa_db.update(
             session,
             two_fa,
             {"is_enabled": True, "verified_at": datetime.now()},
         )
+        user_cache.invalidate(session, user_id)
 
-    def verify_code(self, session: Session, user_id: UUID, totp: str) -> bool:
-        """Verify a 2FA code for a user (for login)."""
-        two_fa = two_fa_db.get_by_user_id(session, user_id)
+    def verify_code(self, user: User, totp: str) -> bool:
+        """Verify a 2FA code for a user (for login) against their 2FA settings."""
+        two_fa = user.two_factor_auth
         if not two_fa:
             raise TwoFANotFound()
 
@@ -54,18 +59,29 @@ class TwoFactorAuthService:
             raise InvalidTotpCode()
         return True
 
-    def create(self, session: Session, user_id: UUID) -> None:
+    async def create(self, session: AsyncSession, user_id: UUID) -> None:
         """Create 2FA settings for a user with generated secret."""
         secret = totp_service.generate_secret()
-        two_fa_db.create(session, user_id=user_id, secret=secret)
-
-    def disable(self, session: Session, user_id: UUID) -> None:
-        """Disable 2FA for a user."""
-        two_fa = two_fa_db.get_by_user_id(session, user_id)
+        await two_fa_db.create(session, user_id=user_id, secret=secret)
+
+    async def disable(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+        keep_session_id: Optional[str] = None,
+    ) -> None:
+        """
+        Disable 2FA for a user.
+
+        Signs out every other session; ``keep_session_id`` stays signed in.
+        """
+        two_fa = await two_fa_db.get_by_user_id(session, user_id)
         if not two_fa:
             raise TwoFANotFound()
 
-        two_fa_db.update(session, two_fa, {"is_enabled": False})
+        await two_fa_db.update(session, two_fa, {"is_enabled": False})
+        user_cache.invalidate(session, user_id)
+        token_revocation.revoke_user(session, user_id, keep_session_id)
 
 
 two_fa_service = TwoFactorAuthService()
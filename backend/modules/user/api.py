@@ -3,14 +3,23 @@ RESTful API endpoints for user management operations.
 Provides signup, login, verification, and profile management endpoints.
 """
 
-from fastapi import APIRouter, BackgroundTasks, Depends
-from fastapi.security import HTTPAuthorizationCredentials
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response
 from pydantic import BaseModel, field_validator
 
-from backend.api.deps import CurrentUserAllowUnverifiedDep, CurrentUserDep, SessionDep
-from backend.core.auth import create_access_token, get_pending_2fa_from_token, security
+from backend.api.deps import (
+    CurrentClaimsDep,
+    CurrentUserAllowUnverifiedDep,
+    CurrentUserDep,
+    SessionDep,
+)
+from backend.core.auth import create_access_token, create_auth_tokens
+from backend.core.deadline import latency_budget
 from backend.core.exceptions import InvalidEmailFormat, InvalidPasswordFormat
 from backend.core.rate_limit import rate_limit
+from backend.core.statements import statement_budget
 from backend.core.validation import (
     is_valid_email,
     is_valid_full_name,
@@ -21,7 +30,6 @@ from backend.core.validation import (
     normalize_full_name,
 )
 from backend.models import UserPublic
-from backend.modules.two_fa.two_fa import two_fa_service
 
 from .background import send_verification_email_task, send_welcome_email_task
 from .exceptions import (
@@ -30,7 +38,7 @@ from .exceptions import (
     InvalidSignupToken,
     UserAlreadyVerified,
 )
-from .lib import user_to_public
+from .lib import profile_picture_blob_key, user_to_public
 from .user import user_service
 
 router = APIRouter()
@@ -91,6 +99,10 @@ class LoginRequest(BaseModel):
         return normalize_email(v)
 
 
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str
+
+
 class UpdateUserRequest(BaseModel):
     full_name: str | None = None
 
@@ -141,28 +153,28 @@ class Auth(BaseModel):
     """Authentication response with token and user data."""
 
     access_token: str
+    refresh_token: str | None = None
     user: UserPublic
 
 
 @router.post(
-    "/signup", response_model=Auth, dependencies=[Depends(rate_limit(2, hours=24))]
+    "/signup",
+    response_model=Auth,
+    dependencies=[Depends(rate_limit(2, hours=24)), Depends(statement_budget(3))],
 )
-def signup(
+async def signup(
     user_data: SignupRequest,
     session: SessionDep,
     background_tasks: BackgroundTasks,
 ):
     """Sign up a new user and send verification email."""
-    user = user_service.create(
+    user = await user_service.create(
         session,
         email=user_data.email,
         password=user_data.password,
         full_name=user_data.full_name,
     )
 
-    # Create 2FA settings for user
-    two_fa_service.create(session, user.id)
-
     # Send verification email in background
     background_tasks.add_task(
         send_verification_email_task,
@@ -171,14 +183,15 @@ def signup(
         token=user.signup_token,
     )
 
-    # Generate JWT token
-    access_token = create_access_token(user.id)
+    # Generate JWT tokens
+    access_token, refresh_token = await create_auth_tokens(user)
 
     # Commit
-    session.commit()
+    await session.commit()
 
     return Auth(
         access_token=access_token,
+        refresh_token=refresh_token,
         user=user_to_public(user),
     )
 
@@ -188,34 +201,43 @@ def signup(
     response_model=Message,
     dependencies=[Depends(rate_limit(1, minutes=5))],
 )
-def resend_verification(
+async def resend_verification(
     current_user: CurrentUserAllowUnverifiedDep,
     background_tasks: BackgroundTasks,
 ):
     """Resend verification email to unverified user."""
-    if current_user.signup_verified:
+    user = await current_user.get_user()
+    if user.signup_verified:
         raise UserAlreadyVerified()
 
     # Send verification email in background
     background_tasks.add_task(
         send_verification_email_task,
-        email=current_user.email,
-        name=current_user.full_name,
-        token=current_user.signup_token,
+        email=user.email,
+        name=user.full_name,
+        token=user.signup_token,
     )
 
     return Message(message="Verification email sent successfully")
 
 
-@router.post("/verify-signup", response_model=UserPublic)
-def verify_signup(
+@router.post(
+    "/verify-signup",
+    response_model=Auth,
+    dependencies=[Depends(statement_budget(2))],
+)
+async def verify_signup(
     current_user: CurrentUserAllowUnverifiedDep,
     data: VerifySignupRequest,
     session: SessionDep,
     background_tasks: BackgroundTasks,
 ):
-    """Verify current user's signup with 6-digit verification code."""
-    user = user_service.verify_signup(session, current_user.id, data.signup_token)
+    """
+    Verify current user's signup with 6-digit verification code.
+
+    Returns new tokens, as claims-only access tokens carry the verified flag.
+    """
+    user = await user_service.verify_signup(session, current_user.id, data.signup_token)
 
     # Send welcome email in background
     background_tasks.add_task(
@@ -224,86 +246,121 @@ def verify_signup(
         name=user.full_name,
     )
 
+    # Generate JWT tokens for the same login session
+    access_token, refresh_token = await create_auth_tokens(
+        user, session_id=current_user.claims.session_id
+    )
+
     # Commit
-    session.commit()
+    await session.commit()
 
-    return user_to_public(user)
+    return Auth(
+        access_token=access_token,
+        refresh_token=refresh_token,
+        user=user_to_public(user),
+    )
 
 
-@router.post("/login", response_model=Auth)
-def login(data: LoginRequest, session: SessionDep):
+@router.post("/login", response_model=Auth, dependencies=[Depends(statement_budget(2))])
+async def login(data: LoginRequest, session: SessionDep):
     """Login user with email and password."""
-    user = user_service.authenticate(session, data.email, data.password)
+    user = await user_service.authenticate(session, data.email, data.password)
 
     # Check if user has 2FA enabled
-    two_fa_enabled = user.two_factor_auth.is_enabled if user.two_factor_auth else False
+    two_fa_enabled = user.two_fa_enabled
+
+    # Generate JWT tokens
+    access_token, refresh_token = await create_auth_tokens(
+        user, pending_2fa=two_fa_enabled
+    )
 
-    # Generate JWT token
-    access_token = create_access_token(user.id, pending_2fa=two_fa_enabled)
+    # Commit (persists a rehashed password)
+    await session.commit()
 
     return Auth(
         access_token=access_token,
+        refresh_token=refresh_token,
         user=user_to_public(user, pending_2fa=two_fa_enabled),
     )
 
 
-@router.get("/me", response_model=UserPublic)
-def get_me(
-    current_user: CurrentUserAllowUnverifiedDep,
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-):
-    """Get current authenticated user profile (verified or unverified)."""
-    # Extract pending_2fa status from JWT token
-    token = credentials.credentials
-    pending_2fa = get_pending_2fa_from_token(token)
+@router.post(
+    "/refresh-token",
+    response_model=Auth,
+    dependencies=[Depends(rate_limit(10, minutes=1))],
+)
+async def refresh(data: RefreshTokenRequest, session: SessionDep):
+    """Exchange a refresh token for new access and refresh tokens (claims-only mode)."""
+    user, session_id, refresh_token = await user_service.refresh(
+        session, data.refresh_token
+    )
+
+    # Generate JWT token with current authorization claims
+    access_token = create_access_token(user, session_id=session_id)
+
+    return Auth(
+        access_token=access_token,
+        refresh_token=refresh_token,
+        user=user_to_public(user),
+    )
+
 
-    return user_to_public(current_user, pending_2fa=pending_2fa)
+@router.get(
+    "/me",
+    response_model=UserPublic,
+    dependencies=[Depends(latency_budget(2000)), Depends(statement_budget(1))],
+)
+async def get_me(current_user: CurrentUserAllowUnverifiedDep, claims: CurrentClaimsDep):
+    """Get current authenticated user profile (verified or unverified)."""
+    user = await current_user.get_user()
+    return user_to_public(user, pending_2fa=claims.pending_2fa)
 
 
-@router.put("/", response_model=UserPublic)
-def update(
+@router.put("/", response_model=UserPublic, dependencies=[Depends(statement_budget(2))])
+async def update(
     current_user: CurrentUserDep,
     user_data: UpdateUserRequest,
     session: SessionDep,
 ):
     """Update current user's data."""
-    user = user_service.update(
+    user = await user_service.update(
         session, current_user.id, **user_data.model_dump(exclude_unset=True)
     )
 
     # Commit
-    session.commit()
+    await session.commit()
 
     return user_to_public(user)
 
 
 @router.delete("/", response_model=Message)
-def delete(current_user: CurrentUserDep, session: SessionDep):
+async def delete(current_user: CurrentUserDep, session: SessionDep):
     """Delete current user's account."""
-    user_service.delete(session, current_user.id)
+    await user_service.delete(session, current_user.id)
 
     # Commit
-    session.commit()
+    await session.commit()
 
     return Message(message="User deleted successfully")
 
 
 @router.post("/change-password", response_model=Message)
-def change_password(
+async def change_password(
     current_user: CurrentUserDep,
     password_data: ChangePasswordRequest,
     session: SessionDep,
 ):
     """Change current user's password."""
-    user_service.change_password(
+    await user_service.change_password(
         session,
         current_user.id,
         password_data.old_password,
         password_data.new_password,
+        keep_session_id=current_user.claims.session_id,
     )
 
     # Commit
-    session.commit()
+    await session.commit()
 
     return Message(message="Password changed successfully")
 
@@ -311,33 +368,83 @@ def change_password(
 @router.post(
     "/profile-picture",
     response_model=UserPublic,
-    dependencies=[Depends(rate_limit(5, hours=1))],
+    dependencies=[Depends(rate_limit(5, hours=1)), Depends(statement_budget(4))],
 )
-def update_profile_picture(
+async def update_profile_picture(
     current_user: CurrentUserDep,
     data: UpdateProfilePictureRequest,
     session: SessionDep,
 ):
     """Upload or update current user's profile picture."""
-    user = user_service.update_profile_picture(
+    user = await user_service.update_profile_picture(
         session, current_user.id, data.profile_picture
     )
 
     # Commit
-    session.commit()
+    await session.commit()
 
     return user_to_public(user)
 
 
-@router.delete("/profile-picture", response_model=UserPublic)
-def remove_profile_picture(
+@router.delete(
+    "/profile-picture",
+    response_model=UserPublic,
+    dependencies=[Depends(statement_budget(2))],
+)
+async def remove_profile_picture(
     current_user: CurrentUserDep,
     session: SessionDep,
 ):
     """Remove current user's profile picture."""
-    user = user_service.remove_profile_picture(session, current_user.id)
+    user = await user_service.remove_profile_picture(session, current_user.id)
 
     # Commit
-    session.commit()
+    await session.commit()
 
     return user_to_public(user)
+
+
+# Picture URLs change with the picture, so responses can be cached forever
+PROFILE_PICTURE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _if_none_match(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match covers an ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return header.strip() == "*" or etag in (
+        tag.strip().removeprefix("W/") for tag in header.split(",")
+    )
+
+
+@router.get("/{user_id}/profile-picture/{key}", response_class=Response)
+async def get_profile_picture(
+    user_id: UUID,
+    key: str,
+    request: Request,
+    session: SessionDep,
+    size: Optional[int] = None,
+):
+    """
+    Get a user's profile picture, or one of its WebP thumbnails with ``size``
+    (URLs from ``UserPublic``).
+
+    Responses are immutable; revalidating with If-None-Match gets a 304
+    while the picture is still the user's, and a 404 once it isn't.
+    """
+    headers = {"Cache-Control": PROFILE_PICTURE_CACHE_CONTROL}
+
+    # The ETag of the usual response follows from the URL: answer without
+    # loading the picture, once it's known to still be the user's
+    if _if_none_match(request, f'"{profile_picture_blob_key(key, size)}"'):
+        await user_service.check_profile_picture(session, user_id, key)
+        return Response(status_code=304, headers=headers)
+
+    picture = await user_service.get_profile_picture(session, user_id, key, size)
+    headers["ETag"] = f'"{picture.key}"'
+    if _if_none_match(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=picture.data, media_type=picture.content_type, headers=headers
+    )
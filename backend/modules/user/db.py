@@ -4,29 +4,66 @@ Provides CRUD operations for user entities in the database.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, List, Optional, Sequence
 from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlmodel import delete, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from backend.models import User
+from backend.core.pagination import Cursor, keyset
+from backend.core.search import contains
+from backend.models import ForgotPassword, TwoFactorAuth, User
+
+
+def _summary_query():
+    """Select the ``UserSummary`` columns, with the 2FA flag joined in."""
+    return select(
+        User.id,
+        User.email,
+        User.full_name,
+        User.signup_verified,
+        User.auth_provider,
+        User.is_admin,
+        TwoFactorAuth.is_enabled,
+        User.created_at,
+    ).outerjoin(TwoFactorAuth, TwoFactorAuth.user_id == User.id)
+
+
+def _filter(
+    query,
+    verified: Optional[bool],
+    created_from: Optional[datetime],
+    created_to: Optional[datetime],
+):
+    """Apply the admin listing filters."""
+    if verified is not None:
+        query = query.where(
+            User.signup_verified.is_not(None)
+            if verified
+            else User.signup_verified.is_(None)
+        )
+    if created_from is not None:
+        query = query.where(User.created_at >= created_from)
+    if created_to is not None:
+        query = query.where(User.created_at < created_to)
+    return query
 
 
 class UserDB:
     """Repository for user database operations."""
 
-    def get_by_id(self, session: Session, user_id: UUID) -> Optional[User]:
-        """Get user by ID."""
-        return session.get(User, user_id)
+    async def get_by_id(self, session: AsyncSession, user_id: UUID) -> Optional[User]:
+        """Get user by ID (2FA settings joined in the same query)."""
+        return await session.get(User, user_id)
 
-    def get_by_email(self, session: Session, email: str) -> Optional[User]:
-        """Get user by email address."""
+    async def get_by_email(self, session: AsyncSession, email: str) -> Optional[User]:
+        """Get user by email address (2FA settings joined in the same query)."""
         query = select(User).where(User.email == email)
-        return session.exec(query).first()
+        return (await session.exec(query)).first()
 
-    def create(
+    async def create(
         self,
-        session: Session,
+        session: AsyncSession,
         email: str,
         full_name: str,
         hashed_password: str,
@@ -43,27 +80,125 @@ class UserDB:
             signup_token=signup_token,
             auth_provider=auth_provider,
         )
+        # A new user has no 2FA row yet; mark it loaded to avoid a lazy load
+        user.two_factor_auth = None
         session.add(user)
-        session.flush()
+        await session.flush()
         return user
 
-    def update(self, session: Session, user: User, user_data: dict) -> User:
+    async def update(self, session: AsyncSession, user: User, user_data: dict) -> User:
         """Update existing user object."""
         for key, value in user_data.items():
             setattr(user, key, value)
         user.updated_at = datetime.now()
-        session.flush()
+        await session.flush()
         return user
 
-    def delete(self, session: Session, user: User) -> None:
+    async def delete(self, session: AsyncSession, user: User) -> None:
         """Delete existing user object."""
-        session.delete(user)
-        session.flush()
+        await session.delete(user)
+        await session.flush()
 
-    def exists_by_email(self, session: Session, email: str) -> bool:
+    async def exists_by_email(self, session: AsyncSession, email: str) -> bool:
         """Check if user exists by email."""
         query = select(User.id).where(User.email == email)
-        return session.exec(query).first() is not None
+        return (await session.exec(query)).first() is not None
+
+    async def has_profile_picture(
+        self, session: AsyncSession, user_id: UUID, key: str
+    ) -> bool:
+        """Check if a user's current profile picture has the given blob key."""
+        query = select(User.id).where(
+            User.id == user_id, User.profile_picture_hash == key
+        )
+        return (await session.exec(query)).first() is not None
+
+    async def list(
+        self,
+        session: AsyncSession,
+        *,
+        verified: Optional[bool],
+        created_from: Optional[datetime],
+        created_to: Optional[datetime],
+        after: Optional[Cursor],
+        limit: int,
+    ) -> Sequence:
+        """
+        List users newest first (keyset pagination), as summary rows.
+
+        Fetches ``limit + 1`` rows; see ``backend.core.pagination``.
+        """
+        query = _filter(_summary_query(), verified, created_from, created_to)
+        query = keyset(query, User.created_at, User.id, after, limit)
+        return (await session.exec(query)).all()
+
+    async def stream(
+        self,
+        session: AsyncSession,
+        *,
+        verified: Optional[bool],
+        created_from: Optional[datetime],
+        created_to: Optional[datetime],
+        batch_size: int,
+    ) -> AsyncIterator[Sequence]:
+        """
+        Yield summary rows oldest first, ``batch_size`` at a time.
+
+        Reads through a server-side cursor, so only one batch is in memory.
+        """
+        query = _filter(_summary_query(), verified, created_from, created_to)
+        result = await session.stream(
+            query.order_by(User.created_at, User.id),
+            execution_options={"yield_per": batch_size},
+        )
+        async for rows in result.partitions():
+            yield rows
+
+    async def search(self, session: AsyncSession, term: str, limit: int) -> Sequence:
+        """
+        Find users whose email or name contains ``term``, best match first,
+        as summary rows.
+        """
+        where, rank = contains(term, User.email, User.full_name)
+        query = (
+            _summary_query()
+            .where(where)
+            .order_by(rank.desc(), User.created_at.desc(), User.id.desc())
+            .limit(limit)
+        )
+        return (await session.exec(query)).all()
+
+    async def delete_unverified(
+        self, session: AsyncSession, created_before: datetime, limit: int
+    ) -> List[UUID]:
+        """
+        Delete up to ``limit`` unverified users created before a cutoff.
+
+        Their 2FA settings and reset tokens are deleted with them. Rows
+        locked by other transactions are skipped.
+
+        Returns:
+            IDs of the deleted users
+        """
+        query = (
+            select(User.id)
+            .where(User.signup_verified.is_(None), User.created_at < created_before)
+            .order_by(User.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        user_ids = list((await session.exec(query)).all())
+        if not user_ids:
+            return []
+
+        options = {"synchronize_session": False}
+        for stmt in (
+            delete(TwoFactorAuth).where(TwoFactorAuth.user_id.in_(user_ids)),
+            delete(ForgotPassword).where(ForgotPassword.user_id.in_(user_ids)),
+            delete(User).where(User.id.in_(user_ids)),
+        ):
+            await session.execute(stmt, execution_options=options)
+        return user_ids
 
 
 # Global instance
@@ -89,3 +89,12 @@ class InvalidProfilePicture(AppException):
 
     def __init__(self):
         super().__init__(self.MESSAGE, status_code=400)
+
+
+class ProfilePictureNotFound(AppException):
+    """Raised when a profile picture doesn't exist (or was replaced)."""
+
+    MESSAGE = "Profile picture not found"
+
+    def __init__(self):
+        super().__init__(self.MESSAGE, status_code=404)
@@ -3,22 +3,51 @@ User module utility functions.
 Provides helper functions for user-related operations and transformations.
 """
 
+from typing import Dict, Optional
+
+from backend.core.blob_store import variant_key
+from backend.core.config import settings
+from backend.core.images import THUMBNAIL_SIZES, thumbnail_variant
 from backend.models import User, UserPublic
 
 
+def profile_picture_url(user: User) -> Optional[str]:
+    """URL of the user's profile picture; it changes with the picture."""
+    if not user.profile_picture_hash:
+        return None
+    return (
+        f"{settings.API_PREFIX}/user/{user.id}/profile-picture/"
+        f"{user.profile_picture_hash}"
+    )
+
+
+def profile_picture_thumbnail_urls(user: User) -> Dict[int, str]:
+    """URLs of the user's profile picture thumbnails, by size."""
+    url = profile_picture_url(user)
+    if not url:
+        return {}
+    return {size: f"{url}?size={size}" for size in THUMBNAIL_SIZES}
+
+
+def profile_picture_blob_key(key: str, size: Optional[int] = None) -> str:
+    """Blob key of a profile picture, or of its thumbnail of ``size`` px."""
+    if size is None:
+        return key
+    return variant_key(key, thumbnail_variant(size))
+
+
 def user_to_public(user: User, pending_2fa: bool = False) -> UserPublic:
     """Convert User model to UserPublic with 2FA status."""
-    two_fa_enabled = user.two_factor_auth.is_enabled if user.two_factor_auth else False
-
     return UserPublic(
         id=user.id,
         email=user.email,
         full_name=user.full_name,
         signup_verified=user.signup_verified,
         auth_provider=user.auth_provider,
-        profile_picture=user.profile_picture,
+        profile_picture=profile_picture_url(user),
+        profile_picture_thumbnails=profile_picture_thumbnail_urls(user),
         is_admin=user.is_admin,
-        two_fa_enabled=two_fa_enabled,
+        two_fa_enabled=user.two_fa_enabled,
         pending_2fa=pending_2fa,
         created_at=user.created_at,
         updated_at=user.updated_at,
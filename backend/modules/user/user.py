@@ -3,75 +3,110 @@ User service layer for business logic implementation.
 Handles user creation, authentication, and management operations.
 """
 
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
 
-from sqlmodel import Session
-
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core.auth import rotate_refresh_token
+from backend.core.blob_store import blob_store, variant_key
+from backend.core.cache import user_cache
+from backend.core.database import pipeline, release_connection, use_primary
+from backend.core.exceptions import InvalidValue
+from backend.core.images import (
+    THUMBNAIL_CONTENT_TYPE,
+    THUMBNAIL_SIZES,
+    image_processor,
+    thumbnail_variant,
+)
+from backend.core.pagination import Page, decode_cursor, to_page
 from backend.core.password import password_manager
+from backend.core.revocation import token_revocation
+from backend.core.search import search_term
 from backend.core.token import token_manager
-from backend.models import User
+from backend.core.validation import parse_image_data_uri
+from backend.models import Blob, User, UserSummary
+from backend.modules.two_fa.two_fa import two_fa_service
 
 from .db import user_db
 from .exceptions import (
     EmailAlreadyExists,
     InvalidCredentials,
     InvalidPasswordChange,
+    InvalidProfilePicture,
     InvalidVerificationCode,
+    ProfilePictureNotFound,
     UserAlreadyVerified,
     UserNotFound,
 )
 
 
+def _to_summary(row) -> UserSummary:
+    """Build a UserSummary from a ``user_db.list``, ``stream`` or ``search`` row."""
+    return UserSummary(
+        id=row.id,
+        email=row.email,
+        full_name=row.full_name,
+        signup_verified=row.signup_verified,
+        auth_provider=row.auth_provider,
+        is_admin=row.is_admin,
+        two_fa_enabled=bool(row.is_enabled),
+        created_at=row.created_at,
+    )
+
+
 class UserService:
     """Service class for user business logic."""
 
-    def get(self, session: Session, user_id: UUID) -> Optional[User]:
+    async def get(self, session: AsyncSession, user_id: UUID) -> Optional[User]:
         """Get user by ID."""
-        return user_db.get_by_id(session, user_id)
+        return await user_db.get_by_id(session, user_id)
 
-    def get_by_email(self, session: Session, email: str) -> Optional[User]:
+    async def get_by_email(self, session: AsyncSession, email: str) -> Optional[User]:
         """Get user by email (returns full user for auth)."""
-        return user_db.get_by_email(session, email)
+        return await user_db.get_by_email(session, email)
 
-    def exists_by_email(self, session: Session, email: str) -> bool:
+    async def exists_by_email(self, session: AsyncSession, email: str) -> bool:
         """Check if a user exists by email."""
-        return user_db.exists_by_email(session, email)
+        return await user_db.exists_by_email(session, email)
 
-    def create(
+    async def create(
         self,
-        session: Session,
+        session: AsyncSession,
         email: str,
         password: str,
         full_name: str,
     ) -> User:
-        """Create a new user with signup verification."""
+        """Create a new user with signup verification and 2FA settings."""
         # Check if user already exists
-        if user_db.exists_by_email(session, email):
+        if await user_db.exists_by_email(session, email):
             raise EmailAlreadyExists(email)
 
-        # Hash password
-        hashed_password = password_manager.get_hash(password)
+        # Hash password (without holding a connection)
+        await release_connection(session)
+        hashed_password = await password_manager.get_hash_async(password)
 
         # Generate signup token
         signup_token = token_manager.generate_signup_token()
 
-        # Create user
-        user = user_db.create(
-            session,
-            email=email,
-            full_name=full_name,
-            hashed_password=hashed_password,
-            signup_verified=None,
-            signup_token=signup_token,
-        )
+        # Create user and 2FA settings in one round trip
+        async with pipeline(session):
+            user = await user_db.create(
+                session,
+                email=email,
+                full_name=full_name,
+                hashed_password=hashed_password,
+                signup_verified=None,
+                signup_token=signup_token,
+            )
+            await two_fa_service.create(session, user.id)
 
         return user
 
-    def create_oauth(
+    async def create_oauth(
         self,
-        session: Session,
+        session: AsyncSession,
         email: str,
         full_name: str,
         auth_provider: str,
@@ -81,15 +116,16 @@ class UserService:
         These users are pre-verified since they come from trusted providers.
         """
         # Check if user already exists
-        if user_db.exists_by_email(session, email):
+        if await user_db.exists_by_email(session, email):
             raise ValueError(f"User with email {email} already exists")
 
         # Generate random password
         random_password = token_manager.generate_password()
-        hashed_password = password_manager.get_hash(random_password)
+        await release_connection(session)
+        hashed_password = await password_manager.get_hash_async(random_password)
 
         # Create user
-        user = user_db.create(
+        user = await user_db.create(
             session,
             email=email,
             full_name=full_name,
@@ -101,104 +137,309 @@ class UserService:
 
         return user
 
-    def update(self, session: Session, user_id: UUID, **kwargs) -> User:
+    async def update(self, session: AsyncSession, user_id: UUID, **kwargs) -> User:
         """Update user data."""
-        user = user_db.get_by_id(session, user_id)
+        user = await user_db.get_by_id(session, user_id)
         if not user:
             raise UserNotFound(str(user_id))
 
         if "password" in kwargs:
-            kwargs["hashed_password"] = password_manager.get_hash(
+            await release_connection(session)
+            kwargs["hashed_password"] = await password_manager.get_hash_async(
                 kwargs.pop("password")
             )
 
-        return user_db.update(session, user, kwargs)
+        user_cache.invalidate(session, user.id)
+
+        return await user_db.update(session, user, kwargs)
 
-    def delete(self, session: Session, user_id: UUID) -> None:
+    async def delete(self, session: AsyncSession, user_id: UUID) -> None:
         """Delete a user."""
-        user = user_db.get_by_id(session, user_id)
+        user = await user_db.get_by_id(session, user_id)
         if not user:
             raise UserNotFound(str(user_id))
 
-        user_db.delete(session, user)
+        user_cache.invalidate(session, user.id)
+        token_revocation.revoke_user(session, user.id)
+
+        await user_db.delete(session, user)
+
+    async def list(
+        self,
+        session: AsyncSession,
+        *,
+        verified: Optional[bool] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> Page[UserSummary]:
+        """
+        List users newest first, one page at a time (for admins).
 
-    def verify_password(self, user: User, password: str) -> bool:
+        Raises:
+            InvalidValue: If the cursor is malformed
+        """
+        rows = await user_db.list(
+            session,
+            verified=verified,
+            created_from=created_from,
+            created_to=created_to,
+            after=decode_cursor(cursor),
+            limit=limit,
+        )
+        return to_page(rows, limit, _to_summary)
+
+    async def export(
+        self,
+        session: AsyncSession,
+        *,
+        verified: Optional[bool] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[UserSummary]]:
+        """Yield all matching users oldest first, one batch at a time (for admins)."""
+        async for rows in user_db.stream(
+            session,
+            verified=verified,
+            created_from=created_from,
+            created_to=created_to,
+            batch_size=batch_size,
+        ):
+            yield [_to_summary(row) for row in rows]
+
+    async def search(
+        self, session: AsyncSession, term: str, limit: int = 20
+    ) -> List[UserSummary]:
+        """
+        Find users by partial email or name, best match first (for admins).
+
+        Raises:
+            InvalidValue: If the term is too short
+        """
+        rows = await user_db.search(session, search_term(term), limit)
+        return [_to_summary(row) for row in rows]
+
+    async def purge_unverified(
+        self, session: AsyncSession, older_than: timedelta, batch_size: int
+    ) -> int:
+        """Delete one batch of stale unverified accounts; return the count."""
+        user_ids = await user_db.delete_unverified(
+            session, datetime.now() - older_than, batch_size
+        )
+        for user_id in user_ids:
+            user_cache.invalidate(session, user_id)
+        return len(user_ids)
+
+    async def verify_password(self, user: User, password: str) -> bool:
         """Verify user password."""
-        return password_manager.verify(password, user.hashed_password)
+        return await password_manager.verify_async(password, user.hashed_password)
 
-    def authenticate(self, session: Session, email: str, password: str) -> User:
-        """Authenticate user with email and password."""
-        user = user_db.get_by_email(session, email)
+    async def authenticate(
+        self, session: AsyncSession, email: str, password: str
+    ) -> User:
+        """
+        Authenticate user with email and password.
+
+        Upgrades the stored hash in place when it doesn't match the current
+        hashing policy (algorithm or cost).
+        """
+        user = await user_db.get_by_email(session, email)
         if not user:
             raise InvalidCredentials()
-        if not self.verify_password(user, password):
+        await release_connection(session)
+        if not await self.verify_password(user, password):
             raise InvalidCredentials()
 
+        if password_manager.needs_rehash(user.hashed_password):
+            user.hashed_password = await password_manager.get_hash_async(password)
+            await session.flush()
+
         return user
 
-    def change_password(
-        self, session: Session, user_id: UUID, old_password: str, new_password: str
+    async def refresh(
+        self, session: AsyncSession, refresh_token: str
+    ) -> Tuple[User, str, str]:
+        """
+        Rotate a refresh token and load the user it was issued to.
+
+        Returns:
+            Tuple of (user, session ID, new refresh token)
+        """
+        user_id, session_id, new_refresh_token = await rotate_refresh_token(
+            refresh_token
+        )
+        user = await user_db.get_by_id(session, user_id)
+        if not user:
+            raise UserNotFound(str(user_id))
+
+        return user, session_id, new_refresh_token
+
+    async def change_password(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+        old_password: str,
+        new_password: str,
+        keep_session_id: Optional[str] = None,
     ) -> User:
-        """Change user password after verifying old password."""
-        user = user_db.get_by_id(session, user_id)
+        """
+        Change user password after verifying old password.
+
+        Signs out every other session; ``keep_session_id`` stays signed in.
+        """
+        user = await user_db.get_by_id(session, user_id)
         if not user:
             raise UserNotFound(str(user_id))
-        if not self.verify_password(user, old_password):
+        await release_connection(session)
+        if not await self.verify_password(user, old_password):
             raise InvalidPasswordChange()
 
         # Update password on fetched user object
-        user.hashed_password = password_manager.get_hash(new_password)
+        user.hashed_password = await password_manager.get_hash_async(new_password)
         user.updated_at = datetime.now()
-        session.flush()
+        await session.flush()
+        token_revocation.revoke_user(session, user.id, keep_session_id)
 
         return user
 
-    def reset_password(
-        self, session: Session, user_id: UUID, new_password: str
+    async def reset_password(
+        self, session: AsyncSession, user_id: UUID, new_password: str
     ) -> User:
         """Reset user password without requiring old password (for forgot password flow)."""
-        user = user_db.get_by_id(session, user_id)
+        user = await user_db.get_by_id(session, user_id)
         if not user:
             raise UserNotFound(str(user_id))
 
         # Update password on fetched user object
-        user.hashed_password = password_manager.get_hash(new_password)
+        await release_connection(session)
+        user.hashed_password = await password_manager.get_hash_async(new_password)
         user.updated_at = datetime.now()
-        session.flush()
+        await session.flush()
+        token_revocation.revoke_user(session, user.id)
 
         return user
 
-    def update_profile_picture(
-        self, session: Session, user_id: UUID, profile_picture: str
+    async def update_profile_picture(
+        self, session: AsyncSession, user_id: UUID, profile_picture: str
     ) -> User:
-        """Update user profile picture with base64 data."""
-        user = user_db.get_by_id(session, user_id)
+        """
+        Store a profile picture (base64 data URI) and its thumbnails, and
+        point the user at it.
+
+        Raises:
+            UserNotFound: If the user doesn't exist
+            InvalidProfilePicture: If the data URI isn't a valid image, or its
+                data doesn't decode as an image of the declared type
+            ImageProcessingBusy: If too many pictures are being processed
+        """
+        parsed = parse_image_data_uri(profile_picture)
+        if parsed is None:
+            raise InvalidProfilePicture()
+        content_type, data = parsed
+
+        # Decode and resize without holding a connection
+        await release_connection(session)
+        thumbnails = await image_processor.thumbnails(data, content_type)
+        if thumbnails is None:
+            raise InvalidProfilePicture()
+
+        user = await user_db.get_by_id(session, user_id)
         if not user:
             raise UserNotFound(str(user_id))
 
-        # Update profile picture
-        user.profile_picture = profile_picture
+        # Store the picture once per content; the user keeps only its key
+        key = await blob_store.put(session, data, content_type)
+        await blob_store.put_variants(
+            session,
+            key,
+            {
+                thumbnail_variant(size): (thumbnail, THUMBNAIL_CONTENT_TYPE)
+                for size, thumbnail in thumbnails.items()
+            },
+        )
+        user.profile_picture_hash = key
         user.updated_at = datetime.now()
-        session.flush()
+        await session.flush()
 
         return user
 
-    def remove_profile_picture(self, session: Session, user_id: UUID) -> User:
-        """Remove user profile picture."""
-        user = user_db.get_by_id(session, user_id)
+    async def remove_profile_picture(
+        self, session: AsyncSession, user_id: UUID
+    ) -> User:
+        """Remove user profile picture (the blob is purged once unused)."""
+        user = await user_db.get_by_id(session, user_id)
         if not user:
             raise UserNotFound(str(user_id))
 
         # Remove profile picture
-        user.profile_picture = None
+        user.profile_picture_hash = None
         user.updated_at = datetime.now()
-        session.flush()
+        await session.flush()
 
         return user
 
-    def verify_signup(self, session: Session, user_id: UUID, signup_token: str) -> User:
+    async def check_profile_picture(
+        self, session: AsyncSession, user_id: UUID, key: str
+    ) -> None:
+        """
+        Check that a blob key is the user's current profile picture (without
+        loading it).
+
+        Raises:
+            ProfilePictureNotFound: If it isn't the user's current picture
+        """
+        if not await user_db.has_profile_picture(session, user_id, key):
+            # A replica may not have a picture uploaded moments ago yet
+            use_primary(session)
+            if not await user_db.has_profile_picture(session, user_id, key):
+                raise ProfilePictureNotFound()
+
+    async def get_profile_picture(
+        self, session: AsyncSession, user_id: UUID, key: str, size: Optional[int] = None
+    ) -> Blob:
+        """
+        Get a user's profile picture by its blob key, or its thumbnail of
+        ``size`` px (the picture itself if it was stored before thumbnails).
+
+        Raises:
+            InvalidValue: If there are no thumbnails of that size
+            ProfilePictureNotFound: If it isn't the user's current picture
+        """
+        if size is not None and size not in THUMBNAIL_SIZES:
+            raise InvalidValue("Unsupported thumbnail size")
+
+        await self.check_profile_picture(session, user_id, key)
+
+        if size is not None:
+            thumbnail = await blob_store.get(
+                session, variant_key(key, thumbnail_variant(size))
+            )
+            if thumbnail:
+                return thumbnail
+
+        picture = await blob_store.get(session, key)
+        if not picture:
+            raise ProfilePictureNotFound()
+        return picture
+
+    async def purge_profile_pictures(
+        self, session: AsyncSession, unused_for: timedelta, batch_size: int
+    ) -> int:
+        """Delete one batch of long-unused pictures; return the count."""
+        return await blob_store.delete_unreferenced(
+            session,
+            User.profile_picture_hash,
+            datetime.now() - unused_for,
+            batch_size,
+        )
+
+    async def verify_signup(
+        self, session: AsyncSession, user_id: UUID, signup_token: str
+    ) -> User:
         """Verify user signup with user_id and 6-digit signup token."""
-        user = user_db.get_by_id(session, user_id)
+        user = await user_db.get_by_id(session, user_id)
         if not user:
             raise UserNotFound(str(user_id))
         if user.signup_verified:
@@ -210,7 +451,8 @@ class UserService:
         user.signup_token = None
         user.signup_verified = datetime.now()
         user.updated_at = datetime.now()
-        session.flush()
+        await session.flush()
+        user_cache.invalidate(session, user.id)
 
         return user
 
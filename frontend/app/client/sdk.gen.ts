@@ -324,9 +324,11 @@ export class UsersService {
     /**
      * Verify Signup
      * Verify current user's signup with 6-digit verification code.
+     *
+     * Returns new tokens, as claims-only access tokens carry the verified flag.
      * @param data The data for the request.
      * @param data.requestBody
-     * @returns UserPublic Successful Response
+     * @returns Auth Successful Response
      * @throws ApiError
      */
     public static verifySignupApiV1UserVerifySignupPost(data: VerifySignupApiV1UserVerifySignupPostData): CancelablePromise<VerifySignupApiV1UserVerifySignupPostResponse> {
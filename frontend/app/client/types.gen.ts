@@ -174,7 +174,7 @@ export type VerifySignupApiV1UserVerifySignupPostData = {
     requestBody: VerifySignupRequest;
 };
 
-export type VerifySignupApiV1UserVerifySignupPostResponse = (UserPublic);
+export type VerifySignupApiV1UserVerifySignupPostResponse = (Auth);
 
 export type LoginApiV1UserLoginPostData = {
     requestBody: LoginRequest;
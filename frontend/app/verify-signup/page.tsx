@@ -13,6 +13,7 @@ import { useUser } from "@/contexts/user-context";
 import { usePageTitle } from "@/hooks/use-page-title";
 import { useToast } from "@/hooks/use-toast";
 import { handleError } from "@/lib/error";
+import { saveToken } from "@/lib/token";
 import { ERROR_MESSAGES, isValid6DigitCode } from "@/lib/validation";
 
 export default function VerifySignupPage() {
@@ -50,15 +51,18 @@ export default function VerifySignupPage() {
     setLoading(true);
 
     try {
-      const verifiedUser =
+      const response =
         await UsersService.verifySignupApiV1UserVerifySignupPost({
           requestBody: {
             signup_token: codeToVerify,
           },
         });
 
+      // Save the new JWT token (carrying the verified claim)
+      saveToken(response.access_token);
+
       // Update user context with verified user
-      setUser(verifiedUser);
+      setUser(response.user);
 
       // Redirect to dashboard
       router.push("/dashboard");
@@ -17,11 +17,21 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
+from backend.core.cache import user_cache
 from backend.core.config import settings
+from backend.core.database import dispose_engines
 from backend.core.exceptions import AppException
+from backend.core.images import image_processor
 from backend.core.logging import setup_logging
+from backend.core.maintenance import maintenance_scheduler
 from backend.core.middleware import setup_middleware
+from backend.core.password import password_manager
 from backend.core.rate_limit import close_rate_limiter, init_rate_limiter
+from backend.core.recent_writes import recent_writes
+from backend.core.redis_client import close_redis
+from backend.core.revocation import token_revocation
+from backend.core.warmup import warmup
+from backend.modules.jwks import router as jwks_router
 from backend.modules.registry import get_api_router
 from frontend_routes import router as frontend_router
 
@@ -36,8 +46,24 @@ async def lifespan(app: FastAPI):
     Handles startup and shutdown events.
     """
     await init_rate_limiter()
+    password_manager.start()
+    image_processor.start()
+    await user_cache.start()
+    await token_revocation.start()
+    await recent_writes.start()
+    await warmup.start()
+    await maintenance_scheduler.start()
     yield
+    await maintenance_scheduler.stop()
+    await warmup.stop()
+    await recent_writes.stop()
+    await token_revocation.stop()
+    await user_cache.stop()
+    image_processor.stop()
+    password_manager.stop()
     await close_rate_limiter()
+    await close_redis()
+    await dispose_engines()
 
 
 # Initialize FastAPI app
@@ -71,6 +97,9 @@ setup_middleware(app)
 api_router = get_api_router()
 app.include_router(api_router, prefix=settings.API_PREFIX)
 
+# Include JWKS router (served at the root, outside the API prefix)
+app.include_router(jwks_router)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -0,0 +1,39 @@
+"""
+Test suite.
+Settings are read from the environment when ``backend`` is first imported,
+so the values the tests don't care about get defaults here, before any test
+module (or conftest) imports the app.
+"""
+
+import os
+
+TEST_ENV = {
+    "APP_NAME": "Sample Project",
+    "APP_VERSION": "test",
+    "APP_PUBLIC_URL": "http://localhost:8000",
+    "ENABLE_USER_EMAILS": "false",
+    "API_PREFIX": "/api/v1",
+    "CORS_ORIGINS": "http://localhost:3000",
+    "CORS_ALLOW_HEADERS": "*",
+    "CORS_ALLOW_METHODS": "GET,POST,PUT,DELETE,OPTIONS",
+    "CORS_ALLOW_CREDENTIALS": "true",
+    "JWT_ALGORITHM": "HS256",
+    "JWT_SECRET_KEY": "test-secret-key-of-at-least-32-bytes",
+    "JWT_EXPIRE_MINUTES_DELTA": "30",
+    "SENDGRID_VERIFY_SSL": "true",
+    "SENDGRID_API_KEY": "test",
+    "SENDGRID_FROM_EMAIL": "test@example.com",
+    "PASSWORD_RESET_TOKEN_EXPIRY_HOURS": "1",
+    "POSTGRES_SERVER": "localhost",
+    "POSTGRES_PORT": "5432",
+    "POSTGRES_DB": "test",
+    "POSTGRES_USER": "test",
+    "POSTGRES_PASSWORD": "test",
+    "REDIS_URL": "redis://localhost:6379/0",
+    # Cheap hashes, and an auth lookup on every request (no cache hits)
+    "PASSWORD_BCRYPT_ROUNDS": "4",
+    "USER_CACHE_ENABLED": "false",
+}
+
+for key, value in TEST_ENV.items():
+    os.environ.setdefault(key, value)
@@ -0,0 +1,125 @@
+"""
+Shared test fixtures.
+Runs the API against a fresh SQLite database and an in-memory Redis per
+test, so tests need no running services.
+"""
+
+from contextlib import asynccontextmanager
+from typing import Callable, Iterator
+
+import pytest
+from fakeredis import FakeAsyncRedis, FakeServer
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from fastapi_limiter import FastAPILimiter
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from backend.core import database, redis_client
+from backend.core.config import settings
+from backend.core.exceptions import AppException
+from backend.core.images import image_processor
+from backend.core.metrics import metrics
+from backend.core.middleware import RequestLoggingMiddleware
+from backend.core.password import password_manager
+from backend.models import User
+from backend.modules.registry import get_api_router
+
+from .utils import API, PASSWORD, bearer
+
+
+@pytest.fixture(scope="session", autouse=True)
+def worker_pools() -> Iterator[None]:
+    """Share the hashing and image process pools across tests."""
+    yield
+    password_manager.stop()
+    image_processor.stop()
+
+
+@pytest.fixture(autouse=True)
+def within_statement_budgets() -> Iterator[None]:
+    """Fail any test in which an endpoint exceeds its ``statement_budget``."""
+    exceeded = metrics.counter("sql.statement_budget_exceeded")
+    before = exceeded.value
+    yield
+    assert exceeded.value == before, "An endpoint exceeded its statement budget"
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch) -> Iterator[Engine]:
+    """A fresh SQLite database used by the app; yields a sync engine on it."""
+    path = tmp_path / "test.db"
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine)
+
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}", poolclass=NullPool
+    )
+    monkeypatch.setattr(database, "async_engine", async_engine)
+    monkeypatch.setattr(database, "read_only_engine", async_engine.sync_engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def redis(monkeypatch) -> FakeAsyncRedis:
+    """An empty in-memory Redis used by the app."""
+    client = FakeAsyncRedis(server=FakeServer(), decode_responses=True)
+    monkeypatch.setattr(redis_client, "_client", client)
+    return client
+
+
+@pytest.fixture
+def client(db, redis) -> Iterator[TestClient]:
+    """Client of an app serving the API routers."""
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        await FastAPILimiter.init(redis)
+        yield
+
+    app = FastAPI(lifespan=lifespan)
+
+    @app.exception_handler(AppException)
+    async def app_exception_handler(request: Request, exc: AppException):
+        return JSONResponse(
+            status_code=exc.status_code, content={"detail": exc.message}
+        )
+
+    app.add_middleware(RequestLoggingMiddleware)
+    app.include_router(get_api_router(), prefix=settings.API_PREFIX)
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def signup(client, db) -> Callable[..., dict]:
+    """Sign up a user; returns the response body plus its signup token."""
+
+    def signup(email: str = "user@example.com", verify: bool = False) -> dict:
+        response = client.post(
+            f"{API}/user/signup",
+            json={"email": email, "password": PASSWORD, "full_name": "Test User"},
+        )
+        assert response.status_code == 200, response.text
+        auth = response.json()
+
+        with Session(db) as session:
+            user = session.exec(select(User).where(User.email == email)).one()
+        auth["signup_token"] = user.signup_token
+
+        if verify:
+            response = client.post(
+                f"{API}/user/verify-signup",
+                json={"signup_token": user.signup_token},
+                headers=bearer(auth["access_token"]),
+            )
+            assert response.status_code == 200, response.text
+            auth.update(response.json())
+        return auth
+
+    return signup
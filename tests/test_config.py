@@ -0,0 +1,26 @@
+"""
+Tests for settings validation.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from backend.core.config import Settings
+
+
+@pytest.mark.parametrize(
+    "override",
+    [
+        {"PASSWORD_HASH_ALGORITHM": "argon2"},
+        {"PASSWORD_BCRYPT_ROUNDS": 3},
+        {"PASSWORD_BCRYPT_ROUNDS": 32},
+    ],
+)
+def test_invalid_password_hashing_settings_are_rejected(override):
+    with pytest.raises(ValidationError):
+        Settings(**override)
+
+
+def test_valid_password_hashing_settings_are_accepted():
+    settings = Settings(PASSWORD_HASH_ALGORITHM="argon2id", PASSWORD_BCRYPT_ROUNDS=12)
+    assert settings.PASSWORD_HASH_ALGORITHM == "argon2id"
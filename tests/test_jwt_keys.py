@@ -0,0 +1,61 @@
+"""
+Tests for JWT signing key rotation.
+"""
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ed25519
+from cryptography.hazmat.primitives.serialization import (
+    Encoding,
+    NoEncryption,
+    PrivateFormat,
+)
+
+from backend.core.config import settings
+from backend.core.jwt_keys import KeyRing
+
+
+def write_key(path) -> bytes:
+    """Write a new Ed25519 private key; return its raw public key."""
+    key = ed25519.Ed25519PrivateKey.generate()
+    path.write_bytes(
+        key.private_bytes(Encoding.PEM, PrivateFormat.PKCS8, NoEncryption())
+    )
+    return key.public_key().public_bytes_raw()
+
+
+@pytest.fixture
+def keys_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "JWT_ALGORITHM", "EdDSA")
+    monkeypatch.setattr(settings, "JWT_KEYS_DIR", str(tmp_path / "keys"))
+    monkeypatch.setattr(settings, "JWT_ACTIVE_KID", "current")
+    monkeypatch.setattr(settings, "JWT_KEYS_RELOAD_SECONDS", 0)
+    (tmp_path / "keys").mkdir()
+    return tmp_path / "keys"
+
+
+def test_key_replaced_in_place_is_reloaded(keys_dir):
+    path = keys_dir / "current.pem"
+    write_key(path)
+    key_ring = KeyRing()
+    key_ring.active
+
+    dir_mtime = keys_dir.stat().st_mtime_ns
+    replaced = write_key(path)
+    assert keys_dir.stat().st_mtime_ns == dir_mtime
+
+    assert key_ring.active.public_key.public_bytes_raw() == replaced
+
+
+def test_failed_reload_keeps_loaded_keys(keys_dir):
+    public_key = write_key(keys_dir / "current.pem")
+    key_ring = KeyRing()
+    key_ring.active
+
+    (keys_dir / "current.pem").write_text("not a key")
+
+    assert key_ring.active.public_key.public_bytes_raw() == public_key
+
+
+def test_first_load_failure_is_raised(keys_dir):
+    with pytest.raises(ValueError):
+        KeyRing().active
@@ -0,0 +1,98 @@
+"""
+Tests for profile picture upload and serving.
+"""
+
+import base64
+import io
+
+from PIL import Image
+from sqlmodel import Session, func, select
+
+from backend.models import Blob
+
+from .utils import API, bearer, image_data_uri, statements
+
+
+def upload(client, token: str, profile_picture: str):
+    return client.post(
+        f"{API}/user/profile-picture",
+        json={"profile_picture": profile_picture},
+        headers=bearer(token),
+    )
+
+
+def blob_count(db) -> int:
+    with Session(db) as session:
+        return session.exec(select(func.count()).select_from(Blob)).one()
+
+
+def test_upload_makes_webp_thumbnails(client, signup):
+    token = signup(verify=True)["access_token"]
+
+    response = upload(client, token, image_data_uri())
+    assert response.status_code == 200
+    thumbnails = response.json()["profile_picture_thumbnails"]
+    assert set(thumbnails) == {"64", "128", "256"}
+
+    response = client.get(thumbnails["128"])
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/webp"
+    with Image.open(io.BytesIO(response.content)) as image:
+        assert (image.format, image.size) == ("WEBP", (128, 128))
+
+
+def test_upload_rejects_data_that_is_not_an_image(client, signup, db):
+    token = signup(verify=True)["access_token"]
+    junk = base64.b64encode(b"\x89PNG\r\n\x1a\n" + b"not an image" * 10).decode()
+
+    response = upload(client, token, f"data:image/png;base64,{junk}")
+    assert response.status_code == 400
+    assert blob_count(db) == 0
+
+
+def test_upload_rejects_image_of_another_type_than_declared(client, signup, db):
+    token = signup(verify=True)["access_token"]
+    jpeg = image_data_uri("JPEG").split(",", 1)[1]
+
+    response = upload(client, token, f"data:image/png;base64,{jpeg}")
+    assert response.status_code == 400
+    assert blob_count(db) == 0
+
+
+def test_revalidation_of_current_picture_gets_304_without_loading_it(client, signup):
+    token = signup(verify=True)["access_token"]
+    url = upload(client, token, image_data_uri()).json()["profile_picture"]
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert "immutable" in response.headers["cache-control"]
+    etag = response.headers["etag"]
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    # Only the ownership check, not the picture itself
+    assert statements(response) == 1
+
+
+def test_revalidation_of_removed_picture_gets_404(client, signup):
+    token = signup(verify=True)["access_token"]
+    url = upload(client, token, image_data_uri()).json()["profile_picture"]
+    etag = client.get(url).headers["etag"]
+
+    response = client.delete(f"{API}/user/profile-picture", headers=bearer(token))
+    assert response.status_code == 200
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 404
+
+
+def test_revalidation_of_deleted_users_picture_gets_404(client, signup):
+    token = signup(verify=True)["access_token"]
+    url = upload(client, token, image_data_uri()).json()["profile_picture"]
+    etag = client.get(url).headers["etag"]
+
+    response = client.delete(f"{API}/user/", headers=bearer(token))
+    assert response.status_code == 200
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 404
@@ -0,0 +1,21 @@
+"""
+Tests for token revocation.
+"""
+
+import time
+
+from backend.core import revocation
+from backend.core.revocation import Revocation, TokenRevocation
+
+
+def test_expired_cutoffs_are_pruned(monkeypatch):
+    tokens = TokenRevocation()
+    expired = time.time() - tokens.max_token_lifetime - 1
+    tokens.apply([Revocation("old", expired)])
+
+    monkeypatch.setattr(revocation, "PRUNE_INTERVAL_SECONDS", 0)
+    tokens.apply([Revocation("new", time.time())])
+
+    assert tokens.stats()["users"] == 1
+    assert not tokens.is_revoked({"sub": "old", "iat": expired - 1})
+    assert tokens.is_revoked({"sub": "new", "iat": time.time() - 1})
@@ -0,0 +1,82 @@
+"""
+Tests for the admin search.
+SQLite has no ``pg_trgm``, so ``word_similarity`` and ``greatest`` are
+registered as Python functions (word similarity approximated per word).
+"""
+
+import re
+
+import pytest
+from sqlalchemy import event, update
+from sqlmodel import Session
+
+from backend.core import database
+from backend.models import User
+
+from .utils import API, bearer
+
+
+def _trigrams(word: str) -> set:
+    padded = f"  {word.lower()} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _word_similarity(term: str, text: str) -> float:
+    wanted = _trigrams(term)
+    return max(
+        (
+            len(wanted & _trigrams(word)) / len(wanted | _trigrams(word))
+            for word in re.findall(r"\w+", text or "")
+        ),
+        default=0.0,
+    )
+
+
+@pytest.fixture
+def admin(client, db, signup) -> dict:
+    """Authorization header of a verified admin."""
+    auth = signup("admin@example.com", verify=True)
+    with Session(db) as session:
+        session.exec(
+            update(User).where(User.email == "admin@example.com").values(is_admin=True)
+        )
+        session.commit()
+
+    @event.listens_for(database.async_engine.sync_engine, "connect")
+    def register_functions(connection, _):
+        connection.create_function("word_similarity", 2, _word_similarity)
+        connection.create_function("greatest", -1, max)
+
+    return bearer(auth["access_token"])
+
+
+def add_users(db, *full_names: str) -> None:
+    """Insert users with the given names (and emails that don't match)."""
+    with Session(db) as session:
+        session.add_all(
+            User(email=f"u{i}@example.com", full_name=name, hashed_password="-")
+            for i, name in enumerate(full_names)
+        )
+        session.commit()
+
+
+def search(client, admin, q: str) -> list:
+    response = client.get(f"{API}/admin/users/search", params={"q": q}, headers=admin)
+    assert response.status_code == 200, response.text
+    return [user["full_name"] for user in response.json()]
+
+
+def test_search_ranks_closest_word_first(client, db, admin):
+    add_users(db, "Joanna Brown", "Anna Smith", "Hannah Jones", "Bob Stone")
+
+    assert search(client, admin, "anna") == [
+        "Anna Smith",
+        "Joanna Brown",
+        "Hannah Jones",
+    ]
+
+
+def test_search_ranks_every_match_of_a_common_term(client, db, admin):
+    add_users(db, *["Annabelle Wright"] * 1500, "Anna Smith")
+
+    assert search(client, admin, "anna")[0] == "Anna Smith"
@@ -0,0 +1,130 @@
+"""
+Exact statement counts of the hot endpoints.
+Counts come from the ``X-DB-Statements`` header and include the auth user
+lookup (the user cache is off in tests). A change here means an endpoint
+gained or lost a query: update its ``statement_budget`` with it.
+"""
+
+from urllib.parse import parse_qs, urlparse
+
+import pyotp
+
+from .utils import API, PASSWORD, bearer, image_data_uri, statements
+
+
+def enable_2fa(client, token: str) -> pyotp.TOTP:
+    """Turn on 2FA for the user of a token; returns their TOTP generator."""
+    url = client.get(f"{API}/two_fa/setup", headers=bearer(token)).json()["url"]
+    totp = pyotp.TOTP(parse_qs(urlparse(url).query)["secret"][0])
+    response = client.post(
+        f"{API}/two_fa/verify", json={"totp": totp.now()}, headers=bearer(token)
+    )
+    assert response.status_code == 200
+    return totp
+
+
+def test_signup(client):
+    response = client.post(
+        f"{API}/user/signup",
+        json={
+            "email": "new@example.com",
+            "password": PASSWORD,
+            "full_name": "New User",
+        },
+    )
+    assert response.status_code == 200
+    # Email check, user insert, 2FA settings insert
+    assert statements(response) == 3
+
+
+def test_verify_signup(client, signup):
+    auth = signup()
+
+    response = client.post(
+        f"{API}/user/verify-signup",
+        json={"signup_token": auth["signup_token"]},
+        headers=bearer(auth["access_token"]),
+    )
+    assert response.status_code == 200
+    # Auth lookup, user load, update (no reload after commit)
+    assert statements(response) == 3
+
+
+def test_update(client, signup):
+    token = signup(verify=True)["access_token"]
+
+    response = client.put(
+        f"{API}/user/", json={"full_name": "Other Name"}, headers=bearer(token)
+    )
+    assert response.status_code == 200
+    # Auth lookup, user load, update
+    assert statements(response) == 3
+
+
+def test_update_profile_picture(client, signup):
+    token = signup(verify=True)["access_token"]
+
+    response = client.post(
+        f"{API}/user/profile-picture",
+        json={"profile_picture": image_data_uri()},
+        headers=bearer(token),
+    )
+    assert response.status_code == 200
+    # Auth lookup, user load, picture upsert, thumbnails upsert, update
+    assert statements(response) == 5
+
+
+def test_remove_profile_picture(client, signup):
+    token = signup(verify=True)["access_token"]
+
+    response = client.delete(f"{API}/user/profile-picture", headers=bearer(token))
+    assert response.status_code == 200
+    # Auth lookup, user load, update
+    assert statements(response) == 3
+
+
+# User loads join the 2FA settings, so each needs a single query
+
+
+def test_login(client, signup):
+    auth = signup(verify=True)
+    enable_2fa(client, auth["access_token"])
+
+    response = client.post(
+        f"{API}/user/login",
+        json={"email": auth["user"]["email"], "password": PASSWORD},
+    )
+    assert response.status_code == 200
+    assert response.json()["user"]["pending_2fa"] is True
+    # User with 2FA settings
+    assert statements(response) == 1
+
+
+def test_me(client, signup):
+    auth = signup(verify=True)
+    enable_2fa(client, auth["access_token"])
+
+    response = client.get(f"{API}/user/me", headers=bearer(auth["access_token"]))
+    assert response.status_code == 200
+    assert response.json()["two_fa_enabled"] is True
+    # Auth lookup, user with 2FA settings
+    assert statements(response) == 2
+
+
+def test_verify_code(client, signup):
+    auth = signup(verify=True)
+    totp = enable_2fa(client, auth["access_token"])
+    login = client.post(
+        f"{API}/user/login",
+        json={"email": auth["user"]["email"], "password": PASSWORD},
+    ).json()
+
+    response = client.post(
+        f"{API}/two_fa/verify-code",
+        json={"totp": totp.now()},
+        headers=bearer(login["access_token"]),
+    )
+    assert response.status_code == 200
+    assert response.json()["user"]["two_fa_enabled"] is True
+    # Auth lookup, user with 2FA settings
+    assert statements(response) == 2
@@ -0,0 +1,24 @@
+"""
+Tests for TOTP verification.
+"""
+
+import pyotp
+
+from backend.lib.totp import totp_service
+
+
+def test_code_with_leading_zero_is_accepted():
+    # About 1 secret in 10 has a current code starting with 0
+    secret = totp_service.generate_secret()
+    while not pyotp.TOTP(secret).now().startswith("0"):
+        secret = totp_service.generate_secret()
+
+    assert totp_service.verify(secret, pyotp.TOTP(secret).now())
+
+
+def test_wrong_code_is_rejected():
+    secret = totp_service.generate_secret()
+    code = pyotp.TOTP(secret).now()
+    wrong = f"{(int(code) + 500000) % 1000000:06d}"
+
+    assert not totp_service.verify(secret, wrong)
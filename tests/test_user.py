@@ -0,0 +1,40 @@
+"""
+Tests for the user endpoints.
+"""
+
+from backend.core.config import settings
+
+from .utils import API, bearer
+
+
+def test_verify_signup_in_claims_only_mode_authorizes_verified_routes(
+    client, signup, monkeypatch
+):
+    monkeypatch.setattr(settings, "AUTH_CLAIMS_ONLY", True)
+    auth = signup()
+
+    # The signup token says the user isn't verified yet
+    response = client.put(
+        f"{API}/user/",
+        json={"full_name": "New Name"},
+        headers=bearer(auth["access_token"]),
+    )
+    assert response.status_code == 403
+
+    response = client.post(
+        f"{API}/user/verify-signup",
+        json={"signup_token": auth["signup_token"]},
+        headers=bearer(auth["access_token"]),
+    )
+    assert response.status_code == 200
+    verified = response.json()
+    assert verified["user"]["signup_verified"] is not None
+    assert verified["refresh_token"]
+
+    response = client.put(
+        f"{API}/user/",
+        json={"full_name": "New Name"},
+        headers=bearer(verified["access_token"]),
+    )
+    assert response.status_code == 200
+    assert response.json()["full_name"] == "New Name"
@@ -0,0 +1,34 @@
+"""
+Test helpers.
+"""
+
+import base64
+import io
+from typing import Tuple
+
+from httpx import Response
+from PIL import Image
+
+from backend.core.config import settings
+
+API = settings.API_PREFIX
+
+PASSWORD = "Password123!"
+
+
+def bearer(token: str) -> dict:
+    """Authorization header for an access token."""
+    return {"Authorization": f"Bearer {token}"}
+
+
+def statements(response: Response) -> int:
+    """Statements the request sent to the database (auth lookup included)."""
+    return int(response.headers["X-DB-Statements"])
+
+
+def image_data_uri(format: str = "PNG", size: Tuple[int, int] = (300, 200)) -> str:
+    """Data URI of a generated image."""
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (200, 40, 40)).save(buffer, format)
+    encoded = base64.b64encode(buffer.getvalue()).decode()
+    return f"data:{Image.MIME[format]};base64,{encoded}"